@@ -0,0 +1,184 @@
+# 로컬 모의 서버(mock_board_server.py)를 상대로 크롤링 속도와 메모리를 재는 스크립트
+# 사용법:
+#   python bench_crawler.py                                  페이지 모드, 날짜 모드 모두 측정
+#   python bench_crawler.py --pages 100 --days 10 --workers 8 --latency 0.05 --error-rate 0.01
+#   python bench_crawler.py --save before.json               결과 저장
+#   python bench_crawler.py --compare before.json            저장한 결과와 비교 (회귀 확인)
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+import crawler_core
+import crawler_settings as settings
+import inven_http
+import rate_limiter
+from row_extractor import default_backend, extract_rows
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mock_board_server.py")
+BOARD_PATH = "/board/lostark/5340"
+
+
+class BenchReporter:
+    # 페이지 수와 누적 글 수만 기록 (로그는 출력하지 않음)
+    def __init__(self):
+        self.pages = 0
+        self.rows = 0
+
+    def log(self, text):
+        pass
+
+    def report_page(self, page, emoji_count, total_count, job_name=None):
+        self.pages += 1
+        self.rows = total_count
+
+    def report_dates(self, date_counts, job_name=None):
+        pass
+
+    def is_cancelled(self):
+        return False
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args):
+    # 서버를 다른 프로세스에서 실행해 크롤러와 GIL을 나눠 쓰지 않도록 함
+    port = free_port()
+    process = subprocess.Popen([
+        sys.executable, SERVER_SCRIPT, "--port", str(port),
+        "--latency", str(args.latency), "--jitter", str(args.jitter),
+        "--error-rate", str(args.error_rate), "--posts-per-day", str(args.posts_per_day),
+    ] + (["--max-rate", str(args.server_max_rate)] if args.server_max_rate else []), stdout=subprocess.DEVNULL)
+
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("모의 서버가 시작되지 않았습니다.")
+
+
+def parse_ms_per_page(html, repeat=20):
+    backend = default_backend()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        extract_rows(html, backend)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run_once(mode, job_board_url, args):
+    # 매번 빈 저장소에서 시작 (날짜 모드가 이전 실행의 기준 글 번호를 보고 멈추지 않도록)
+    reporter = BenchReporter()
+    with tempfile.TemporaryDirectory() as data_dir:
+        settings.DATA_DIR = data_dir
+        tracemalloc.start()
+        start = time.perf_counter()
+        if mode == "pages":
+            crawler_core.crawl_by_pages(job_board_url, args.pages, reporter)
+        else:
+            since = (date.today() - timedelta(days=args.days)).strftime("%Y-%m-%d")
+            crawler_core.crawl_by_date(job_board_url, since, reporter)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        "pages": reporter.pages,
+        "rows": reporter.rows,
+        "seconds": elapsed,
+        "pages_per_sec": reporter.pages / elapsed,
+        "rows_per_sec": reporter.rows / elapsed,
+        "peak_mib": peak / 1024 / 1024,
+    }
+
+
+def print_result(mode, result, previous=None):
+    line = (f"{mode:6s} {result['pages']:5d}페이지 {result['rows']:7d}글 {result['seconds']:7.2f}초 | "
+            f"{result['pages_per_sec']:7.1f} 페이지/s {result['rows_per_sec']:9.1f} 글/s | "
+            f"파싱 {result['parse_ms']:6.2f} ms/페이지 | 메모리 최대 {result['peak_mib']:6.1f} MiB")
+    if previous:
+        change = (result["pages_per_sec"] / previous["pages_per_sec"] - 1) * 100
+        line += f" | 이전 대비 {change:+.1f}%"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모의 서버를 상대로 한 크롤러 벤치마크")
+    parser.add_argument("--mode", choices=("pages", "date", "all"), default="all")
+    parser.add_argument("--pages", type=int, default=100, help="페이지 모드에서 읽을 페이지 수")
+    parser.add_argument("--days", type=int, default=10, help="날짜 모드에서 거슬러 올라갈 일 수")
+    parser.add_argument("--posts-per-day", type=int, default=300)
+    parser.add_argument("--workers", type=int, help="동시에 요청할 페이지 수")
+    parser.add_argument("--parse-processes", type=int, help="파싱 프로세스 수")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--server-max-rate", type=float, help="모의 서버가 429로 응답하기 시작하는 초당 요청 수")
+    parser.add_argument("--rate", type=float, help="크롤러의 초당 요청 수 제한 (기본값: 제한 없음)")
+    parser.add_argument("--boundary-search", action="store_true", help="날짜 모드에서 경계 페이지를 먼저 찾음")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (가장 빠른 결과를 사용)")
+    parser.add_argument("--save", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args()
+
+    overrides = {
+        "RETRY_BACKOFF": 0.05,  # 모의 서버의 503은 짧게 기다렸다 재시도
+        "HTTP_CACHE_ENABLED": False,  # 매번 네트워크에서 받는 속도를 잼
+        "DEFAULT_HOST_LIMIT": dict(settings.DEFAULT_HOST_LIMIT, rate=args.rate, burst=max(1, int(args.rate or 1))),
+    }
+    if args.workers:
+        overrides["MAX_CONNECTIONS_PER_HOST"] = args.workers
+    if args.parse_processes is not None:
+        overrides["PARSE_PROCESSES"] = args.parse_processes
+        overrides["SWEEP_PARSE_PROCESSES"] = args.parse_processes
+    if args.boundary_search:
+        overrides["DATE_BOUNDARY_SEARCH"] = True
+    inven_http.configure(**overrides)
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            previous = json.load(file)["results"]
+
+    process, base_url = start_server(args)
+    job_board_url = base_url + BOARD_PATH
+    modes = ("pages", "date") if args.mode == "all" else (args.mode,)
+    results = {}
+    try:
+        html = inven_http.get(f"{job_board_url}?p=1").text
+        parse_ms = parse_ms_per_page(html)
+        print(f"서버 {base_url} | 지연 {args.latency}s | 오류율 {args.error_rate} | "
+              f"동시 요청 {settings.MAX_CONNECTIONS_PER_HOST} | 파서 {default_backend()} | "
+              f"파싱 프로세스 {settings.PARSE_PROCESSES}")
+        for mode in modes:
+            runs = [run_once(mode, job_board_url, args) for _ in range(args.repeat)]
+            best = min(runs, key=lambda run: run["seconds"])
+            best["parse_ms"] = parse_ms
+            results[mode] = best
+            print_result(mode, best, previous.get(mode))
+        for host, stats in rate_limiter.snapshots().items():
+            print(f"{host}: 요청 {stats['requests']} | 429 {stats['throttled']} | 오류 {stats['errors']} | "
+                  f"동시 요청 {stats['concurrency']}")
+    finally:
+        process.terminate()
+        process.wait()
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump({"args": vars(args), "results": results}, file, ensure_ascii=False, indent=2)
+        print(f"저장되었습니다: {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# 저장해 둔 게시판 페이지(fixtures/*.html)로 파서별 속도를 비교하는 스크립트
+# 사용법: python bench_parse.py [반복 횟수]
+import glob
+import os
+import sys
+import time
+from row_extractor import available_backends, extract_rows
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def load_fixtures():
+    pages = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "board_*.html"))):
+        with open(path, encoding="utf-8") as file:
+            pages[os.path.basename(path)] = file.read()
+    return pages
+
+
+def bench(backend, pages, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages.values():
+            extract_rows(html, backend)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(pages)) * 1000  # 페이지당 ms
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    pages = load_fixtures()
+    backends = available_backends()
+
+    # 모든 파서가 같은 결과를 내는지 먼저 확인
+    expected = {name: extract_rows(html, "html.parser") for name, html in pages.items()}
+    for backend in backends:
+        for name, html in pages.items():
+            if extract_rows(html, backend) != expected[name]:
+                print(f"[경고] {backend} 파서 결과가 html.parser와 다릅니다: {name}")
+
+    rows = sum(len(page_rows) for page_rows in expected.values())
+    print(f"페이지 {len(pages)}개, 게시글 {rows}개, {repeat}회 반복")
+    baseline = None
+    for backend in reversed(backends):
+        ms = bench(backend, pages, repeat)
+        baseline = baseline or ms
+        print(f"{backend:12s} {ms:8.2f} ms/페이지  (html.parser 대비 {baseline / ms:5.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# 날짜 앱(로아인벤클래스지표)을 실행해서 창이 뜰 때까지 걸리는 시간을 재는 스크립트
+# 사용법:
+#   python bench_startup.py                                  소스로 실행 (python 로아인벤클래스지표.py)
+#   python bench_startup.py --exe dist/로아인벤클래스지표/로아인벤클래스지표.exe   PyInstaller 빌드 실행 파일
+#   python bench_startup.py --imports 20                     시작할 때 불러오는 모듈 중 느린 20개 (python -X importtime)
+#   python bench_startup.py --limit 1.0                      중앙값이 1초를 넘으면 실패 (회귀 확인)
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "로아인벤클래스지표.py")
+
+
+def run_once(command, workdir):
+    # 앱은 CRAWLER_STARTUP_FILE이 있으면 창을 그린 시각을 이 파일에 쓰고 바로 종료함
+    startup_file = os.path.join(workdir, "startup.txt")
+    if os.path.exists(startup_file):
+        os.remove(startup_file)
+    env = dict(os.environ, CRAWLER_STARTUP_FILE=startup_file)
+    started_at = time.time()
+    subprocess.run(command, cwd=workdir, env=env, check=True, timeout=60)
+    with open(startup_file, encoding="utf-8") as file:
+        return float(file.read()) - started_at
+
+
+def python_baseline(workdir):
+    # 비교용: 파이썬 인터프리터만 켰다 끄는 시간
+    started_at = time.time()
+    subprocess.run([sys.executable, "-c", "pass"], cwd=workdir, check=True)
+    return time.time() - started_at
+
+
+def slowest_imports(workdir, top):
+    # 앱 모듈을 불러오기만 하고 (__main__이 아니므로 창은 띄우지 않음) 모듈별 누적 시간을 모음
+    code = (f"import importlib.util, sys; sys.path.insert(0, {os.path.dirname(APP_SCRIPT)!r}); "
+            f"spec = importlib.util.spec_from_file_location('app', {APP_SCRIPT!r}); "
+            "spec.loader.exec_module(importlib.util.module_from_spec(spec))")
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=workdir,
+                            capture_output=True, text=True, check=True)
+    times = []
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)", line)
+        if match and not match.group(2):  # 앱이 직접 불러온 최상위 모듈만
+            times.append((int(match.group(1)) / 1000, match.group(3)))
+    return sorted(times, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="앱이 창을 띄울 때까지 걸리는 시간 측정")
+    parser.add_argument("--exe", help="PyInstaller로 만든 실행 파일 (없으면 소스로 실행)")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (첫 실행은 디스크 캐시 때문에 따로 표시)")
+    parser.add_argument("--imports", type=int, metavar="N", help="시작할 때 불러오는 모듈 중 느린 N개 출력")
+    parser.add_argument("--limit", type=float, help="중앙값이 이 초를 넘으면 종료 코드 1")
+    args = parser.parse_args()
+
+    command = [os.path.abspath(args.exe)] if args.exe else [sys.executable, APP_SCRIPT]
+    # 앱이 만드는 crawler_data 등이 저장소에 남지 않도록 임시 폴더에서 실행
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.imports:
+            print("시작할 때 불러오는 모듈 (누적 시간):")
+            for ms, module in slowest_imports(workdir, args.imports):
+                print(f"  {ms:8.1f}ms  {module}")
+
+        first = run_once(command, workdir)
+        runs = [run_once(command, workdir) for _ in range(max(1, args.repeat - 1))]
+        baseline = python_baseline(workdir)
+
+    median = statistics.median(runs)
+    print(f"{' '.join(command)}")
+    print(f"창이 뜰 때까지: 첫 실행 {first:.3f}s | 중앙값 {median:.3f}s | 최소 {min(runs):.3f}s | "
+          f"최대 {max(runs):.3f}s ({len(runs)}회)")
+    print(f"파이썬 인터프리터만 실행: {baseline:.3f}s")
+    if args.limit is not None and median > args.limit:
+        print(f"중앙값 {median:.3f}s가 기준 {args.limit}s를 넘었습니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# 직업 게시판 목록 페이지를 여러 개 동시에 받아오는 모듈
+import itertools
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import crawl_metrics
+import crawler_settings as settings
+import http_cache
+import inven_http
+from parse_pool import shared_pool
+from row_extractor import BoardRow, extract_rows
+
+
+def fetch_page_bytes(job_board_url, page, allow_stale=False):
+    page_url = f"{job_board_url}?p={page}"
+    if settings.HTTP_CACHE_ENABLED:
+        # 저장해 둔 응답은 조건부 요청으로 확인하고, allow_stale이면 깊은 페이지는 잠시 동안 확인 없이 그대로 씀
+        # (새 글이 올라오면 목록이 뒤로 밀려서 확인하지 않은 페이지와 앞 페이지 사이의 글을 놓치므로
+        #  크롤링 지점을 옮기는 날짜 모드와 전체 크롤링에서는 쓰지 않음)
+        max_age = settings.HTTP_CACHE_MAX_AGE if allow_stale and page >= settings.HTTP_CACHE_STABLE_PAGE else 0
+        return http_cache.fetch(page_url, max_age)
+    response = inven_http.get(page_url)
+    response.raise_for_status()  # 요청 에러 확인
+    return response.content, response.encoding or "utf-8"
+
+
+def fetch_rows(job_board_url, page, emoji_pattern=None, parse_pool=None, allow_stale=False):
+    raw, encoding = fetch_page_bytes(job_board_url, page, allow_stale)
+    with crawl_metrics.timed("parse"):
+        rows = _parse_rows(raw, encoding, emoji_pattern, parse_pool)
+    crawl_metrics.count("pages")
+    crawl_metrics.count("rows", len(rows or ()))
+    return rows
+
+
+def _parse_rows(raw, encoding, emoji_pattern, parse_pool):
+    if parse_pool is not None:
+        # 파싱과 이모티콘 검사는 프로세스 풀에서 하고 가벼운 튜플만 돌려받음 (기다리는 시간 포함)
+        rows = parse_pool.parse(raw, encoding, emoji_pattern)
+        return None if rows is None else [BoardRow._make(row) for row in rows]
+
+    rows = extract_rows(raw.decode(encoding, errors="replace"))
+    if rows is None or emoji_pattern is None:
+        return rows
+    pattern = re.compile(emoji_pattern)
+    return [row._replace(emoji=bool(pattern.search(row.title))) for row in rows]
+
+
+def iter_board_pages(job_board_url, num_pages=None, workers=None, emoji_pattern=None, parse_pool=None, first_page=1, pages=None,
+                     on_error=None, max_failures=None, is_cancelled=None, allow_stale=False):
+    # 최대 workers 개의 페이지를 미리 요청해 두고, 결과는 페이지 순서대로 돌려줌
+    # num_pages가 None이면 호출한 쪽이 멈출 때까지 다음 페이지를 계속 요청 (날짜 모드)
+    # emoji_pattern을 주면 각 행의 emoji 값에 제목이 패턴과 맞는지 채워서 돌려줌
+    # pages를 주면 그 페이지 번호들만 순서대로 받음
+    # on_error(page, error)를 주면 재시도 후에도 받지 못한 페이지는 건너뛰고 알려줌 (없으면 예외를 그대로 던짐)
+    # max_failures를 주면 연속으로 그만큼 받지 못했을 때 마지막 예외를 던짐 (끝이 없는 페이지 범위용)
+    # is_cancelled()가 True가 되면 다음 페이지를 요청하지 않고 멈춤 (받지 못한 페이지만 이어져도 멈출 수 있게)
+    # allow_stale은 fetch_page_bytes와 같음 (페이지 모드만)
+    if workers is None:
+        # 동시에 요청 중인 페이지 수 (호스트당 연결 수와 맞춤, 실행 중에 설정을 바꿀 수 있도록 호출 시점에 읽음)
+        workers = settings.MAX_CONNECTIONS_PER_HOST
+    if parse_pool is None:
+        parse_pool = shared_pool()
+    if pages is None and num_pages is None:
+        pages = itertools.count(first_page)
+    elif pages is None:
+        pages = range(first_page, num_pages + 1)
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = deque()
+    failures = 0  # 연속으로 받지 못한 페이지 수
+
+    def take(page, future):
+        nonlocal failures
+        if on_error is None:
+            yield page, future.result()
+            return
+        try:
+            rows = future.result()
+        except Exception as error:
+            on_error(page, error)
+            failures += 1
+            if max_failures and failures >= max_failures:
+                raise
+            return
+        failures = 0
+        yield page, rows
+
+    try:
+        for page in pages:
+            if is_cancelled is not None and is_cancelled():
+                return
+            pending.append((page, executor.submit(fetch_rows, job_board_url, page, emoji_pattern, parse_pool, allow_stale)))
+            if len(pending) >= workers:
+                yield from take(*pending.popleft())
+
+        while pending:
+            yield from take(*pending.popleft())
+    finally:
+        # 중간에 멈춘 경우 아직 시작하지 않은 요청은 취소
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
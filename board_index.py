@@ -0,0 +1,131 @@
+# 메인 페이지의 링크 목록(직업 이름 → 게시판 URL)을 디스크에 캐시해 두고 찾는 모듈
+import difflib
+import json
+import os
+import sys
+import threading
+import time
+import crawler_settings as settings
+import inven_http
+
+
+def absolute_url(link):
+    # 링크가 절대 경로인지 확인하고, 상대 경로인 경우에만 base URL 추가
+    if not link.startswith("http"):
+        return settings.BASE_URL + link
+    return link
+
+
+class BoardIndex:
+    def __init__(self, path=None, ttl=None):
+        self.path = path or os.path.join(settings.DATA_DIR, "board_index.json")
+        self.ttl = settings.BOARD_INDEX_TTL if ttl is None else ttl
+        self.links = []  # (링크 텍스트, URL) 목록, 메인 페이지에 나온 순서
+        self.built_at = 0
+        self.failed_at = 0  # 마지막으로 새로 받지 못한 시각 (저장해 둔 목록을 쓰는 동안 매번 다시 요청하지 않도록)
+        self._lock = threading.Lock()
+
+    def is_stale(self):
+        if not self.links:
+            return True
+        now = time.time()
+        return now - self.built_at > self.ttl and now - self.failed_at > settings.BOARD_INDEX_RETRY
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return False
+        self.links = [tuple(link) for link in data.get("links", [])]
+        self.built_at = data.get("built_at", 0)
+        return True
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump({"built_at": self.built_at, "links": self.links}, file, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def refresh(self):
+        from bs4 import BeautifulSoup  # 목록을 새로 받을 때만 필요
+
+        # 메인 페이지를 한 번만 받아서 전체 링크 목록을 만듦
+        response = inven_http.get(settings.MAIN_URL)
+        response.raise_for_status()  # 요청 에러 확인
+
+        soup = BeautifulSoup(response.text, "html.parser")
+        links = []
+        seen = set()
+        for link in soup.find_all("a", href=True):
+            text = " ".join(link.text.split())
+            if not text or text in seen:
+                continue
+            seen.add(text)
+            links.append((text, absolute_url(link.get("href"))))
+
+        self.links = links
+        self.built_at = time.time()
+        self.save()
+
+    def ensure_fresh(self):
+        import requests  # inven_http.get()에서 불러오므로 여기서는 바로 돌아옴
+
+        with self._lock:
+            if not self.is_stale():
+                return
+            try:
+                self.refresh()
+            except requests.RequestException as e:
+                # 저장해 둔 목록이 있으면 오래됐어도 그대로 씀 (게시판 주소는 거의 바뀌지 않음)
+                if not self.links:
+                    raise
+                self.failed_at = time.time()
+                print(f"게시판 목록을 새로 받지 못해 저장해 둔 목록을 사용합니다: {e}", file=sys.stderr, flush=True)
+
+    def find(self, job_name, fuzzy=True):
+        self.ensure_fresh()
+        job_name = job_name.strip()
+
+        # 1. 이름이 정확히 같은 링크
+        for text, url in self.links:
+            if text == job_name:
+                return url
+        # 2. 이름이 포함된 첫 번째 링크
+        for text, url in self.links:
+            if job_name in text:
+                return url
+        # 3. 오타 등을 고려한 가장 비슷한 링크
+        if fuzzy:
+            matches = difflib.get_close_matches(job_name, [text for text, _ in self.links], n=1)
+            if matches:
+                return dict(self.links)[matches[0]]
+        return None
+
+    def class_boards(self, class_names=None):
+        # 직업 이름 → 게시판 URL (찾지 못한 직업은 빠짐)
+        boards = {}
+        for job_name in class_names or settings.LOSTARK_CLASSES:
+            url = self.find(job_name, fuzzy=False)
+            if url and url not in boards.values():
+                boards[job_name] = url
+        return boards
+
+
+_shared_index = None
+_shared_lock = threading.Lock()
+
+
+def shared_index():
+    # 프로그램 전체에서 하나의 인덱스를 같이 씀 (처음 부를 때 디스크에서 읽음)
+    global _shared_index
+    with _shared_lock:
+        if _shared_index is None:
+            _shared_index = BoardIndex()
+            _shared_index.load()
+        return _shared_index
+
+
+def get_job_board_url(job_name):
+    return shared_index().find(job_name)
@@ -0,0 +1,143 @@
+# 모든 직업 게시판을 하나의 스케줄러로 함께 크롤링하는 모듈
+# 동시 요청 수를 게시판마다 나눠 주기 때문에 글이 많은 게시판 하나가 나머지를 막지 않음
+import math
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import crawler_settings as settings
+from board_fetcher import fetch_rows
+from date_counter import DateCounter
+from parse_pool import shared_pool, sweep_processes
+
+
+class _BoardState:
+    def __init__(self, job_name, job_board_url, counter):
+        self.job_name = job_name
+        self.job_board_url = job_board_url
+        self.counter = counter
+        self.next_page = 1        # 다음에 요청할 페이지
+        self.next_result = 1      # 다음에 집계할 페이지
+        self.in_flight = {}       # 페이지 → future
+        self.done_pages = {}      # 순서를 기다리는 결과
+        self.retry_pages = []     # 받지 못해서 다시 요청할 페이지
+        self.failures = {}        # 페이지 → 받지 못한 횟수
+        self.done = False
+        self.error = None
+
+
+class BoardSweep:
+    def __init__(self, boards, input_date, emoji_marks, workers=None, parse_pool=None, mark_prefix=""):
+        # boards: 직업 이름 → 게시판 URL, mark_prefix: date_counter.DateCounter와 같음
+        self.boards = boards
+        self.input_date = input_date
+        self.emoji_marks = emoji_marks
+        self.workers = workers or settings.SWEEP_WORKERS
+        self.parse_pool = parse_pool if parse_pool is not None else shared_pool(sweep_processes())
+        self.mark_prefix = mark_prefix
+
+    def _fetch(self, job_board_url, page):
+        # 요청 속도는 inven_http가 호스트별로 조절함 (rate_limiter)
+        return fetch_rows(job_board_url, page, f"[{self.emoji_marks}]", self.parse_pool)
+
+    def _pick_board(self, states, start):
+        # 돌아가면서 고르되, 진행 중인 게시판 수로 나눈 몫보다 많이 요청 중인 게시판은 건너뜀
+        active = [state for state in states if not state.done]
+        if not active:
+            return None
+        fair_share = max(1, math.ceil(self.workers / len(active)))
+        for offset in range(len(states)):
+            state = states[(start + offset) % len(states)]
+            if not state.done and len(state.in_flight) < fair_share:
+                return state
+        return None
+
+    def run(self, store, on_page=None, is_cancelled=None, on_error=None, sink=None, rows=None, on_retry=None):
+        # 결과: 직업 이름 → (이모티콘 포함 글 수, 전체 글 수, 날짜별 이모티콘 포함 글 수)
+        # on_page(직업 이름, 페이지, 이모티콘 포함 글 수, 전체 글 수, 그 페이지의 날짜별 이모티콘 포함 글 수)
+        # 받지 못한 페이지는 CHECKPOINT_RETRY_ROUNDS번까지 다시 요청하고 on_retry(직업 이름, 페이지, 예외)로 알려줌
+        # 그래도 받지 못한 게시판은 결과에서 빠지고 on_error(직업 이름, 예외)로 알려줌
+        # sink를 주면 모든 게시판의 기간 안의 글을 하나의 파일로 내보냄 (집계는 이 스레드에서만 하므로 잠금 불필요)
+        # rows(row_table.RowTable)를 주면 모든 게시판의 글을 그 표에 모음 (게시판별 집계는 rows.board_date_counts())
+        states = [
+            _BoardState(job_name, job_board_url,
+                        DateCounter(store, job_board_url, self.input_date, self.emoji_marks, sink, rows,
+                                    self.mark_prefix))
+            for job_name, job_board_url in self.boards.items()
+        ]
+        owners = {}  # future → (게시판 상태, 페이지)
+        turn = 0
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            while any(not state.done for state in states):
+                if is_cancelled and is_cancelled():
+                    break
+
+                # 빈 자리만큼 요청을 채움
+                while len(owners) < self.workers:
+                    state = self._pick_board(states, turn)
+                    if state is None:
+                        break
+                    turn = states.index(state) + 1
+                    if state.retry_pages:
+                        page = state.retry_pages.pop(0)
+                    else:
+                        page = state.next_page
+                        state.next_page += 1
+                    future = executor.submit(self._fetch, state.job_board_url, page)
+                    state.in_flight[page] = future
+                    owners[future] = (state, page)
+
+                finished, _ = wait(list(owners), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    state, page = owners.pop(future)
+                    del state.in_flight[page]
+                    if state.done or future.cancelled():
+                        continue
+                    try:
+                        state.done_pages[page] = future.result()
+                    except Exception as e:
+                        # 뒤 페이지는 순서를 기다리게 두고 이 페이지만 다시 요청
+                        state.failures[page] = state.failures.get(page, 0) + 1
+                        if state.failures[page] <= settings.CHECKPOINT_RETRY_ROUNDS:
+                            if on_retry:
+                                on_retry(state.job_name, page, e)
+                            state.retry_pages.append(page)
+                            continue
+                        # 한 게시판이 실패해도 나머지 게시판은 계속 크롤링
+                        state.error = e
+                        self._finish(state)
+                        if on_error:
+                            on_error(state.job_name, e)
+                        continue
+                    self._consume(state, on_page)
+        finally:
+            for future in owners:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if sink is not None and not (is_cancelled and is_cancelled()):
+            # 새 글만 받은 게시판도 저장소에 있는 기간 안의 글까지 내보냄
+            for state in states:
+                if state.error is None and state.counter.finished:
+                    state.counter.add_stored()
+
+        return {state.job_name: state.counter.result() for state in states if state.error is None}
+
+    def _finish(self, state):
+        # 끝난 게시판의 남은 요청은 취소
+        state.done = True
+        state.done_pages.clear()
+        state.retry_pages.clear()
+        for future in state.in_flight.values():
+            future.cancel()
+
+    def _consume(self, state, on_page):
+        # 페이지 순서대로 집계
+        while not state.done and state.next_result in state.done_pages:
+            page = state.next_result
+            rows = state.done_pages.pop(page)
+            state.next_result += 1
+            if state.counter.add_page(rows, page):
+                self._finish(state)
+            if on_page:
+                on_page(state.job_name, page, state.counter.emoji_count, state.counter.total_count,
+                        state.counter.page_dates)
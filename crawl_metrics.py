@@ -0,0 +1,182 @@
+# 크롤링 단계별 소요 시간, 개수, 응답 시간 분포를 모으는 모듈
+#   with crawl_metrics.timed("parse"): ...     단계별 시간 (요청, 파싱, 저장, 로그 출력 등)
+#   crawl_metrics.count("bytes", len(body))    개수 (받은 바이트, 페이지, 글, 재시도 등)
+#   crawl_metrics.save_summary(path)           실행이 끝난 뒤 JSON으로 저장
+# 어느 함수에서 시간이 드는지까지 보려면 profile("cprofile" 또는 "pyinstrument")로 감쌈
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+import crawler_settings as settings
+
+# 응답 시간 분포의 구간 경계 (밀리초), 마지막 구간은 그보다 긴 것 전부
+BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+PROFILE_MODES = ("cprofile", "pyinstrument")
+
+
+class Histogram:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, seconds):
+        ms = seconds * 1000
+        self.count += 1
+        self.total += ms
+        self.min = ms if self.min is None else min(self.min, ms)
+        self.max = ms if self.max is None else max(self.max, ms)
+        self.buckets[bisect_left(BUCKETS_MS, ms)] += 1
+
+    def percentile(self, ratio):
+        # 구간 경계로 어림한 값 (예: p95 = 95%의 값이 이 시간 이하)
+        target = self.count * ratio
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= target:
+                return min(BUCKETS_MS[index], self.max) if index < len(BUCKETS_MS) else self.max
+        return self.max
+
+    def summary(self):
+        if not self.count:
+            return {"count": 0}
+        labels = [f"<={bound}ms" for bound in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "total_ms": round(self.total, 1),
+            "mean_ms": round(self.total / self.count, 2),
+            "min_ms": round(self.min, 2),
+            "max_ms": round(self.max, 2),
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "histogram": {label: n for label, n in zip(labels, self.buckets) if n},
+        }
+
+
+_lock = threading.Lock()
+_counters = Counter()
+_timers = {}
+_started_at = time.monotonic()
+
+
+def count(name, amount=1):
+    if not settings.METRICS_ENABLED:
+        return
+    with _lock:
+        _counters[name] += amount
+
+
+def observe(stage, seconds):
+    if not settings.METRICS_ENABLED:
+        return
+    with _lock:
+        histogram = _timers.get(stage)
+        if histogram is None:
+            histogram = _timers[stage] = Histogram()
+        histogram.add(seconds)
+
+
+@contextmanager
+def timed(stage):
+    # 여러 스레드에서 같은 단계를 동시에 재면 단계 합계가 실제 걸린 시간보다 클 수 있음
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(stage, time.perf_counter() - start)
+
+
+def reset():
+    global _started_at
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+        _started_at = time.monotonic()
+
+
+def summary():
+    with _lock:
+        return {
+            "elapsed_s": round(time.monotonic() - _started_at, 3),
+            "counters": dict(_counters),
+            "stages": {stage: histogram.summary() for stage, histogram in sorted(_timers.items())},
+        }
+
+
+def format_summary(data=None):
+    # 콘솔이나 로그 창에 보여줄 몇 줄짜리 요약
+    data = data or summary()
+    lines = [f"경과 {data['elapsed_s']}초 | " + ", ".join(f"{name} {value}" for name, value in data["counters"].items())]
+    for stage, stats in data["stages"].items():
+        if stats["count"]:
+            lines.append(f"  {stage:10s} {stats['count']:6d}회  합계 {stats['total_ms'] / 1000:8.2f}초  "
+                         f"평균 {stats['mean_ms']:8.2f}ms  p95 {stats['p95_ms']}ms  최대 {stats['max_ms']}ms")
+    return "\n".join(lines)
+
+
+def save_summary(path=None):
+    # 기본 위치: DATA_DIR/metrics/metrics_YYYYmmdd_HHMMSS.json (최근 METRICS_KEEP_FILES개만 남김)
+    prune = path is None
+    if path is None:
+        path = os.path.join(settings.DATA_DIR, "metrics", f"metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(summary(), file, ensure_ascii=False, indent=2)
+    if prune:
+        prune_saved(os.path.dirname(path))
+    return path
+
+
+def prune_saved(directory, keep=None):
+    # 파일 이름에 저장한 시각이 들어 있으므로 이름순으로 오래된 것부터 지움
+    keep = settings.METRICS_KEEP_FILES if keep is None else keep
+    names = sorted(name for name in os.listdir(directory) if name.startswith("metrics_") and name.endswith(".json"))
+    for name in names[:max(len(names) - keep, 0)]:
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+
+
+@contextmanager
+def profile(mode, output_path):
+    # 감싼 코드를 실행한 스레드만 측정함 (요청 스레드와 파싱 프로세스는 timed() 단계 시간으로 확인)
+    # cprofile: output_path에 pstats 파일과 .txt 요약, pyinstrument: output_path에 HTML
+    if mode == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            raise ImportError("pyinstrument가 설치되어 있지 않습니다: pip install pyinstrument")
+        profiler = Profiler()
+        profiler.start()
+        try:
+            yield
+        finally:
+            profiler.stop()
+            with open(output_path, "w", encoding="utf-8") as file:
+                file.write(profiler.output_html())
+        return
+
+    import cProfile
+    import io
+    import pstats
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(output_path)
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(30)
+        with open(output_path + ".txt", "w", encoding="utf-8") as file:
+            file.write(text.getvalue())
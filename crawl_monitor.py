@@ -0,0 +1,240 @@
+# 직업 게시판을 정해진 간격으로 계속 확인하면서 이모티콘 포함 글 비율을 시계열로 쌓는 모니터
+# 사용법:
+#   python crawl_monitor.py                           모든 직업을 MONITOR_INTERVAL마다 확인 (Ctrl+C로 종료)
+#   python crawl_monitor.py 인파이터 워로드 --interval 1800
+#   python crawl_monitor.py --once                    한 번만 확인하고 종료 (cron 작업용)
+#   python crawl_monitor.py --report 인파이터 --days 28   쌓인 시계열 출력
+# 확인할 때마다 지난번에 본 글 번호 이후의 새 글만 받음 (date_counter.py의 이어서 크롤링)
+# 크롤링 지점은 GUI, 명령줄 크롤링과 따로 둠 (그 사이에 다른 크롤링이 받아 간 글도 시계열에 들어가도록)
+# 시계열은 DATA_DIR/monitor.db에 원본 → 시간별 → 일별로 묶어서 저장하고, 단위마다 보관 기간이 지나면 지움
+import argparse
+import multiprocessing
+import os
+import signal
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+import crawler_core
+import crawler_settings as settings
+from board_index import shared_index
+from post_store import board_key
+from row_table import RowTable, day_ordinal
+
+MARK_PREFIX = "monitor:"  # post_store의 crawl_marks에서 모니터가 쓰는 크롤링 지점 이름 앞에 붙임
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    board TEXT NOT NULL,          -- 직업 이름
+    resolution INTEGER NOT NULL,  -- 0: 확인할 때마다의 원본, 그 밖에는 묶는 단위 (초)
+    ts INTEGER NOT NULL,          -- 구간 시작 시각 (유닉스 시간, 원본은 확인한 시각)
+    emoji INTEGER NOT NULL,       -- 이모티콘 포함 새 글 수
+    total INTEGER NOT NULL,       -- 새 글 수
+    PRIMARY KEY (board, resolution, ts)
+);
+"""
+
+
+def _bucket(ts, resolution):
+    # 지역 시간 기준으로 resolution초 단위 구간의 시작 (일별 구간이 한국 시간 자정에서 시작하도록)
+    if not resolution:
+        return ts
+    offset = time.localtime(ts).tm_gmtoff
+    return ts - (ts + offset) % resolution
+
+
+class TimeSeriesStore:
+    def __init__(self, path=None, tiers=None):
+        self.path = path or os.path.join(settings.DATA_DIR, "monitor.db")
+        self.tiers = tiers or settings.MONITOR_TIERS  # (묶는 단위, 보관 기간), 단위가 작은 것부터
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def add(self, board, ts, emoji, total):
+        # 원본과 묶음 단위마다 한 줄씩 더함 (묶음은 글 수를 더해 두고 비율은 꺼낼 때 계산)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO samples (board, resolution, ts, emoji, total) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (board, resolution, ts) DO UPDATE SET"
+                " emoji = emoji + excluded.emoji, total = total + excluded.total",
+                [(board, resolution, _bucket(int(ts), resolution), emoji, total) for resolution, _ in self.tiers],
+            )
+
+    def prune(self, now=None):
+        # 단위별 보관 기간이 지난 값은 지움
+        now = time.time() if now is None else now
+        with self.conn:
+            for resolution, retention in self.tiers:
+                self.conn.execute("DELETE FROM samples WHERE resolution = ? AND ts < ?", (resolution, now - retention))
+
+    def resolution_for(self, seconds):
+        # 지난 seconds초를 볼 때 쓸 가장 촘촘한 단위 (보관 기간이 그보다 긴 것)
+        for resolution, retention in self.tiers:
+            if retention >= seconds:
+                return resolution
+        return self.tiers[-1][0]
+
+    def series(self, board, since_ts, resolution=None):
+        # [(구간 시작 시각, 이모티콘 포함 글 수, 전체 글 수)], 오래된 것부터
+        if resolution is None:
+            resolution = self.resolution_for(time.time() - since_ts)
+        # since_ts가 들어 있는 구간부터
+        return self.conn.execute(
+            "SELECT ts, emoji, total FROM samples WHERE board = ? AND resolution = ? AND ts >= ? ORDER BY ts",
+            (board, resolution, _bucket(int(since_ts), resolution)),
+        ).fetchall()
+
+    def boards(self):
+        return [board for board, in self.conn.execute("SELECT DISTINCT board FROM samples ORDER BY board")]
+
+
+class MonitorReporter:
+    # crawler_core의 reporter: 진행 상황은 verbose일 때만 출력하고, stop()이 불리면 크롤링을 멈춤
+    def __init__(self, stop_event, verbose=False):
+        self.stop_event = stop_event
+        self.verbose = verbose
+
+    def log(self, text):
+        if self.verbose:
+            print(text, flush=True)
+
+    def report_page(self, page, emoji_count, total_count, job_name=None):
+        pass
+
+    def report_dates(self, date_counts, job_name=None):
+        pass
+
+    def is_cancelled(self):
+        return self.stop_event.is_set()
+
+    def error(self, job_name, error):
+        # 게시판을 확인하지 못한 것은 verbose가 아니어도 항상 알림 (그 게시판은 이번 확인에서 빠짐)
+        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        print(f"[{stamp}] [{job_name}] 확인 중 오류가 발생했습니다: {error}", file=sys.stderr, flush=True)
+
+
+class CrawlMonitor:
+    def __init__(self, class_names=None, interval=None, lookback_days=None, store=None, verbose=False):
+        self.class_names = class_names or None
+        self.interval = interval or settings.MONITOR_INTERVAL
+        # 처음 확인할 때 이 날짜까지 거슬러 올라감, 그 뒤로는 이 날짜를 유지해야 새 글만 받음
+        lookback_days = settings.MONITOR_LOOKBACK_DAYS if lookback_days is None else lookback_days
+        self.since = (date.today() - timedelta(days=lookback_days)).isoformat()
+        self.store = store or TimeSeriesStore()
+        self.stop_event = threading.Event()
+        self.reporter = MonitorReporter(self.stop_event, verbose)
+
+    def stop(self):
+        self.stop_event.set()
+
+    def run_cycle(self):
+        # 모든 게시판을 한 번 확인하고 직업 이름 → (이모티콘 포함 새 글 수, 새 글 수)
+        now = time.time()
+        today = date.today().toordinal()
+        rows = RowTable()  # 이번에 새로 받은 글만 들어감
+        results = crawler_core.sweep_by_date(self.since, self.reporter, self.class_names, rows=rows,
+                                             on_error=self.reporter.error, mark_prefix=MARK_PREFIX)
+        if self.stop_event.is_set():
+            return {}  # 중간에 멈춘 확인은 기록하지 않음 (다음 실행에서 같은 글을 다시 받음)
+
+        boards = {job_name: board_key(url) for job_name, url in shared_index().class_boards(self.class_names).items()}
+        emoji_counts = rows.board_date_counts()
+        total_counts = rows.board_date_counts(emoji_only=False)
+        summary = {}
+        for job_name in results:
+            emoji_by_date = emoji_counts.get(boards.get(job_name), {})
+            total_by_date = total_counts.get(boards.get(job_name), {})
+            for date_key, total in total_by_date.items():
+                # 오늘 글은 확인한 시각에, 처음 실행할 때 받은 지난 글은 글을 쓴 날에 넣음
+                day = day_ordinal(date_key)
+                ts = now if day >= today else time.mktime(date.fromordinal(day).timetuple())
+                self.store.add(job_name, ts, emoji_by_date.get(date_key, 0), total)
+            if not total_by_date:
+                self.store.add(job_name, now, 0, 0)  # 새 글이 없던 것도 기록 (조용한 시간대)
+            summary[job_name] = (sum(emoji_by_date.values()), sum(total_by_date.values()))
+        self.store.prune(now)
+        return summary
+
+    def run(self, cycles=None):
+        # cycles번 확인하고 끝냄 (None이면 stop()이 불릴 때까지)
+        # 확인이 오래 걸려도 시작 시각은 interval 간격을 유지함 (요청량이 일정하도록)
+        next_run = time.monotonic()
+        count = 0
+        while not self.stop_event.is_set() and (cycles is None or count < cycles):
+            started = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            try:
+                summary = self.run_cycle()
+            except Exception as e:
+                # 네트워크 오류 등으로 한 번 실패해도 다음 확인은 계속함
+                print(f"[{started}] 확인 중 오류가 발생했습니다: {e}", file=sys.stderr, flush=True)
+            else:
+                text = ", ".join(f"{job_name} {emoji}/{total}" for job_name, (emoji, total) in summary.items())
+                print(f"[{started}] 새 글 (이모티콘/전체): {text or '없음'}", flush=True)
+            count += 1
+            if cycles is not None and count >= cycles:
+                break
+            next_run += self.interval
+            self.stop_event.wait(max(0, next_run - time.monotonic()))
+
+
+def print_report(store, boards, days):
+    since_ts = time.time() - days * 24 * 60 * 60
+    resolution = store.resolution_for(days * 24 * 60 * 60)
+    if resolution >= 24 * 60 * 60:
+        time_format = "%Y-%m-%d"
+    else:
+        time_format = "%Y-%m-%d %H:%M" if resolution else "%Y-%m-%d %H:%M:%S"
+    for board in boards or store.boards():
+        if not resolution:
+            unit = "원본"
+        elif resolution % (24 * 60 * 60) == 0:
+            unit = f"{resolution // (24 * 60 * 60)}일 단위"
+        else:
+            unit = f"{resolution // 60}분 단위"
+        print(f"[{board}] 지난 {days}일 ({unit})")
+        for ts, emoji, total in store.series(board, since_ts, resolution):
+            ratio = f"{emoji / total:6.1%}" if total else "     -"
+            print(f"  {datetime.fromtimestamp(ts).strftime(time_format)}  {ratio}  ({emoji}/{total})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="직업 게시판의 이모티콘 포함 글 비율을 주기적으로 기록")
+    parser.add_argument("classes", nargs="*", help="확인할 직업 이름 (없으면 모든 직업)")
+    parser.add_argument("--interval", type=int, help="확인 간격 (초, 기본값: crawler_settings.MONITOR_INTERVAL)")
+    parser.add_argument("--lookback-days", type=int, help="처음 확인할 때 거슬러 올라갈 일 수")
+    parser.add_argument("--once", action="store_true", help="한 번만 확인하고 종료")
+    parser.add_argument("--report", action="store_true", help="확인하지 않고 쌓인 시계열만 출력")
+    parser.add_argument("--days", type=int, default=7, help="--report로 출력할 기간 (일)")
+    parser.add_argument("--verbose", action="store_true", help="페이지별 진행 상황도 출력")
+    args = parser.parse_args(argv)
+
+    with TimeSeriesStore() as store:
+        if args.report:
+            print_report(store, args.classes, args.days)
+            return 0
+
+        monitor = CrawlMonitor(args.classes, args.interval, args.lookback_days, store, args.verbose)
+        # 서비스로 실행할 때 SIGTERM도 Ctrl+C처럼 진행 중인 확인을 멈추고 종료
+        signal.signal(signal.SIGINT, lambda *_: monitor.stop())
+        if hasattr(signal, "SIGTERM"):
+            signal.signal(signal.SIGTERM, lambda *_: monitor.stop())
+        print(f"{monitor.since} 이후 글부터 {monitor.interval}초마다 확인합니다. (저장: {store.path})", flush=True)
+        monitor.run(1 if args.once else None)
+    return 0
+
+
+if __name__ == "__main__":
+    # 파싱 프로세스 풀이 실행 파일(PyInstaller)에서도 동작하도록 설정
+    multiprocessing.freeze_support()
+    sys.exit(main())
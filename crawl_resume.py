@@ -0,0 +1,88 @@
+# 긴 크롤링의 진행 상황을 주기적으로 파일에 저장해 두고, 중단되면 이어서 크롤링하는 모듈
+# 저장 내용: 끝난 페이지, 실패한 페이지(재시도 대기열), 지금까지의 집계
+import json
+import os
+import time
+import crawler_settings as settings
+
+
+class CrawlCheckpoint:
+    def __init__(self, key, meta):
+        # key: 파일 이름 (예: board_lostark_5340_pages_1-300), meta: 같은 크롤링인지 확인할 조건
+        self.key = key
+        self.meta = meta
+        self.path = os.path.join(settings.DATA_DIR, "checkpoints", f"{key}.json")
+        self.done = set()       # 끝난 페이지
+        self.failed = {}        # 실패한 페이지 → 에러 메시지
+        self.aggregates = {}    # 지금까지의 집계 (이모티콘 포함 글 수 등)
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
+
+    @classmethod
+    def open(cls, key, meta, resume=False):
+        # resume이면 같은 조건으로 저장해 둔 진행 상황을 불러오고, 아니면 새로 시작
+        checkpoint = cls(key, meta)
+        if resume:
+            checkpoint.load()
+        return checkpoint
+
+    def load(self):
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return False
+        if data.get("meta") != self.meta:
+            return False
+        self.done = set(data.get("done", []))
+        self.failed = {int(page): error for page, error in data.get("failed", {}).items()}
+        self.aggregates = data.get("aggregates", {})
+        return True
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = {
+            "meta": self.meta,
+            "done": sorted(self.done),
+            "failed": {str(page): error for page, error in sorted(self.failed.items())},
+            "aggregates": self.aggregates,
+            "saved_at": time.time(),
+        }
+        # 저장 도중 꺼져도 이전 파일이 남도록 임시 파일에 쓴 뒤 바꿔치기
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+        self._unsaved = 0
+        self._saved_at = time.monotonic()
+
+    def remove(self):
+        # 모든 페이지를 끝냈으면 파일을 지움
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def is_resumed(self):
+        return bool(self.done or self.failed)
+
+    def remaining(self, pages):
+        # 아직 끝나지 않은 페이지만 (pages는 무한한 itertools.count여도 됨)
+        return (page for page in pages if page not in self.done)
+
+    def mark_done(self, page, **aggregates):
+        self.done.add(page)
+        self.failed.pop(page, None)
+        self.aggregates.update(aggregates)
+        self._unsaved += 1
+        if (self._unsaved >= settings.CHECKPOINT_EVERY_PAGES
+                or time.monotonic() - self._saved_at >= settings.CHECKPOINT_INTERVAL):
+            self.save()
+
+    def mark_failed(self, page, error):
+        # iter_board_pages(on_error=...)로 넘겨서 실패한 페이지를 재시도 대기열에 넣음
+        self.failed[page] = str(error)
+        self.save()
+
+    def retry_pages(self):
+        return sorted(self.failed)
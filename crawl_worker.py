@@ -0,0 +1,155 @@
+# 크롤링을 GUI 스레드 밖(QThread)에서 실행하고 진행 상황을 시그널로 전달하는 모듈
+import threading
+from collections import deque
+from PySide6.QtCore import QObject, QThread, Signal
+import rate_limiter
+
+
+class CrawlWorker(QObject):
+    message = Signal(str)                    # 진행 상황 로그 한 줄
+    page_done = Signal(str, int, int, int)   # 직업, 페이지, 이모티콘 포함 글 수, 전체 글 수 (누적)
+    dates_done = Signal(str, object)         # 직업, 한 페이지에서 늘어난 날짜별 이모티콘 포함 글 수
+    job_done = Signal(str, object)           # 직업, 크롤링 결과
+    error = Signal(str, str)                 # 직업, 에러 메시지
+    finished = Signal()
+
+    def __init__(self, crawl_job):
+        super().__init__()
+        # crawl_job(job_name, params, worker) 는 워커 스레드에서 실행됨
+        self.crawl_job = crawl_job
+        self.current_job = None
+        self._jobs = deque()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._cancel = threading.Event()
+
+    def add_jobs(self, jobs):
+        # 이미 끝나가는 워커에는 작업을 넣을 수 없음 (False 반환)
+        with self._lock:
+            if self._closed or self._cancel.is_set():
+                return False
+            self._jobs.extend(jobs)
+            return True
+
+    def cancel(self):
+        self._cancel.set()
+        with self._lock:
+            self._jobs.clear()
+
+    def is_cancelled(self):
+        return self._cancel.is_set()
+
+    def is_closed(self):
+        with self._lock:
+            return self._closed
+
+    def log(self, text):
+        self.message.emit(text)
+
+    def report_page(self, page, emoji_count, total_count, job_name=None):
+        # 여러 게시판을 함께 크롤링할 때는 job_name으로 어느 게시판인지 알려줌
+        self.page_done.emit(job_name or self.current_job, page, emoji_count, total_count)
+
+    def report_dates(self, date_counts, job_name=None):
+        # 시그널은 다른 스레드에서 받으므로 복사해서 보냄
+        self.dates_done.emit(job_name or self.current_job, dict(date_counts))
+
+    def run(self):
+        while not self.is_cancelled():
+            with self._lock:
+                if not self._jobs:
+                    self._closed = True
+                    break
+                job_name, params = self._jobs.popleft()
+
+            self.current_job = job_name
+            try:
+                result = self.crawl_job(job_name, params, self)
+            except Exception as e:
+                self.error.emit(job_name, str(e))
+                continue
+
+            if self.is_cancelled():
+                break
+            self.job_done.emit(job_name, result)
+
+        with self._lock:
+            self._closed = True
+        self.finished.emit()
+
+
+class CrawlController(QObject):
+    # 워커의 시그널을 그대로 다시 내보내므로 창에서는 한 번만 연결하면 됨
+    message = Signal(str)
+    page_done = Signal(str, int, int, int)
+    dates_done = Signal(str, object)
+    job_done = Signal(str, object)
+    error = Signal(str, str)
+    idle = Signal()
+
+    def __init__(self, crawl_job, parent=None):
+        super().__init__(parent)
+        self.crawl_job = crawl_job
+        self.worker = None
+        self.threads = []
+
+    def is_running(self):
+        return self.worker is not None
+
+    def submit(self, jobs):
+        # 실행 중인 워커가 있으면 대기열 뒤에 추가하고, 없으면 새 스레드를 띄움
+        if self.worker and self.worker.add_jobs(jobs):
+            return
+
+        worker = CrawlWorker(self.crawl_job)
+        worker.add_jobs(jobs)
+        thread = QThread()
+        worker.moveToThread(thread)
+
+        worker.message.connect(self.message)
+        worker.page_done.connect(self.page_done)
+        worker.dates_done.connect(self.dates_done)
+        worker.job_done.connect(self.job_done)
+        worker.error.connect(self.error)
+        thread.started.connect(worker.run)
+        # 컨트롤러 슬롯은 GUI 스레드에서 실행됨
+        worker.finished.connect(self._reap_threads)
+
+        self.worker = worker
+        self.threads.append((thread, worker))
+        thread.start()
+
+    def cancel(self):
+        # 일시정지 중이면 풀어서 대기 중인 요청이 취소를 확인할 수 있게 함
+        rate_limiter.resume_all()
+        if self.worker:
+            self.worker.cancel()
+
+    def pause(self):
+        # 새 요청만 멈추고 진행 중인 요청과 지금까지의 집계는 그대로 둠
+        rate_limiter.pause_all()
+
+    def resume(self):
+        rate_limiter.resume_all()
+
+    def is_paused(self):
+        return rate_limiter.is_paused()
+
+    def shutdown(self):
+        # 종료 전에 진행 중인 요청이 끝날 때까지 기다림
+        self.cancel()
+        for thread, _ in list(self.threads):
+            thread.quit()
+            thread.wait()
+
+    def _reap_threads(self):
+        # run()이 끝난 워커의 스레드를 정리
+        for thread, worker in list(self.threads):
+            if not worker.is_closed():
+                continue
+            thread.quit()
+            thread.wait()
+            self.threads.remove((thread, worker))
+            if self.worker is worker:
+                self.worker = None
+                self.idle.emit()
@@ -0,0 +1,335 @@
+# GUI(PySide6) 없이 명령줄에서 크롤링하는 스크립트 (서버, cron 작업용)
+# 사용법:
+#   python crawler_cli.py 인파이터 워로드 --since 2025-01-01 --format xlsx   (직업별 시트가 있는 파일 하나로)
+#   python crawler_cli.py --all --since 2025-01-01 --format csv --output-dir out
+#   python crawler_cli.py --all --since 2025-01-01 --table parquet   (직업, 날짜별 긴 표도 저장)
+#   python crawler_cli.py 인파이터 --since 2024-01-01 --boundary-search   (오래전 날짜까지: 끝나는 페이지를 먼저 찾음)
+#   python crawler_cli.py 인파이터 --pages 1-10 --workers 4
+#   python crawler_cli.py 인파이터 --pages 1-500 --format none --export parquet   (게시글을 받는 즉시 파일로)
+#   python crawler_cli.py 인파이터 --pages 1-300 --format none --resume   (중단된 크롤링을 이어서)
+#   python crawler_cli.py 인파이터 --pages 1-5 --format none --details   (게시글 본문까지)
+#   python crawler_cli.py 인파이터 --pages 1-50 --format none --metrics --profile cprofile   (어디서 시간이 드는지)
+import argparse
+import contextlib
+import multiprocessing
+import os
+import sys
+from datetime import datetime
+import crawl_metrics
+import crawler_core
+import crawler_settings as settings
+import http_cache
+import inven_http
+from post_detail import PostDetailCrawler
+from post_store import board_key
+from row_table import RowTable
+from title_classifier import TitleClassifier
+
+FORMATS = ("xlsx", "csv", "json", "none")
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+TABLE_FORMATS = ("csv", "parquet")
+
+
+class ConsoleReporter:
+    # crawler_core의 reporter: 진행 상황을 표준 출력으로 보냄
+    def __init__(self, quiet=False):
+        self.quiet = quiet
+
+    def log(self, text):
+        if not self.quiet:
+            print(text, flush=True)
+
+    def report_page(self, page, emoji_count, total_count, job_name=None):
+        pass
+
+    def report_dates(self, date_counts, job_name=None):
+        pass
+
+    def is_cancelled(self):
+        return False
+
+
+def parse_pages(text):
+    # "10" → (1, 10), "3-7" → (3, 7)
+    first, _, last = text.partition("-")
+    try:
+        first_page, last_page = (1, int(first)) if not last else (int(first), int(last))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"페이지 범위 형식이 잘못되었습니다: {text}")
+    if first_page < 1 or last_page < first_page:
+        raise argparse.ArgumentTypeError(f"페이지 범위가 잘못되었습니다: {text}")
+    return first_page, last_page
+
+
+def parse_date(text):
+    try:
+        return datetime.strptime(text, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"날짜는 YYYY-MM-DD 형식으로 입력하세요: {text}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="로스트아크 인벤 직업 게시판 크롤러")
+    parser.add_argument("classes", nargs="*", help="크롤링할 직업 이름 (여러 개 가능)")
+    parser.add_argument("--all", action="store_true", help="모든 직업 게시판을 함께 크롤링 (--since 필요)")
+
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--since", type=parse_date, help="이 날짜(YYYY-MM-DD)까지의 글을 날짜별로 집계")
+    mode.add_argument("--pages", type=parse_pages, help="N 또는 A-B 페이지의 이모티콘 포함 글 수 집계")
+
+    parser.add_argument("--workers", type=int, help="동시에 요청할 페이지 수 (기본값: crawler_settings)")
+    parser.add_argument("--parse-processes", type=int,
+                        help="파싱 프로세스 수 (0이면 요청 스레드에서 파싱, 기본값: 한 직업은 0, --all은 CPU 코어 수)")
+    parser.add_argument("--boundary-search", action="store_true",
+                        help="날짜 모드: 날짜가 끝나는 페이지를 먼저 찾고 그 앞 페이지를 한꺼번에 받음 (오래전 날짜까지 받을 때)")
+    parser.add_argument("--format", choices=FORMATS, default="xlsx", help="결과 저장 형식 (기본값: xlsx)")
+    parser.add_argument("--export", choices=EXPORT_FORMATS, help="크롤링한 게시글을 이 형식의 파일로 바로 내보냄")
+    parser.add_argument("--table", choices=TABLE_FORMATS,
+                        help="날짜 모드: 모든 직업의 날짜별 통계를 (직업, 날짜) 한 줄씩인 표 하나로도 저장 (분석 도구용)")
+    parser.add_argument("--classify", action="store_true", help="제목을 crawler_settings.TITLE_CATEGORIES 분류별로 셈")
+    parser.add_argument("--resume", action="store_true",
+                        help="같은 조건으로 중단된 크롤링을 저장된 진행 상황에서 이어서 함 (받지 못한 페이지 포함)")
+    parser.add_argument("--details", action="store_true",
+                        help="게시글 본문과 댓글 수도 받아서 분류별로 셈 (crawler_data/posts.db의 post_details에 저장)")
+    parser.add_argument("--no-cache", action="store_true", help="저장해 둔 페이지(HTTP 캐시)를 쓰지 않고 모두 새로 받음")
+    parser.add_argument("--metrics", action="store_true",
+                        help="단계별 시간(요청, 파싱, 저장)과 개수를 출력하고 output-dir에 JSON으로 저장")
+    parser.add_argument("--profile", choices=crawl_metrics.PROFILE_MODES,
+                        help="함수별 실행 시간을 output-dir에 저장 (cprofile: .prof와 .txt, pyinstrument: .html)")
+    parser.add_argument("--output-dir", default=".", help="결과 파일을 저장할 폴더")
+    parser.add_argument("--quiet", action="store_true", help="진행 상황을 출력하지 않음")
+    return parser
+
+
+def open_export(args, job_name):
+    # --export가 없으면 sink 대신 None
+    if not args.export:
+        return contextlib.nullcontext()
+    return crawler_core.open_result_sink(job_name, args.export, args.output_dir)
+
+
+def print_export(sink):
+    if sink is not None:
+        print(f"게시글 {sink.total_count}개를 내보냈습니다 (이모티콘 포함 {sink.emoji_count}개): {sink.path}")
+
+
+def open_details(args, job_board_url):
+    # --details가 없으면 None
+    if not args.details:
+        return contextlib.nullcontext()
+    return PostDetailCrawler(job_board_url)
+
+
+def print_details(job_name, details):
+    if details is not None:
+        print(f"[{job_name}] {details.summary()}")
+
+
+def partial_name(name, partial):
+    # 받지 못한 페이지가 있는 결과는 파일 이름에 표시
+    return f"{name}_일부" if partial else name
+
+
+def save_date_results(results, args, rows=None, partial=None):
+    # results: 직업 이름 → (이모티콘 포함 글 수, 전체 글 수, 날짜별 통계)
+    # partial: 받지 못한 페이지가 남은 직업 이름 → 페이지 목록
+    # rows: 이번에 크롤링한 글 (row_table.RowTable, 직업 하나를 엑셀로 저장할 때만, 그 외에는 None)
+    partial = partial or {}
+    files = []
+    # 직업이 여러 개면 엑셀은 직업별 시트가 있는 파일 하나로 (report_builder.py)
+    combined = args.all or len(results) > 1
+    report_formats = []
+    if args.format == "xlsx" and combined:
+        report_formats.append("xlsx")
+    if args.table and results:
+        report_formats.append(args.table)
+    if report_formats:
+        name = partial_name(crawler_core.SWEEP_KEYWORD if args.all else "_".join(results), partial)
+        files.extend(crawler_core.save_report(results, name, args.output_dir, args.since, report_formats))
+
+    if args.format == "xlsx" and not combined:
+        for job_name, (_, _, emoji_date_stats) in results.items():
+            board = board_key(crawler_core.get_job_board_url(job_name))
+            files.append(crawler_core.save_statistics_as_excel(partial_name(job_name, job_name in partial),
+                                                               emoji_date_stats, args.output_dir, rows, board))
+    elif args.format == "csv":
+        for job_name, (_, _, emoji_date_stats) in results.items():
+            files.append(crawler_core.save_statistics_as_csv(partial_name(job_name, job_name in partial),
+                                                             emoji_date_stats, args.output_dir))
+    elif args.format == "json":
+        data = {
+            job_name: {"이모티콘 포함 글 수": emoji_count, "전체 글 수": total_count, "날짜별": emoji_date_stats}
+            for job_name, (emoji_count, total_count, emoji_date_stats) in results.items()
+        }
+        for job_name, pages in partial.items():
+            data[job_name]["받지 못한 페이지"] = pages
+        name = partial_name(crawler_core.SWEEP_KEYWORD if args.all else "_".join(results), partial)
+        files.append(crawler_core.save_result_as_json(name, data, args.output_dir))
+    return files
+
+
+def run_date_mode(args, reporter):
+    results = {}
+    failed = []
+    partial = {}  # 받지 못한 페이지가 남은 직업 → 페이지 목록
+    # 이번에 크롤링한 글은 직업 하나를 엑셀로 저장할 때만 시트로 씀 (그 외에는 모으지 않음)
+    combined = args.all or len(args.classes) > 1
+    rows = RowTable() if args.format == "xlsx" and not combined else None
+    if args.all:
+        def on_error(job_name, error):
+            # 크롤링하지 못한 게시판은 결과에서 빠지므로 종료 코드로도 알림
+            print(f"[{job_name}] 크롤링 중 오류가 발생했습니다: {error}", file=sys.stderr)
+            failed.append(job_name)
+
+        with open_export(args, crawler_core.SWEEP_KEYWORD) as sink:
+            results = crawler_core.sweep_by_date(args.since, reporter, args.classes or None, sink=sink, rows=rows,
+                                                 on_error=on_error)
+        print_export(sink)
+    else:
+        for job_name in args.classes:
+            job_board_url = crawler_core.get_job_board_url(job_name)
+            if not job_board_url:
+                print(f"해당 직업의 게시판을 찾을 수 없습니다: {job_name}", file=sys.stderr)
+                failed.append(job_name)
+                continue
+            reporter.log(f"현재 검색한 직업: {job_name}")
+            try:
+                with open_export(args, job_name) as sink, open_details(args, job_board_url) as details:
+                    results[job_name] = crawler_core.crawl_by_date(job_board_url, args.since, reporter, sink=sink,
+                                                                          resume=args.resume, details=details,
+                                                                          rows=rows)
+            except crawler_core.IncompleteCrawlError as e:
+                # 받은 페이지까지의 결과는 일부라고 표시해서 출력하고 저장 (종료 코드는 1)
+                print(f"[{job_name}] {e}", file=sys.stderr)
+                results[job_name] = e.result
+                partial[job_name] = e.pages
+                failed.append(job_name)
+            except Exception as e:
+                print(f"[{job_name}] 크롤링 중 오류가 발생했습니다: {e}", file=sys.stderr)
+                failed.append(job_name)
+                continue
+            print_export(sink)
+            print_details(job_name, details)
+
+    for job_name, (emoji_count, total_count, _) in results.items():
+        mark = " (일부)" if job_name in partial else ""
+        print(f"[{job_name}]{mark} 전체 글 수: {total_count}, 이모티콘 포함 글 수: {emoji_count}")
+    if args.classify:
+        for job_name in results:
+            classifier = TitleClassifier()
+            crawler_core.classify_stored(crawler_core.get_job_board_url(job_name), args.since, classifier)
+            print(f"[{job_name}] 분류별 제목 수: {crawler_core.format_categories(classifier)}")
+    for file_name in save_date_results(results, args, rows, partial):
+        print(f"저장되었습니다: {file_name}")
+    return failed
+
+
+def run_page_mode(args, reporter):
+    first_page, last_page = args.pages
+    results = {}
+    failed = []
+    for job_name in args.classes:
+        job_board_url = crawler_core.get_job_board_url(job_name)
+        if not job_board_url:
+            print(f"해당 직업의 게시판을 찾을 수 없습니다: {job_name}", file=sys.stderr)
+            failed.append(job_name)
+            continue
+        classifier = TitleClassifier() if args.classify else None
+        missing = None
+        try:
+            with open_export(args, job_name) as sink, open_details(args, job_board_url) as details:
+                emoji_count, total_count = crawler_core.crawl_by_pages(
+                    job_board_url, last_page, reporter, first_page=first_page, sink=sink, classifier=classifier,
+                    resume=args.resume, details=details)
+        except crawler_core.IncompleteCrawlError as e:
+            # 받은 페이지까지의 결과는 일부라고 표시해서 출력하고 저장 (종료 코드는 1)
+            print(f"[{job_name}] {e}", file=sys.stderr)
+            (emoji_count, total_count), missing = e.result, e.pages
+            failed.append(job_name)
+        except Exception as e:
+            print(f"[{job_name}] 크롤링 중 오류가 발생했습니다: {e}", file=sys.stderr)
+            failed.append(job_name)
+            continue
+        print_export(sink)
+        print_details(job_name, details)
+        results[job_name] = {"페이지": f"{first_page}-{last_page}", "이모티콘 포함 글 수": emoji_count, "전체 글 수": total_count}
+        mark = ""
+        if missing:
+            results[job_name]["받지 못한 페이지"] = missing
+            mark = " (일부)"
+        print(f"[{job_name}]{mark} {first_page}-{last_page} 페이지 전체 글 수: {total_count}, "
+              f"이모티콘 포함 글 수: {emoji_count}")
+        if classifier is not None:
+            results[job_name]["분류"] = dict(classifier.totals)
+            print(f"[{job_name}] 분류별 제목 수: {crawler_core.format_categories(classifier)}")
+
+    if args.format == "json" and results:
+        name = partial_name("_".join(results), any("받지 못한 페이지" in result for result in results.values()))
+        print(f"저장되었습니다: {crawler_core.save_result_as_json(name, results, args.output_dir)}")
+    return failed
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.all and args.pages:
+        parser.error("--all은 --since와 함께 사용하세요.")
+    if args.all and args.details:
+        parser.error("--details는 직업 이름과 함께 사용하세요.")
+    if not args.all and not args.classes:
+        parser.error("직업 이름을 입력하거나 --all을 사용하세요.")
+    if args.pages and args.format not in ("json", "none"):
+        parser.error("페이지 모드는 json 형식으로만 저장할 수 있습니다.")
+    if args.pages and args.table:
+        parser.error("--table은 --since와 함께 사용하세요.")
+    if args.pages and args.boundary_search:
+        parser.error("--boundary-search는 --since와 함께 사용하세요.")
+
+    # 명령줄 옵션으로 설정을 덮어씀
+    overrides = {}
+    if args.workers:
+        overrides["MAX_CONNECTIONS_PER_HOST"] = args.workers
+        overrides["SWEEP_WORKERS"] = args.workers
+    if args.parse_processes is not None:
+        overrides["PARSE_PROCESSES"] = args.parse_processes
+        overrides["SWEEP_PARSE_PROCESSES"] = args.parse_processes
+    if args.boundary_search:
+        overrides["DATE_BOUNDARY_SEARCH"] = True
+    if args.no_cache:
+        overrides["HTTP_CACHE_ENABLED"] = False
+    if overrides:
+        inven_http.configure(**overrides)
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    reporter = ConsoleReporter(args.quiet)
+    run_mode = run_date_mode if args.since else run_page_mode
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    crawl_metrics.reset()
+    try:
+        if args.profile:
+            extension = "html" if args.profile == "pyinstrument" else "prof"
+            profile_path = os.path.join(args.output_dir, f"crawl_profile_{timestamp}.{extension}")
+            with crawl_metrics.profile(args.profile, profile_path):
+                failed = run_mode(args, reporter)
+            print(f"프로파일이 저장되었습니다: {profile_path}")
+        else:
+            failed = run_mode(args, reporter)
+    except KeyboardInterrupt:
+        print("크롤링이 취소되었습니다.", file=sys.stderr)
+        return 130
+    if args.metrics:
+        if not args.quiet:
+            print(crawl_metrics.format_summary())
+        metrics_path = crawl_metrics.save_summary(os.path.join(args.output_dir, f"crawl_metrics_{timestamp}.json"))
+        print(f"측정 결과가 저장되었습니다: {metrics_path}")
+    if settings.HTTP_CACHE_ENABLED and not args.quiet:
+        stats = http_cache.shared_cache().stats
+        print(f"HTTP 캐시: 새로 받음 {stats['downloaded']}, 바뀌지 않음(304) {stats['revalidated']}, "
+              f"저장본 사용 {stats['fresh']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    # 파싱 프로세스 풀이 실행 파일(PyInstaller)에서도 동작하도록 설정
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,371 @@
+# 크롤링, 통계, 저장 로직 (Qt 없이 GUI와 명령줄에서 같이 사용)
+#
+# reporter는 다음 메서드를 가진 객체 (crawl_worker.CrawlWorker, crawler_cli.ConsoleReporter)
+#   log(text)                                         진행 상황 한 줄
+#   report_page(page, emoji_count, total_count, job_name=None)
+#   report_dates(date_counts, job_name=None)          한 페이지에서 늘어난 날짜별 이모티콘 포함 글 수 (날짜 모드)
+#   is_cancelled()                                    True면 크롤링을 멈춤
+import csv
+import itertools
+import json
+import os
+from datetime import datetime
+import crawl_metrics
+import crawler_settings as settings
+from board_fetcher import iter_board_pages
+from board_index import shared_index
+from board_sweep import BoardSweep
+from crawl_resume import CrawlCheckpoint
+from date_boundary import iter_date_pages
+from date_counter import DateCounter
+from date_resolver import DateResolver
+from post_store import PostStore, board_key
+from result_sink import ResultSink
+from row_table import day_key
+
+DATE_EMOJI_MARKS = "●▅"    # 날짜 모드에서 이모티콘 포함 글로 세는 문자
+PAGE_EMOJI_PATTERN = r'[▅▇█]'  # 페이지 모드의 이모티콘 패턴
+SWEEP_KEYWORD = "전체"      # 직업 대신 입력하면 모든 직업 게시판을 함께 크롤링
+
+
+class IncompleteCrawlError(RuntimeError):
+    # 다시 시도한 뒤에도 받지 못한 페이지가 남았을 때 (result: 받은 페이지만 센 결과, 같은 형식)
+    def __init__(self, pages, result):
+        super().__init__(f"받지 못한 페이지가 있어 결과가 일부만 집계되었습니다: {pages}")
+        self.pages = pages
+        self.result = result
+
+
+def get_job_board_url(job_name):
+    # 메인 페이지 링크 목록은 캐시된 인덱스에서 찾음 (오래된 경우에만 다시 받음)
+    return shared_index().find(job_name)
+
+
+def _checkpoint_error_handler(checkpoint, reporter):
+    # 재시도 후에도 받지 못한 페이지는 건너뛰고 재시도 대기열에 넣음
+    def on_error(page, error):
+        reporter.log(f"{page} 페이지를 받지 못했습니다: {error}")
+        checkpoint.mark_failed(page, error)
+    return on_error
+
+
+def _log_resumed(checkpoint, reporter):
+    if checkpoint.is_resumed():
+        reporter.log(f"이전 크롤링을 이어서 합니다. (끝난 페이지 {len(checkpoint.done)}개, "
+                     f"다시 시도할 페이지 {len(checkpoint.failed)}개)")
+
+
+def _retry_failed(checkpoint, fetch_pages, reporter):
+    # 받지 못한 페이지를 CHECKPOINT_RETRY_ROUNDS번까지 다시 받아서 (page, rows)를 돌려줌
+    for _ in range(settings.CHECKPOINT_RETRY_ROUNDS):
+        pages = checkpoint.retry_pages()
+        if not pages or reporter.is_cancelled():
+            return
+        reporter.log(f"받지 못한 페이지 {len(pages)}개를 다시 시도합니다: {pages}")
+        yield from fetch_pages(pages)
+
+
+def _finish_checkpoint(checkpoint, reporter, complete):
+    # 끝까지 크롤링했으면 지우고, 아니면 --resume으로 이어서 할 수 있도록 남김
+    if complete and not checkpoint.failed:
+        checkpoint.remove()
+        return
+    checkpoint.save()
+    if checkpoint.failed:
+        reporter.log(f"받지 못한 페이지 {checkpoint.retry_pages()}는 다음에 이어서 크롤링할 수 있습니다.")
+
+
+def crawl_by_date(job_board_url, input_date, reporter, emoji_marks=DATE_EMOJI_MARKS, sink=None, resume=False,
+                  details=None, rows=None):
+    # (이모티콘 포함 글 수, 전체 글 수, 날짜별 이모티콘 포함 글 수)
+    # 다시 시도해도 받지 못한 페이지가 남으면 IncompleteCrawlError (취소한 경우는 제외)
+    # sink(result_sink.ResultSink)를 주면 새로 크롤링한 글을 받는 즉시 파일로 내보냄
+    # details(post_detail.PostDetailCrawler)를 주면 집계에 들어간 글의 본문도 받음
+    # (sink와 details는 새 글만 크롤링한 경우에도 저장소에 있는 기간 안의 글까지 받음)
+    # resume이면 같은 조건으로 중단된 크롤링의 진행 상황(crawl_resume.py)에서 이어서 함
+    # rows(row_table.RowTable)를 주면 이번에 집계한 글을 그 표에 모음
+    board = board_key(job_board_url)
+    emoji_pattern = f"[{emoji_marks}]"
+    checkpoint = CrawlCheckpoint.open(
+        f"{board}_since_{input_date}",
+        {"mode": "date", "url": job_board_url, "since": input_date, "emoji": emoji_pattern},
+        resume,
+    )
+    _log_resumed(checkpoint, reporter)
+    on_error = _checkpoint_error_handler(checkpoint, reporter)
+
+    def fetch_pages(pages, max_failures=None):
+        return iter_board_pages(job_board_url, emoji_pattern=emoji_pattern, pages=pages, on_error=on_error,
+                                max_failures=max_failures, is_cancelled=reporter.is_cancelled)
+
+    with PostStore() as store:
+        counter = DateCounter(store, job_board_url, input_date, emoji_marks, sink, rows)
+        counter.restore(checkpoint.aggregates)
+        if counter.incremental:
+            reporter.log(f"{counter.high_water}번 글 이후의 새 글만 크롤링합니다.")
+
+        # 여러 페이지를 동시에 요청하고 페이지 순서대로 결과를 받음
+        if counter.finished:
+            # 지난번에 끝까지 갔고 받지 못한 페이지만 남은 경우
+            first_round = ()
+        elif settings.DATE_BOUNDARY_SEARCH and not checkpoint.is_resumed():
+            first_round = iter_date_pages(job_board_url, counter.reaches_end, emoji_pattern, on_error=on_error,
+                                          is_cancelled=reporter.is_cancelled)
+        else:
+            # 끝 페이지를 모르므로 계속 받지 못하면 (서버 장애, 차단) 멈춤
+            first_round = fetch_pages(checkpoint.remaining(itertools.count(1)), settings.CHECKPOINT_MAX_FAILURES)
+
+        def add_page(page, rows):
+            reporter.log(f"{page} 페이지 크롤링 중")
+            if rows is None:
+                reporter.log("게시판 데이터를 찾을 수 없습니다.")
+
+            finished = counter.add_page(rows, page)
+            if details is not None:
+                details.submit(store, counter.page_numbers)
+            checkpoint.mark_done(page, **counter.aggregates())
+            reporter.report_page(page, counter.emoji_count, counter.total_count)
+            if counter.page_dates:
+                reporter.report_dates(counter.page_dates)
+            return finished
+
+        complete = False
+        try:
+            for page, rows in first_round:
+                if reporter.is_cancelled():
+                    break
+                if add_page(page, rows):
+                    break
+            # 끝까지 간 뒤 중간에 빠진 페이지를 채움 (끝난 뒤라서 add_page가 True여도 계속 진행)
+            for page, rows in _retry_failed(checkpoint, fetch_pages, reporter):
+                if reporter.is_cancelled():
+                    break
+                add_page(page, rows)
+            if reporter.is_cancelled():
+                reporter.log("크롤링이 취소되었습니다.")
+            complete = counter.finished and not reporter.is_cancelled()
+        finally:
+            _finish_checkpoint(checkpoint, reporter, complete)
+
+        if complete and not checkpoint.failed and (sink is not None or details is not None):
+            # 새 글만 받았어도 내보내기와 본문은 기간 안의 글 전체를 대상으로 함 (본문은 없는 글만 받음)
+            stored_count = counter.add_stored(details)
+            if stored_count:
+                reporter.log(f"이전 크롤링에서 저장한 글 {stored_count}개도 내보내기/본문 받기에 넣었습니다.")
+
+        if checkpoint.failed:
+            # 빠진 페이지가 있으면 크롤링 지점을 옮기지 않고, 이번에 센 결과는 에러에 담아 일부임을 알림
+            counter.finished = False
+            if not reporter.is_cancelled():
+                raise IncompleteCrawlError(checkpoint.retry_pages(), counter.result())
+        return counter.result()
+
+
+def crawl_by_pages(job_board_url, num_pages, reporter, emoji_pattern=PAGE_EMOJI_PATTERN, first_page=1, sink=None,
+                   classifier=None, resume=False, details=None):
+    # first_page ~ num_pages 페이지의 (이모티콘 포함 글 수, 전체 글 수)
+    # 다시 시도해도 받지 못한 페이지가 남으면 IncompleteCrawlError (취소한 경우는 제외)
+    # sink(result_sink.ResultSink)를 주면 글을 받는 즉시 파일로 내보냄
+    # details(post_detail.PostDetailCrawler)를 주면 글의 본문도 받음
+    # classifier(title_classifier.TitleClassifier)를 주면 페이지마다 제목을 분류해서 classifier.totals에 누적
+    # resume이면 같은 조건으로 중단된 크롤링의 진행 상황(crawl_resume.py)에서 이어서 함
+    board = board_key(job_board_url)
+    checkpoint = CrawlCheckpoint.open(
+        f"{board}_pages_{first_page}-{num_pages}",
+        {"mode": "pages", "url": job_board_url, "pages": [first_page, num_pages], "emoji": emoji_pattern},
+        resume,
+    )
+    _log_resumed(checkpoint, reporter)
+    on_error = _checkpoint_error_handler(checkpoint, reporter)
+
+    emoji_count = checkpoint.aggregates.get("emoji_count", 0)
+    total_count = checkpoint.aggregates.get("total_count", 0)  # 전체 글 개수 초기화
+    if classifier is not None:
+        classifier.totals.update(checkpoint.aggregates.get("categories", {}))
+    resolver = DateResolver()  # 저장소에 넣을 글의 날짜 (연도는 글 번호 순서로 정함)
+
+    def fetch_pages(pages):
+        # 여러 페이지를 동시에 요청하고 페이지 순서대로 결과를 받음
+        # 정해진 페이지 범위만 세므로 깊은 페이지는 저장해 둔 응답을 잠시 동안 그대로 씀
+        return iter_board_pages(job_board_url, emoji_pattern=emoji_pattern, pages=pages, on_error=on_error,
+                                is_cancelled=reporter.is_cancelled, allow_stale=True)
+
+    with PostStore() as store:
+        complete = False
+        try:
+            first_round = fetch_pages(checkpoint.remaining(range(first_page, num_pages + 1)))
+            for page, rows in itertools.chain(first_round, _retry_failed(checkpoint, fetch_pages, reporter)):
+                if reporter.is_cancelled():
+                    break
+                reporter.log(f"-----{page} 페이지 크롤링 중 -----")
+
+                # 각 행에서 번호, 제목, 작성자, 이모티콘 포함 여부 확인
+                page_rows = []
+                sink_rows = []
+                for row, day in zip(rows or [], resolver.resolve_rows(rows)):
+                    # 전체 글 개수 증가
+                    total_count += 1
+
+                    # 이모티콘이 포함된 제목인지 확인
+                    if row.emoji:
+                        reporter.log(f"글 번호: {row.num} | 작성자: {row.author}\n제목: {row.title}")
+                        emoji_count += 1
+
+                    # 저장소에 남길 글 (번호와 날짜를 알 수 있는 글만)
+                    if day is None:
+                        continue
+                    date_key = day_key(day)
+                    if row.num.isdigit():
+                        page_rows.append((int(row.num), row.title, row.author, date_key))
+                        sink_rows.append((int(row.num), row.title, row.author, date_key, row.emoji))
+
+                if classifier is not None and rows:
+                    classifier.add_titles([row.title for row in rows])
+
+                # 한 페이지씩 묶어서 저장
+                with crawl_metrics.timed("store"):
+                    store.add_rows(board, page_rows)
+                if details is not None:
+                    details.submit(store, [row[0] for row in page_rows])
+                if sink is not None:
+                    sink.write_rows(board, page, sink_rows)
+                checkpoint.mark_done(page, emoji_count=emoji_count, total_count=total_count,
+                                     categories=dict(classifier.totals) if classifier is not None else {})
+                reporter.log("\n")
+                reporter.report_page(page, emoji_count, total_count)
+            if reporter.is_cancelled():
+                reporter.log("크롤링이 취소되었습니다.")
+            complete = not reporter.is_cancelled()
+        finally:
+            _finish_checkpoint(checkpoint, reporter, complete)
+
+    if checkpoint.failed and not reporter.is_cancelled():
+        raise IncompleteCrawlError(checkpoint.retry_pages(), (emoji_count, total_count))
+
+    # 최종 크롤링 결과 출력
+    reporter.log("========== 크롤링 완료 ==========")
+    reporter.log(f"이모티콘 포함 글 개수: {emoji_count}, 전체 글 개수: {total_count}")
+    if classifier is not None:
+        reporter.log(f"분류별 제목 수: {format_categories(classifier)}")
+    return emoji_count, total_count
+
+
+def classify_stored(job_board_url, since, classifier):
+    # 저장소에 있는 since 이후 글의 제목을 분류 (날짜 모드는 이전 크롤링 결과도 포함하므로 저장소에서 셈)
+    with PostStore() as store:
+        for titles in store.iter_titles(board_key(job_board_url), since):
+            classifier.add_titles(titles)
+    return classifier.totals
+
+
+def format_categories(classifier):
+    # 예: "이모티콘 12, 불만 3, 긍정 0, 질문 5"
+    return ", ".join(f"{name} {classifier.totals[name]}" for name in classifier.names)
+
+
+def sweep_by_date(input_date, reporter, class_names=None, emoji_marks=DATE_EMOJI_MARKS, sink=None, rows=None,
+                  on_error=None, mark_prefix=""):
+    # 직업 이름 → crawl_by_date와 같은 형식의 결과
+    # on_error(직업 이름, 예외)를 주면 크롤링하지 못한 게시판을 로그 대신 그쪽으로 알려줌
+    # mark_prefix를 주면 그 이름으로 따로 둔 크롤링 지점부터 크롤링 (date_counter.DateCounter)
+    boards = shared_index().class_boards(class_names)
+    reporter.log(f"직업 게시판 {len(boards)}개를 함께 크롤링합니다: {', '.join(boards)}")
+
+    def on_page(job_name, page, emoji_count, total_count, date_counts):
+        reporter.log(f"[{job_name}] {page} 페이지 크롤링 중")
+        reporter.report_page(page, emoji_count, total_count, job_name)
+        if date_counts:
+            # 모든 게시판을 합친 날짜별 그래프
+            reporter.report_dates(date_counts)
+
+    def log_error(job_name, error):
+        reporter.log(f"[{job_name}] 크롤링 중 오류가 발생했습니다: {error}")
+
+    def log_retry(job_name, page, error):
+        reporter.log(f"[{job_name}] {page} 페이지를 받지 못해 다시 시도합니다: {error}")
+
+    sweep = BoardSweep(boards, input_date, emoji_marks, mark_prefix=mark_prefix)
+    with PostStore() as store:
+        return sweep.run(store, on_page, reporter.is_cancelled, on_error or log_error, sink, rows, log_retry)
+
+
+def open_result_sink(job_name, file_format="csv", output_dir="."):
+    # 예: 인파이터_게시글_20250101_153000.csv
+    stamp = datetime.today().strftime("%Y%m%d_%H%M%S")
+    return ResultSink(os.path.join(output_dir, f"{job_name}_게시글_{stamp}.{file_format}"))
+
+
+def _output_path(output_dir, job_name, extension):
+    # 예: 인파이터_이모지_통계_20250101.xlsx
+    today_date = datetime.today().strftime("%Y%m%d")
+    return os.path.join(output_dir, f"{job_name}_이모지_통계_{today_date}.{extension}")
+
+
+def save_statistics_as_excel(job_name, emoji_date_stats, output_dir=".", rows=None, board=None):
+    # rows(row_table.RowTable)를 주면 이번에 크롤링한 글의 날짜별 전체 글 수와 비율 시트를 추가 (board: 그 게시판만)
+    import pandas as pd  # 저장할 때만 필요
+
+    # 날짜별 이모지 포함 글 개수를 데이터프레임으로 생성
+    data = {
+        "날짜": list(emoji_date_stats.keys()),
+        "이모지 포함 글 개수": list(emoji_date_stats.values())
+    }
+    df = pd.DataFrame(data)
+
+    # 현재 날짜와 직업 이름을 포함한 파일명 생성
+    file_name = _output_path(output_dir, job_name, "xlsx")
+
+    # 엑셀 파일로 저장
+    with pd.ExcelWriter(file_name, engine="xlsxwriter") as writer:
+        df.to_excel(writer, index=False, sheet_name="통계")
+        worksheet = writer.sheets["통계"]
+
+        # 차트 추가
+        chart = writer.book.add_chart({"type": "column"})
+        chart.add_series({
+            "name": "이모지 포함 글 개수",
+            "categories": "=통계!A2:A{}".format(len(emoji_date_stats) + 1),
+            "values": "=통계!B2:B{}".format(len(emoji_date_stats) + 1),
+        })
+        chart.set_title({"name": "날짜별 이모지 포함 글 개수 통계"})
+        chart.set_x_axis({"name": "날짜"})
+        chart.set_y_axis({"name": "이모지 포함 글 개수"})
+
+        worksheet.insert_chart("D2", chart)
+
+        if rows is not None and len(rows):
+            rows.date_frame(board).to_excel(writer, index=False, sheet_name="이번 크롤링")
+
+    return file_name
+
+
+def save_report(results, name, output_dir=".", since=None, formats=("xlsx",)):
+    # 여러 직업의 결과를 형식마다 파일 하나로 저장 (report_builder.py), 저장한 파일 목록을 돌려줌
+    # 예: 전체_이모지_통계_20250101.xlsx (요약, 날짜별 표, 직업별 시트와 차트), 전체_이모지_통계_20250101.parquet
+    # since를 주면 저장소에서 날짜별 전체 글 수와 비율도 넣음
+    import report_builder  # 저장할 때만 필요
+
+    boards = {job_name: get_job_board_url(job_name) for job_name in results}
+    output_path = os.path.splitext(_output_path(output_dir, name, "xlsx"))[0]
+    return report_builder.build_report(results, output_path, formats, boards, since, DATE_EMOJI_MARKS)
+
+
+def save_sweep_as_excel(results, output_dir=".", since=None):
+    return save_report(results, SWEEP_KEYWORD, output_dir, since)[0]
+
+
+def save_statistics_as_csv(job_name, emoji_date_stats, output_dir="."):
+    file_name = _output_path(output_dir, job_name, "csv")
+    # 엑셀에서 한글이 깨지지 않도록 BOM을 붙여서 저장
+    with open(file_name, "w", encoding="utf-8-sig", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(["날짜", "이모지 포함 글 개수"])
+        writer.writerows(emoji_date_stats.items())
+    return file_name
+
+
+def save_result_as_json(job_name, result, output_dir="."):
+    file_name = _output_path(output_dir, job_name, "json")
+    with open(file_name, "w", encoding="utf-8") as file:
+        json.dump(result, file, ensure_ascii=False, indent=2)
+    return file_name
@@ -0,0 +1,101 @@
+# 크롤러 공통 설정
+
+# HTTP 요청 설정
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+CONNECT_TIMEOUT = 5      # 연결 제한 시간 (초)
+READ_TIMEOUT = 15        # 응답 제한 시간 (초)
+MAX_HOSTS = 4            # 연결 풀을 유지할 호스트 수
+MAX_CONNECTIONS_PER_HOST = 8
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5      # 재시도 간격 = RETRY_BACKOFF * 2^(재시도 횟수 - 1)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# 호스트별 요청 제한 (rate_limiter.py)
+# rate: 초당 요청 수 (None이면 제한 없음), burst: 한 번에 몰아서 보낼 수 있는 요청 수
+# max_concurrency: 동시 요청 상한 (None이면 MAX_CONNECTIONS_PER_HOST), 응답 상태에 따라 min_concurrency까지 줄어듦
+DEFAULT_HOST_LIMIT = {"rate": 10.0, "burst": 10, "max_concurrency": None, "min_concurrency": 1}
+HOST_LIMITS = {
+    # 예: "www.inven.co.kr": {"rate": 5.0, "max_concurrency": 4},
+}
+SLOW_RESPONSE = 5.0      # 이보다 오래 걸린 응답은 혼잡 신호로 보고 동시 요청 수를 줄임 (초)
+
+# 로스트아크 인벤 주소
+MAIN_URL = "https://lostark.inven.co.kr/"
+BASE_URL = "https://www.inven.co.kr"  # 링크의 베이스 URL
+
+# 캐시, 상태 파일을 저장하는 폴더
+DATA_DIR = "crawler_data"
+BOARD_INDEX_TTL = 24 * 60 * 60  # 직업 → 게시판 URL 목록을 다시 받는 주기 (초)
+BOARD_INDEX_RETRY = 10 * 60     # 다시 받지 못했을 때 저장해 둔 목록을 쓰다가 다시 시도하는 간격 (초)
+
+# 게시글 저장소에 기록하는 이모티콘 문자 (각 프로그램은 이 중 일부로 집계)
+EMOJI_MARKS = "●▄▅▆▇█"
+
+# 제목 분류 (분류 이름 → 키워드 목록 또는 정규식 문자열), title_classifier.py에서 한 번에 셈
+TITLE_CATEGORIES = {
+    "이모티콘": list(EMOJI_MARKS),
+    "불만": ["너프", "하향", "개선", "버그", "접습니다", "접음", "억까"],
+    "긍정": ["상향", "버프", "좋아요", "감사", "만족"],
+    "질문": ["질문", "궁금", "어떻게", "?"],
+}
+
+# 게시판 목록 파서 ("selectolax", "lxml", "html.parser", None이면 설치된 것 중 가장 빠른 것)
+PARSER_BACKEND = None
+
+# 파싱을 나눠 맡을 프로세스 수 (0이면 페이지를 받은 스레드에서 바로 파싱)
+PARSE_PROCESSES = 0
+SWEEP_PARSE_PROCESSES = None  # 모든 직업을 함께 크롤링할 때 (None이면 CPU 코어 수, parse_pool.sweep_processes)
+
+# 날짜 모드에서 경계 페이지를 먼저 찾고 그 앞 페이지를 한꺼번에 받음 (date_boundary.py)
+# False면 1페이지부터 동시 요청 수만큼 미리 받아 가며 차례로 진행 (모의 서버에서는 이쪽이 조금 더 빠름)
+DATE_BOUNDARY_SEARCH = False
+
+# 게시판 페이지 HTTP 캐시 (http_cache.py, DATA_DIR/http_cache.db에 압축해서 저장)
+# 저장해 둔 페이지는 ETag/Last-Modified로 조건부 요청을 보내서 바뀌지 않았으면 다시 받지 않음
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_STABLE_PAGE = 50          # 페이지 모드에서 이 페이지부터는 HTTP_CACHE_MAX_AGE 안에 받은 응답을 요청 없이 씀
+HTTP_CACHE_MAX_AGE = 60 * 60         # (초) 새 글이 올라오면 목록이 뒤로 밀리므로 정확한 집계가 필요하면 0
+HTTP_CACHE_RETENTION = 7 * 24 * 60 * 60  # 이보다 오래 확인하지 않은 응답은 지움 (초)
+
+# 게시글 본문 크롤링 (post_detail.py, 명령줄의 --details)
+DETAIL_WORKERS = 4       # 본문을 동시에 받는 스레드 수
+DETAIL_QUEUE_SIZE = 200  # 받을 차례를 기다리는 글 번호 수 (차 있으면 목록 크롤링이 기다림)
+# 글 페이지에서 본문과 댓글 수를 찾는 CSS 선택자 (인벤 글 페이지 구조가 바뀌면 여기만 고침)
+POST_BODY_SELECTOR = "#powerbbsContent"
+POST_COMMENT_COUNT_SELECTOR = ".articleBottomMenu .cmtnum"
+
+# 단계별 시간과 개수 측정 (crawl_metrics.py, 명령줄의 --metrics/--profile)
+METRICS_ENABLED = True
+METRICS_KEEP_FILES = 20  # GUI가 DATA_DIR/metrics에 저장한 측정 결과 중 최근 몇 개만 남길지
+
+# 여러 직업 결과를 파일 하나로 저장 (report_builder.py)
+REPORT_WORKERS = 4                   # 직업별 시트 내용을 동시에 준비하는 스레드 수
+REPORT_CONSTANT_MEMORY_ROWS = 20000  # 모든 시트의 행이 이보다 많으면 xlsxwriter constant_memory 모드로 저장
+
+# 주기적으로 직업 게시판을 확인하는 모니터 (crawl_monitor.py, DATA_DIR/monitor.db에 저장)
+MONITOR_INTERVAL = 60 * 60    # 확인 간격 (초), 확인할 때마다 새 글이 있는 페이지만 받음
+MONITOR_LOOKBACK_DAYS = 7     # 처음 확인할 때 거슬러 올라갈 일 수
+# 시계열을 묶는 단위와 보관 기간 (초): 원본(0)은 이틀, 시간별은 30일, 일별은 2년
+MONITOR_TIERS = (
+    (0, 2 * 24 * 60 * 60),
+    (60 * 60, 30 * 24 * 60 * 60),
+    (24 * 60 * 60, 2 * 365 * 24 * 60 * 60),
+)
+
+# 긴 크롤링의 진행 상황 저장 (crawl_resume.py, DATA_DIR/checkpoints에 저장)
+CHECKPOINT_EVERY_PAGES = 10  # 이만큼 페이지를 끝낼 때마다 저장
+CHECKPOINT_INTERVAL = 30     # 또는 마지막 저장 후 이만큼 지나면 저장 (초)
+CHECKPOINT_RETRY_ROUNDS = 2  # 크롤링이 끝난 뒤 실패한 페이지를 다시 시도하는 횟수
+CHECKPOINT_MAX_FAILURES = 10  # 날짜 모드는 끝 페이지를 모르므로 연속으로 이만큼 받지 못하면 크롤링을 멈춤
+
+# 전체 직업 크롤링 (게시판 목록에서 이 이름들을 찾아서 크롤링)
+LOSTARK_CLASSES = (
+    "버서커", "디스트로이어", "워로드", "홀리나이트", "슬레이어", "발키리",
+    "배틀마스터", "인파이터", "기공사", "창술사", "스트라이커", "브레이커",
+    "데빌헌터", "블래스터", "호크아이", "스카우터", "건슬링어",
+    "바드", "서머너", "아르카나", "소서리스",
+    "블레이드", "데모닉", "리퍼", "소울이터",
+    "도화가", "기상술사", "환수사",
+    "가디언나이트",
+)
+SWEEP_WORKERS = 8           # 모든 게시판을 합쳐서 동시에 요청하는 페이지 수
@@ -0,0 +1,104 @@
+# 날짜 모드에서 집계가 끝나는 페이지(경계 페이지)를 먼저 찾는 모듈
+# 1, 2, 4, 8, ... 페이지를 확인해 경계가 있는 구간을 찾고 그 구간을 나눠 가며 좁힘
+# (순서대로 기다려야 하는 요청이 페이지 수가 아니라 log(페이지 수)번으로 줄고, 경계까지는 한꺼번에 동시에 받을 수 있음)
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import crawler_settings as settings
+from board_fetcher import fetch_rows, iter_board_pages
+from parse_pool import shared_pool
+
+
+def find_boundary_page(fetch, reaches_end, workers=None, on_error=None, is_cancelled=None):
+    # fetch(page) → rows, reaches_end(rows) → 그 페이지에서 집계가 끝나면 True
+    # (경계 페이지 번호, 확인하면서 받은 {페이지: rows}) 를 돌려줌
+    # 한 번에 workers개 페이지를 동시에 확인하므로 순서대로 기다리는 횟수는 log(페이지 수)에 비례
+    # on_error(page, error)를 주면 받지 못한 페이지는 모르는 페이지로 두고 나머지로 찾음 (없으면 예외를 그대로 던짐)
+    # 받지 못해서 경계를 좁히지 못하면 그때까지 찾은 경계를, 끝나는 페이지를 하나도 찾지 못하면 None을 돌려줌
+    if workers is None:
+        workers = settings.MAX_CONNECTIONS_PER_HOST
+    probed = {}
+    failed = set()
+    low, high = 0, None  # low 페이지까지는 집계가 끝나지 않음, high 페이지에서는 끝남
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        def probe(pages):
+            # 새로 알게 된 것이 있으면 True
+            nonlocal low, high
+            new_pages = [page for page in pages if page not in probed and page not in failed]
+            futures = [(page, executor.submit(fetch, page)) for page in new_pages]
+            for page, future in futures:
+                try:
+                    probed[page] = future.result()
+                except Exception as error:
+                    if on_error is None:
+                        raise
+                    on_error(page, error)
+                    failed.add(page)
+            known = (low, high)
+            for page in pages:
+                if page not in probed:
+                    continue
+                if reaches_end(probed[page]):
+                    high = page
+                    break
+                low = page
+            return (low, high) != known
+
+        def stopped():
+            return is_cancelled is not None and is_cancelled()
+
+        # 1, 2, 4, 8, ... 페이지를 확인해 경계가 있는 구간을 찾음
+        first = 1
+        while high is None:
+            if stopped() or not probe([first << i for i in range(workers)]):
+                return None, probed
+            first = low * 2
+
+        # 구간을 workers + 1 등분한 페이지를 확인해 구간을 좁힘
+        while high - low > 1:
+            span = high - low
+            pages = sorted({low + span * (i + 1) // (workers + 1) for i in range(workers)} - {low, high} - failed)
+            if stopped() or not pages or not probe(pages):
+                break  # high는 여전히 끝나는 페이지이므로 조금 더 받을 뿐 결과는 같음
+    return high, probed
+
+
+def iter_date_pages(job_board_url, reaches_end, emoji_pattern=None, parse_pool=None, on_error=None, is_cancelled=None):
+    # iter_board_pages와 같은 (page, rows)를 페이지 순서대로 돌려줌
+    # 경계 페이지까지는 동시에 받고, 탐색하는 동안 새 글이 올라와 경계가 뒤로 밀렸으면
+    # 호출한 쪽이 멈출 때까지 다음 페이지를 계속 받음
+    # on_error, is_cancelled는 iter_board_pages와 같음 (받지 못한 페이지는 건너뛰고 알려줌)
+    if parse_pool is None:
+        parse_pool = shared_pool()
+
+    def fetch(page):
+        return fetch_rows(job_board_url, page, emoji_pattern, parse_pool)
+
+    def fetch_pages(pages, max_failures=None):
+        return iter_board_pages(job_board_url, emoji_pattern=emoji_pattern, parse_pool=parse_pool, pages=pages,
+                                on_error=on_error, max_failures=max_failures, is_cancelled=is_cancelled)
+
+    boundary, probed = find_boundary_page(fetch, reaches_end, on_error=on_error, is_cancelled=is_cancelled)
+    if boundary is None:
+        # 경계를 찾지 못했으면 1페이지부터 차례로 받음 (끝 페이지를 모르므로 계속 받지 못하면 멈춤)
+        pages, max_failures = itertools.count(1), settings.CHECKPOINT_MAX_FAILURES
+    else:
+        pages, max_failures = range(1, boundary + 1), None
+    ready = deque(sorted(page for page in probed if boundary is None or page <= boundary))
+    skip = set(ready)
+
+    # 확인할 때 받은 페이지와 새로 받은 페이지를 번호 순서대로 섞음 (받지 못한 페이지는 빠짐)
+    fetched = fetch_pages((page for page in pages if page not in skip), max_failures)
+    try:
+        for page, rows in itertools.chain(fetched, [(None, None)]):
+            while ready and (page is None or ready[0] < page):
+                probed_page = ready.popleft()
+                yield probed_page, probed.pop(probed_page)
+            if page is not None:
+                yield page, rows
+    finally:
+        fetched.close()
+
+    if boundary is not None:
+        yield from fetch_pages(itertools.count(boundary + 1), settings.CHECKPOINT_MAX_FAILURES)
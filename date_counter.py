@@ -0,0 +1,140 @@
+# 한 게시판의 날짜 모드 집계
+# 페이지 순서대로 행을 넣으면 input_date 이전 글이나 지난번 크롤링 지점에 도달했을 때 멈춤
+from collections import Counter, defaultdict
+import crawl_metrics
+from date_resolver import DateResolver
+from post_store import board_key
+from row_table import RowTable, day_ordinal
+
+
+class DateCounter:
+    def __init__(self, store, job_board_url, input_date, emoji_marks, sink=None, rows=None, mark_prefix=""):
+        self.store = store
+        self.sink = sink  # result_sink.ResultSink, 집계에 들어간 글을 바로 내보냄
+        # 집계에 들어간 글을 모을 표 (row_table.RowTable, 여러 게시판이 같은 표를 같이 써도 됨)
+        # 없으면 페이지마다 임시 표로 세고 버림 (긴 크롤링에서도 메모리가 늘지 않도록)
+        self.rows = rows
+        self.board = board_key(job_board_url)
+        self.input_date = input_date
+        self.input_day = day_ordinal(input_date)
+        self.emoji_marks = emoji_marks
+        self.resolver = DateResolver()  # 게시판에 표시된 날짜("MM-DD", "HH:MM") → 날짜 순번 (연도는 글 순서로 정함)
+
+        # 지난 크롤링이 input_date 이후를 이미 포함하면 그때 본 글 번호까지만 크롤링
+        # mark_prefix를 주면 다른 크롤링과 따로 크롤링 지점을 둠 (다른 크롤링이 받아 간 글도 다시 셈)
+        self.mark_key = mark_prefix + self.board
+        self.high_water, self.since = store.get_mark(self.mark_key)
+        self.incremental = bool(self.high_water) and self.since is not None and self.since <= input_date
+        self.new_high_water = self.high_water
+
+        self.emoji_count = 0
+        self.total_count = 0
+        self.emoji_date_stats = defaultdict(int)
+        self.finished = False
+        self.page_numbers = []
+        self.page_dates = Counter()  # 마지막으로 넣은 페이지의 날짜별 이모티콘 포함 글 수
+
+    def reaches_end(self, rows):
+        # 이 페이지에서 집계가 끝나는지 확인만 함 (행을 세거나 저장하지 않음)
+        # 게시판은 최신 글부터 나오므로 날짜를 알 수 있는 마지막 글만 보면 됨
+        if not rows:
+            return True
+        days = self.resolver.resolve_rows(rows)
+        for row, day in zip(reversed(rows), reversed(days)):
+            post_number = int(row.num) if row.num.isdigit() else 0
+            if self.incremental and post_number and post_number <= self.high_water:
+                return True
+            if day is not None:
+                return day < self.input_day
+        return False
+
+    def add_page(self, rows, page=0):
+        # 더 크롤링할 필요가 없으면 True (게시판 표가 없거나 글이 없는 페이지는 마지막 페이지 뒤)
+        self.page_dates = Counter()
+        if not rows:
+            self.finished = True
+            return True
+
+        table = self.rows if self.rows is not None else RowTable()
+        start = len(table)
+        for row, day in zip(rows, self.resolver.resolve_rows(rows)):
+            post_number = int(row.num) if row.num.isdigit() else 0
+            # 지난번에 이미 저장한 글에 도달하면 종료
+            if self.incremental and post_number and post_number <= self.high_water:
+                self.finished = True
+                break
+
+            if day is None:
+                continue
+            if day < self.input_day:
+                self.finished = True
+                break
+
+            if post_number:
+                self.new_high_water = max(self.new_high_water, post_number)
+            table.append(self.board, post_number, row.title, row.author, day, row.emoji)
+
+        # 날짜별 집계는 행마다가 아니라 페이지마다 한 번
+        self.page_dates = Counter(table.date_counts(start))
+        for date_key, count in self.page_dates.items():
+            self.emoji_date_stats[date_key] += count
+        self.emoji_count += sum(self.page_dates.values())
+        self.total_count += len(table) - start
+
+        # 한 페이지씩 묶어서 저장 (글 번호가 없는 행은 집계에만 들어감)
+        sink_rows = [record[1:] for record in table.records(start) if record[1]]
+        page_rows = [record[:4] for record in sink_rows]
+        self.page_numbers = [row[0] for row in page_rows]  # 이 페이지에서 집계에 들어간 글 번호
+        with crawl_metrics.timed("store"):
+            self.store.add_rows(self.board, page_rows)
+        if self.sink is not None:
+            self.sink.write_rows(self.board, page, sink_rows)
+        return self.finished
+
+    def add_stored(self, details=None):
+        # 증분 크롤링에서 건너뛴 글(지난번에 저장한 input_date 이후 글)도 sink와 details(post_detail.PostDetailCrawler)로 보냄
+        # 끝까지 크롤링한 뒤에 부름, 보낸 글 수를 돌려줌 (sink의 page는 None)
+        if not self.incremental:
+            return 0
+        count = 0
+        for posts in self.store.iter_posts(self.board, self.input_date, self.high_water):
+            if self.sink is not None:
+                self.sink.write_rows(self.board, None, [
+                    (num, title, author, date, any(mark in marks for mark in self.emoji_marks))
+                    for num, title, author, date, marks in posts
+                ])
+            if details is not None:
+                details.submit(self.store, [post[0] for post in posts])
+            count += len(posts)
+        return count
+
+    def aggregates(self):
+        # crawl_resume.CrawlCheckpoint에 저장할 중간 집계
+        return {
+            "emoji_count": self.emoji_count,
+            "total_count": self.total_count,
+            "emoji_date_stats": dict(self.emoji_date_stats),
+            "new_high_water": self.new_high_water,
+            "finished": self.finished,
+        }
+
+    def restore(self, aggregates):
+        # 저장해 둔 중간 집계에서 이어서 셈
+        self.emoji_count = aggregates.get("emoji_count", 0)
+        self.total_count = aggregates.get("total_count", 0)
+        self.emoji_date_stats.update(aggregates.get("emoji_date_stats", {}))
+        self.new_high_water = max(self.new_high_water, aggregates.get("new_high_water", 0))
+        self.finished = aggregates.get("finished", False)
+
+    def result(self):
+        # (이모티콘 포함 글 수, 전체 글 수, 날짜별 이모티콘 포함 글 수)
+        if not self.finished:
+            # 중간에 멈춘 경우 크롤링 지점을 건드리지 않고 이번에 센 결과만 돌려줌
+            return self.emoji_count, self.total_count, self.emoji_date_stats
+
+        self.store.set_mark(self.mark_key, self.new_high_water, self.since if self.incremental else self.input_date)
+        # 통계는 저장소에서 쿼리로 계산 (이전 크롤링 결과 포함)
+        emoji_count, total_count = self.store.count_posts(self.board, self.input_date, self.emoji_marks)
+        date_stats = self.store.date_stats(self.board, self.input_date, self.emoji_marks)
+        emoji_date_stats = {date: stats[0] for date, stats in date_stats.items() if stats[0]}
+        return emoji_count, total_count, emoji_date_stats
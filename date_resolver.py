@@ -0,0 +1,111 @@
+# 게시판 목록의 날짜 칸을 날짜 순번(date.toordinal())으로 바꾸는 모듈
+# 목록에는 오늘 글은 "HH:MM", 그 전 글은 연도 없이 "MM-DD"로 나옴
+# 글 번호가 클수록 나중에 쓴 글이므로, "MM-DD"는 그보다 번호가 큰 글의 날짜(없으면 오늘) 이전 중 가장 가까운 날로 봄
+#   예: 1월 2일에 크롤링하면 "12-31"은 작년 12월 31일, 그 뒤로 나오는 "01-05"는 작년 1월 5일
+# 이미 해석한 날짜는 기억해 두므로 같은 날 글이 많아도 한 번만 계산함
+import re
+from bisect import bisect_left, insort
+from datetime import date
+
+_MONTH_DAY = re.compile(r"(\d{1,2})-(\d{1,2})$")
+_FULL_DATE = re.compile(r"(\d{2}|\d{4})[-.](\d{1,2})[-.](\d{1,2})$")  # 연도가 붙어 나오는 경우 (예: 2024-12-31, 24.12.31)
+_TIME = re.compile(r"\d{1,2}:\d{2}$")
+
+
+def _latest_on_or_before(month, day, bound):
+    # bound(날짜 순번) 이전 중 month월 day일인 가장 가까운 날, 그런 날이 없는 문자열이면 None
+    year = date.fromordinal(bound).year
+    for offset in range(5):  # 2월 29일은 최대 4년 전까지 찾아봄
+        try:
+            candidate = date(year - offset, month, day).toordinal()
+        except ValueError:
+            if month == 2 and day == 29:
+                continue
+            return None
+        if candidate <= bound:
+            return candidate
+    return None
+
+
+class DateResolver:
+    def __init__(self, today=None):
+        # today: 크롤링을 시작한 날 ("HH:MM" 글의 날짜)
+        self.today = (today or date.today()).toordinal()
+        self.numbers = []   # 날짜를 아는 글 번호 (오름차순, 페이지마다 처음과 마지막 글만)
+        self.anchors = {}   # 글 번호 → 날짜 순번
+        self.parsed = {}    # 날짜 문자열 → ("time",) / ("day", 월, 일) / ("full", 순번) / None
+        self.resolved = {}  # (날짜 문자열, 기준 날짜) → 날짜 순번
+
+    def _parse(self, date_str):
+        parsed = self.parsed.get(date_str, False)
+        if parsed is not False:
+            return parsed
+        text = date_str.strip()
+        parsed = None
+        if _TIME.match(text):
+            parsed = ("time",)
+        elif _MONTH_DAY.match(text):
+            month, day = _MONTH_DAY.match(text).groups()
+            parsed = ("day", int(month), int(day))
+        elif _FULL_DATE.match(text):
+            year, month, day = (int(part) for part in _FULL_DATE.match(text).groups())
+            try:
+                parsed = ("full", date(year + 2000 if year < 100 else year, month, day).toordinal())
+            except ValueError:
+                parsed = None
+        self.parsed[date_str] = parsed
+        return parsed
+
+    def _bound(self, post_number):
+        # 번호가 post_number 이상인 글 중 가장 가까운 글의 날짜, 모르면 오늘
+        if post_number:
+            index = bisect_left(self.numbers, post_number)
+            if index < len(self.numbers):
+                return self.anchors[self.numbers[index]]
+        return self.today
+
+    def resolve(self, date_str, bound=None):
+        # 날짜 순번, 알 수 없는 형식이면 None (bound: 이 글보다 나중에 쓴 글의 날짜)
+        parsed = self._parse(date_str) if date_str else None
+        if parsed is None:
+            return None
+        if parsed[0] == "time":
+            return self.today
+        if parsed[0] == "full":
+            return parsed[1]
+        bound = self.today if bound is None else bound
+        key = (date_str, bound)
+        if key not in self.resolved:
+            self.resolved[key] = _latest_on_or_before(parsed[1], parsed[2], bound)
+        return self.resolved[key]
+
+    def _remember(self, post_number, day):
+        if post_number not in self.anchors:
+            insort(self.numbers, post_number)
+        self.anchors[post_number] = day
+
+    def resolve_rows(self, rows):
+        # 한 페이지의 행(row_extractor.BoardRow, 최신 글부터) → 행마다 날짜 순번 또는 None
+        # 페이지 순서와 상관없이 불러도 됨 (경계 페이지 탐색처럼 건너뛰며 받은 페이지도 글 번호로 해를 정함)
+        days = []
+        previous_number, previous_day = 0, None
+        known = []  # 이 페이지에서 날짜를 안 (글 번호, 날짜)
+        for row in rows or []:
+            post_number = int(row.num) if row.num.isdigit() else 0
+            if previous_day is not None and (not post_number or post_number <= previous_number):
+                # 바로 앞(더 최신) 글의 날짜가 기준
+                bound = previous_day
+            else:
+                bound = self._bound(post_number)
+            day = self.resolve(row.date, bound)
+            days.append(day)
+            if day is not None:
+                previous_day = day
+                if post_number:
+                    previous_number = post_number
+                    known.append((post_number, day))
+        if known:
+            # 다음 페이지나 건너뛴 페이지의 기준으로 쓸 수 있게 페이지의 처음과 마지막 글을 기억
+            for post_number, day in (known[0], known[-1]):
+                self._remember(post_number, day)
+        return days
@@ -0,0 +1,123 @@
+# 게시판 페이지 응답을 URL별로 압축해서 디스크(SQLite)에 저장해 두는 HTTP 캐시
+# - max_age 안에 저장한 응답은 요청 없이 바로 돌려줌 (깊은 페이지용)
+# - 그 밖에는 저장해 둔 ETag/Last-Modified로 조건부 요청을 보내고, 304면 저장한 본문을 씀
+import os
+import sqlite3
+import threading
+import time
+import zlib
+import crawler_settings as settings
+import inven_http
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    encoding TEXT NOT NULL,
+    body BLOB NOT NULL,           -- zlib으로 압축한 응답 본문
+    fetched_at REAL NOT NULL      -- 마지막으로 서버에서 확인한 시각 (time.time())
+);
+"""
+
+
+class HttpCache:
+    def __init__(self, path=None):
+        self.path = path or os.path.join(settings.DATA_DIR, "http_cache.db")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # 여러 요청 스레드가 같이 쓰므로 연결 하나를 잠금으로 보호
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.lock = threading.Lock()
+        self.stats = {"fresh": 0, "revalidated": 0, "downloaded": 0}
+        self.prune(settings.HTTP_CACHE_RETENTION)
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+    def lookup(self, url):
+        # (etag, last_modified, encoding, 본문, 저장한 지 몇 초) 또는 None
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, encoding, body, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, encoding, body, fetched_at = row
+        return etag, last_modified, encoding, zlib.decompress(body), time.time() - fetched_at
+
+    def store(self, url, response, content, encoding):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (url, etag, last_modified, encoding, body, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (url, response.headers.get("ETag"), response.headers.get("Last-Modified"), encoding,
+                 zlib.compress(content), time.time()),
+            )
+            self.conn.commit()
+
+    def touch(self, url):
+        # 304 응답: 본문은 그대로 두고 확인한 시각만 갱신
+        with self.lock:
+            self.conn.execute("UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self.conn.commit()
+
+    def prune(self, max_age):
+        # max_age초 넘게 확인하지 않은 응답은 지움
+        with self.lock:
+            self.conn.execute("DELETE FROM responses WHERE fetched_at < ?", (time.time() - max_age,))
+            self.conn.commit()
+
+    def _count(self, name):
+        with self.lock:
+            self.stats[name] += 1
+
+    def fetch(self, url, max_age=0):
+        # url의 (본문 바이트, 인코딩)
+        cached = self.lookup(url)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, encoding, content, age = cached
+            if age < max_age:
+                self._count("fresh")
+                return content, encoding
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = inven_http.get(url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            self.touch(url)
+            self._count("revalidated")
+            return content, encoding
+        response.raise_for_status()  # 요청 에러 확인
+
+        content = response.content
+        encoding = response.encoding or "utf-8"
+        self.store(url, response, content, encoding)
+        self._count("downloaded")
+        return content, encoding
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache():
+    # 프로그램 전체에서 하나의 캐시를 같이 씀 (DATA_DIR이 바뀌면 새 위치에서 다시 엶)
+    global _shared_cache
+    with _shared_lock:
+        path = os.path.join(settings.DATA_DIR, "http_cache.db")
+        if _shared_cache is None or _shared_cache.path != path:
+            if _shared_cache is not None:
+                _shared_cache.close()
+            _shared_cache = HttpCache(path)
+        return _shared_cache
+
+
+def fetch(url, max_age=0):
+    return shared_cache().fetch(url, max_age)
@@ -0,0 +1,117 @@
+# inven.co.kr 요청에 공통으로 쓰는 HTTP 세션 (연결 재사용, 압축 전송, 재시도)
+import threading
+import time
+from email.utils import parsedate_to_datetime
+import crawl_metrics
+import crawler_settings as settings
+import rate_limiter
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def create_session():
+    # requests는 첫 요청 때 불러옴 (GUI 창이 뜨기 전에 불러오지 않도록)
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # 재시도는 get()에서 직접 함 (시도할 때마다 rate_limiter가 응답 시간과 상태 코드를 보도록)
+    retry = Retry(total=0, raise_on_status=False)
+    # pool_block=True 이면 호스트당 연결 수가 pool_maxsize를 넘지 않음
+    adapter = HTTPAdapter(
+        pool_connections=settings.MAX_HOSTS,
+        pool_maxsize=settings.MAX_CONNECTIONS_PER_HOST,
+        pool_block=True,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "User-Agent": settings.USER_AGENT,
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+
+def configure(**overrides):
+    # 예: configure(READ_TIMEOUT=30, MAX_CONNECTIONS_PER_HOST=16)
+    global _session
+    for name, value in overrides.items():
+        if not hasattr(settings, name):
+            raise AttributeError(f"알 수 없는 설정입니다: {name}")
+        setattr(settings, name, value)
+
+    # 새 설정으로 세션과 호스트별 제한을 다시 만듦
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+    rate_limiter.reset()
+
+
+def _retry_after(response):
+    # Retry-After 헤더 (초 또는 HTTP 날짜) → 기다릴 초, 없으면 None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def get(url, **kwargs):
+    # 5xx/429 응답과 연결 오류는 지수 백오프로 재시도 (Retry-After 헤더가 있으면 그 값을 따름)
+    # 마지막 시도의 응답을 그대로 돌려주므로 상태 코드 확인은 호출한 쪽에서 함
+    import requests  # create_session()에서 이미 불러왔으면 바로 돌아옴
+
+    kwargs.setdefault("timeout", (settings.CONNECT_TIMEOUT, settings.READ_TIMEOUT))
+    limiter = rate_limiter.limiter_for(url)
+    for attempt in range(settings.MAX_RETRIES + 1):
+        last_attempt = attempt == settings.MAX_RETRIES
+        if attempt:
+            crawl_metrics.count("retries")
+        with crawl_metrics.timed("wait"):
+            started_at = limiter.acquire()
+        response, retry_after = None, None
+        try:
+            response = get_session().get(url, **kwargs)
+            retry_after = _retry_after(response) if response.status_code in settings.RETRY_STATUS else None
+        except requests.RequestException:
+            # 연결 오류, 시간 초과, 본문을 받다가 끊긴 경우 등
+            crawl_metrics.count("connection_errors")
+            if last_attempt:
+                raise
+        finally:
+            # 어떤 예외가 나도 요청 자리를 돌려줌 (돌려주지 않으면 이 호스트의 요청이 계속 기다림)
+            limiter.release(started_at, response.status_code if response is not None else None, retry_after)
+        if response is None:
+            time.sleep(settings.RETRY_BACKOFF * 2 ** attempt)
+            continue
+
+        # 요청을 보내고 본문을 다 받을 때까지
+        crawl_metrics.observe("http", time.monotonic() - started_at)
+        crawl_metrics.count("requests")
+        crawl_metrics.count("bytes", len(response.content))
+        if response.status_code in settings.RETRY_STATUS:
+            crawl_metrics.count(f"status_{response.status_code}")
+        if response.status_code not in settings.RETRY_STATUS or last_attempt:
+            return response
+        # Retry-After 동안은 limiter가 이 호스트의 요청을 막아 둠
+        time.sleep(settings.RETRY_BACKOFF * 2 ** attempt)
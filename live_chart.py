@@ -0,0 +1,73 @@
+# 날짜별 이모티콘 포함 글 수를 크롤링하는 동안 바로 보여주는 막대 그래프 (QtCharts)
+# 페이지마다 새 날짜는 막대를 끼워 넣고 있던 날짜는 값만 바꿈 (시리즈를 다시 만들지 않음)
+from bisect import bisect_left
+from PySide6.QtCharts import QBarCategoryAxis, QBarSeries, QBarSet, QChart, QChartView, QValueAxis
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QPainter
+
+
+class DateBarChart(QChartView):
+    def __init__(self, parent=None):
+        chart = QChart()
+        chart.legend().hide()
+        chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)  # 페이지마다 다시 그리지 않도록
+
+        self.bar_set = QBarSet("이모티콘 포함 글")
+        self.series = QBarSeries()
+        self.series.append(self.bar_set)
+        chart.addSeries(self.series)
+
+        self.axis_x = QBarCategoryAxis()
+        self.axis_x.setLabelsAngle(-90)  # 날짜가 많아도 잘리지 않도록 세로로
+        self.axis_y = QValueAxis()
+        self.axis_y.setLabelFormat("%d")
+        self.axis_y.setRange(0, 10)
+        self.axis_y.applyNiceNumbers()
+        chart.addAxis(self.axis_x, Qt.AlignmentFlag.AlignBottom)
+        chart.addAxis(self.axis_y, Qt.AlignmentFlag.AlignLeft)
+        self.series.attachAxis(self.axis_x)
+        self.series.attachAxis(self.axis_y)
+
+        super().__init__(chart, parent)
+        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.job_name = None
+        self.dates = []  # 막대 순서대로 날짜 (오래된 날짜부터)
+
+    def clear(self, job_name=None):
+        self.job_name = job_name
+        self.chart().setTitle(job_name or "")
+        self.bar_set.remove(0, self.bar_set.count())
+        self.axis_x.clear()
+        self.axis_y.setRange(0, 10)
+        self.dates = []
+
+    def _index(self, date):
+        # date 막대의 위치 (없으면 날짜 순서에 맞게 0으로 끼워 넣음)
+        index = bisect_left(self.dates, date)
+        if index == len(self.dates) or self.dates[index] != date:
+            self.dates.insert(index, date)
+            self.bar_set.insert(index, 0)
+            if index == len(self.dates) - 1:
+                self.axis_x.append([date])
+            else:
+                # QBarCategoryAxis.insert()는 축 범위를 늘리지 않으므로 (Qt 6.8) 축 이름만 다시 지정
+                self.axis_x.setCategories(self.dates)
+        return index
+
+    def add_counts(self, counts):
+        # counts: 날짜 → 이번 페이지에서 늘어난 글 수
+        for date, count in counts.items():
+            index = self._index(date)
+            self._set_value(index, self.bar_set.at(index) + count)
+
+    def set_counts(self, counts):
+        # counts: 날짜 → 글 수 (크롤링이 끝난 뒤 저장소 기준 통계로 맞출 때)
+        for date, count in counts.items():
+            self._set_value(self._index(date), count)
+
+    def _set_value(self, index, value):
+        self.bar_set.replace(index, value)
+        # 막대가 축을 넘을 때만 축을 늘림
+        if value > self.axis_y.max():
+            self.axis_y.setRange(0, value * 1.5)
+            self.axis_y.applyNiceNumbers()  # 눈금을 보기 좋은 숫자로
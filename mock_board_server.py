@@ -0,0 +1,241 @@
+# 인벤 게시판을 흉내 내는 로컬 HTTP 서버 (실제 사이트에 요청하지 않고 성능을 측정하기 위함)
+# 사용법: python mock_board_server.py [--port 8765] [--latency 0.05] [--error-rate 0.02] [--max-rate 20]
+#   /                        모든 직업 게시판 링크가 있는 메인 페이지
+#   /board/lostark/<번호>?p=N  게시판 목록 N 페이지 (fixtures/board_p1.html의 머리말과 꼬리말을 그대로 사용)
+#   /board/lostark/<번호>/<글 번호>  글 페이지
+import argparse
+import hashlib
+import os
+import random
+import re
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import crawler_settings as settings
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "board_p1.html")
+FIRST_BOARD_ID = 5339  # 메인 페이지에서 직업 게시판에 붙이는 번호의 시작값
+
+TITLES = ("각인 질문 있습니다", "아크패시브 정리글", "오늘 레이드 후기", "세팅 봐주세요", "밸패 언제 하나요")
+EMOJI_TITLES = ("●▅▇█ 개선 좀 해주세요", "▅ 시너지 너무 약함", "█ 이건 좀 아니지 않나요")
+AUTHORS = ("체술인파", "주먹왕", "로아유저", "모코코", "각인장인", "레이드중독")
+
+ROW_TEMPLATE = """<tr class="">
+<td class="num"><span>{num}</span></td>
+<td class="tit">
+<div class="text-wrap"><div>
+<a class="subject-link" href="https://www.inven.co.kr/board/lostark/{board}/{num}?p={page}">
+<span class="category">[잡담]</span>
+                                                                                                            {title}                                </a>
+<span class="con-comment">[{comments}]</span>
+</div></div>
+</td>
+<td class="user"><span class="layerNickName" onclick="layerNickName('{author}','pbNickNameHandler')">{author}</span></td>
+<td class="date">{date}</td>
+<td class="view">{views}</td>
+<td class="reco">{reco}</td>
+</tr>
+"""
+
+
+def _load_template():
+    # 저장해 둔 목록 페이지에서 게시글 행만 빼고 머리말(공지 포함)과 꼬리말을 가져옴
+    with open(FIXTURE_PATH, encoding="utf-8") as file:
+        html = file.read()
+    head, rest = html.split("<tbody>", 1)
+    _, tail = rest.split("</tbody>", 1)
+    notices = "".join(re.findall(r'<tr class="notice">.*?</tr>\n', rest, re.S))
+    return head + "<tbody>\n" + notices, "</tbody>" + tail
+
+
+class MockBoard:
+    # total_posts개의 글이 하루에 posts_per_day개씩 오늘부터 과거로 올라와 있는 게시판
+    def __init__(self, total_posts=20000, rows_per_page=50, posts_per_day=300, top_num=200000, emoji_every=7):
+        self.total_posts = total_posts
+        self.rows_per_page = rows_per_page
+        self.posts_per_day = posts_per_day
+        self.top_num = top_num
+        self.emoji_every = emoji_every
+        self.head, self.tail = _load_template()
+
+    def num_pages(self):
+        return -(-self.total_posts // self.rows_per_page)
+
+    def render_page(self, board, page):
+        today = date.today()
+        rows = []
+        first = (page - 1) * self.rows_per_page
+        for index in range(first, min(first + self.rows_per_page, self.total_posts)):
+            day = today - timedelta(days=index // self.posts_per_day)
+            if day == today:
+                date_str = f"{index % 24:02d}:{index % 60:02d}"
+            else:
+                date_str = day.strftime("%m-%d")
+            if index % self.emoji_every == 0:
+                title = EMOJI_TITLES[index % len(EMOJI_TITLES)]
+            else:
+                title = TITLES[index % len(TITLES)]
+            rows.append(ROW_TEMPLATE.format(
+                num=self.top_num - index, board=board, page=page, title=title, comments=index % 30,
+                author=AUTHORS[index % len(AUTHORS)], date=date_str, views=index % 1000, reco=index % 50,
+            ))
+        return self.head + "".join(rows) + self.tail
+
+    def render_post(self, board, num):
+        # 글 페이지 (본문과 댓글 수만 흉내 냄, 선택자는 crawler_settings.POST_*_SELECTOR)
+        index = self.top_num - num
+        if index % self.emoji_every == 0:
+            title = EMOJI_TITLES[index % len(EMOJI_TITLES)]
+        else:
+            title = TITLES[index % len(TITLES)]
+        paragraphs = [title, "밸런스 패치 후기입니다."]
+        paragraphs.append("시너지가 너무 약해서 개선이 필요합니다." if index % 3 else "버프 감사합니다")
+        if index % 5 == 0:
+            paragraphs.append("▅▇█ 이건 좀 너무하네요")
+        body = "".join(f"<p>{paragraph}</p>" for paragraph in paragraphs)
+        return (f'<html><body><div class="articleTitle"><h1>{title}</h1></div>'
+                f'<div id="powerbbsContent">{body}</div>'
+                f'<div class="articleBottomMenu"><span class="cmtnum">댓글 <strong>{index % 30}</strong></span></div>'
+                f'</body></html>')
+
+    def render_main(self):
+        links = "".join(
+            f'<a href="/board/lostark/{FIRST_BOARD_ID + i}">{name}</a>\n'
+            for i, name in enumerate(settings.LOSTARK_CLASSES)
+        )
+        return f'<html><body><div id="comHeadLink">\n{links}</div></body></html>'
+
+
+class MockBoardHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 연결 재사용
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.stats_lock:
+            server.request_count += 1
+
+        # 응답 지연 (latency ± jitter)
+        delay = server.latency + random.uniform(-server.jitter, server.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        # 초당 max_rate개보다 많이 요청하면 429 + Retry-After (요청 속도 조절 확인용)
+        if server.max_rate and not server.take_token():
+            with server.stats_lock:
+                server.throttled_count += 1
+            self._send(429, b"Too Many Requests", {"Retry-After": "1"})
+            return
+
+        # error_rate 비율만큼 503 응답 (재시도 동작 확인용)
+        if random.random() < server.error_rate:
+            with server.stats_lock:
+                server.error_count += 1
+            self._send(503, b"Service Unavailable")
+            return
+
+        url = urlparse(self.path)
+        match = re.fullmatch(r"/board/lostark/(\d+)", url.path)
+        post_match = re.fullmatch(r"/board/lostark/(\d+)/(\d+)", url.path)
+        if url.path in ("", "/"):
+            body = server.board.render_main()
+        elif post_match:
+            body = server.board.render_post(post_match.group(1), int(post_match.group(2)))
+        elif match:
+            page = int(parse_qs(url.query).get("p", ["1"])[0])
+            body = server.board.render_page(match.group(1), page)
+        else:
+            self._send(404, b"Not Found")
+            return
+        # 본문이 같으면 같은 ETag (조건부 요청 확인용)
+        body = body.encode("utf-8")
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            with server.stats_lock:
+                server.not_modified_count += 1
+            self._send(304, b"", {"ETag": etag})
+            return
+        self._send(200, body, {"ETag": etag})
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "text/html; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MockBoardServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def take_token(self):
+        # 초당 max_rate개, 최대 max_rate개까지 쌓이는 토큰 버킷
+        with self.stats_lock:
+            now = time.monotonic()
+            self.tokens = min(self.max_rate, self.tokens + (now - self.updated_at) * self.max_rate)
+            self.updated_at = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+def create_server(port=0, latency=0.05, jitter=0.0, error_rate=0.0, board=None, max_rate=None):
+    # port=0 이면 빈 포트를 자동으로 고름 (server.server_address[1]로 확인)
+    server = MockBoardServer(("127.0.0.1", port), MockBoardHandler)
+    server.board = board or MockBoard()
+    server.latency = latency
+    server.jitter = jitter
+    server.error_rate = error_rate
+    server.max_rate = max_rate
+    server.tokens = max_rate or 0
+    server.updated_at = time.monotonic()
+    server.request_count = 0
+    server.error_count = 0
+    server.throttled_count = 0
+    server.not_modified_count = 0
+    server.stats_lock = threading.Lock()
+    return server
+
+
+def server_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def start_in_thread(**options):
+    # 같은 프로세스 안에서 띄울 때 사용 (끝나면 server.shutdown())
+    server = create_server(**options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인벤 게시판 목록 페이지를 흉내 내는 로컬 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.05, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연의 흔들림 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503으로 응답할 비율 (0~1)")
+    parser.add_argument("--max-rate", type=float, help="초당 이보다 많이 요청하면 429로 응답")
+    parser.add_argument("--posts", type=int, default=20000, help="게시판 전체 글 수")
+    parser.add_argument("--posts-per-day", type=int, default=300, help="하루에 올라오는 글 수")
+    args = parser.parse_args()
+
+    board = MockBoard(total_posts=args.posts, posts_per_day=args.posts_per_day)
+    server = create_server(args.port, args.latency, args.jitter, args.error_rate, board, args.max_rate)
+    print(f"{server_url(server)} 에서 실행 중 (페이지 {board.num_pages()}개, Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
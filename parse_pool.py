@@ -0,0 +1,70 @@
+# 게시판 HTML 파싱과 이모티콘 검사를 여러 프로세스에 나눠 맡기는 모듈
+# (파이썬 GIL 때문에 스레드로는 CPU 코어를 다 쓰지 못하므로 프로세스를 사용)
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import crawler_settings as settings
+from row_extractor import extract_rows
+
+_patterns = {}
+
+
+def parse_page(raw, encoding, emoji_pattern=None):
+    # 작업 프로세스에서 실행: HTML 바이트 → (번호, 제목, 작성자, 날짜, 이모티콘 여부) 튜플 목록
+    rows = extract_rows(raw.decode(encoding, errors="replace"))
+    if rows is None:
+        return None
+    if emoji_pattern is None:
+        return [tuple(row) for row in rows]
+
+    pattern = _patterns.get(emoji_pattern)
+    if pattern is None:
+        pattern = _patterns[emoji_pattern] = re.compile(emoji_pattern)
+    return [row[:4] + (bool(pattern.search(row.title)),) for row in rows]
+
+
+class ParsePool:
+    def __init__(self, processes=None):
+        self.executor = ProcessPoolExecutor(max_workers=processes or None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def parse(self, raw, encoding, emoji_pattern=None):
+        # 호출한 스레드는 결과가 나올 때까지 기다리고, 파싱은 다른 프로세스에서 진행됨
+        return self.executor.submit(parse_page, raw, encoding, emoji_pattern).result()
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+_shared_pools = {}  # 프로세스 수 → ParsePool
+_shared_lock = threading.Lock()
+
+
+def shared_pool(processes=None):
+    # processes가 None이면 PARSE_PROCESSES, 0이면 None (프로세스 풀을 쓰지 않음)
+    if processes is None:
+        processes = settings.PARSE_PROCESSES
+    if not processes:
+        return None
+    with _shared_lock:
+        pool = _shared_pools.get(processes)
+        if pool is None:
+            pool = _shared_pools[processes] = ParsePool(processes)
+        return pool
+
+
+def sweep_processes():
+    # 모든 게시판을 함께 크롤링할 때의 파싱 프로세스 수 (PARSE_PROCESSES를 정했으면 그 값)
+    # 동시에 받는 페이지가 많아 파싱이 요청 스레드를 막기 쉬우므로 기본값은 CPU 코어 수 (코어가 하나면 쓰지 않음)
+    if settings.PARSE_PROCESSES:
+        return settings.PARSE_PROCESSES
+    if settings.SWEEP_PARSE_PROCESSES is not None:
+        return settings.SWEEP_PARSE_PROCESSES
+    cores = os.cpu_count() or 1
+    return cores if cores > 1 else 0
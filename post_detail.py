@@ -0,0 +1,150 @@
+# 목록에서 찾은 게시글의 본문을 받아서 제목과 같은 분류(이모티콘, 불만 등)로 세는 두 번째 단계
+# 목록 단계 → (크기가 정해진 큐) → 본문 작업 스레드 DETAIL_WORKERS개 → (큐) → 저장 스레드
+# 큐가 차 있으면 목록 단계가 기다리므로 받아 둔 본문이 메모리에 쌓이지 않음
+import queue
+import re
+import threading
+from collections import Counter
+import crawler_settings as settings
+import inven_http
+from post_store import PostStore, board_key, emoji_marks
+from row_extractor import is_available
+from title_classifier import TitleClassifier
+
+_DONE = object()  # 작업 스레드에 끝났다고 알리는 값
+WRITE_BATCH = 50   # 본문을 이만큼 모아서 한 번에 저장
+
+
+def parse_post(html):
+    # 글 페이지 → (본문 텍스트, 댓글 수), 본문을 찾을 수 없으면 None
+    if is_available("selectolax"):
+        from selectolax.lexbor import LexborHTMLParser
+
+        tree = LexborHTMLParser(html)
+        body_tag = tree.css_first(settings.POST_BODY_SELECTOR)
+        if body_tag is None:
+            return None
+        body = body_tag.text(separator="\n", strip=True)
+        comment_tag = tree.css_first(settings.POST_COMMENT_COUNT_SELECTOR)
+        comment_text = comment_tag.text() if comment_tag is not None else ""
+    else:
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html, "html.parser")
+        body_tag = soup.select_one(settings.POST_BODY_SELECTOR)
+        if body_tag is None:
+            return None
+        body = body_tag.get_text("\n", strip=True)
+        comment_tag = soup.select_one(settings.POST_COMMENT_COUNT_SELECTOR)
+        comment_text = comment_tag.get_text() if comment_tag is not None else ""
+
+    digits = re.search(r"\d+", comment_text.replace(",", ""))
+    return body, int(digits.group()) if digits else 0
+
+
+class PostDetailCrawler:
+    # with PostDetailCrawler(job_board_url) as details:
+    #     details.submit(store, [글 번호, ...])   # 목록 페이지마다
+    def __init__(self, job_board_url, workers=None, queue_size=None, classifier=None):
+        self.job_board_url = job_board_url.rstrip("/")
+        self.board = board_key(job_board_url)
+        self.classifier = classifier or TitleClassifier()
+        self.totals = Counter()  # 분류 이름 → 해당하는 본문 수
+        self.stats = {"fetched": 0, "skipped": 0, "failed": 0, "comments": 0, "emoji": 0}
+        self.lock = threading.Lock()
+
+        self.queue = queue.Queue(maxsize=queue_size or settings.DETAIL_QUEUE_SIZE)
+        self.results = queue.Queue(maxsize=queue_size or settings.DETAIL_QUEUE_SIZE)
+        self.queued = set()  # 이번 실행에서 이미 큐에 넣은 글 번호 (목록이 밀려서 같은 글이 또 나와도 한 번만 받음)
+
+        self.workers = [threading.Thread(target=self._work, daemon=True)
+                        for _ in range(workers or settings.DETAIL_WORKERS)]
+        self.writer = threading.Thread(target=self._write, daemon=True)
+        for thread in self.workers + [self.writer]:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        # 예외로 빠져나오면 아직 받지 않은 글은 버림
+        self.close(cancel=exc_type is not None)
+
+    def submit(self, store, numbers):
+        # 목록 단계에서 페이지마다 호출 (store는 목록 단계의 PostStore)
+        # 본문을 이미 저장한 글은 건너뜀
+        numbers = [num for num in numbers if num not in self.queued]
+        self.queued.update(numbers)
+        missing = store.missing_details(self.board, numbers)
+        self.stats["skipped"] += len(numbers) - len(missing)
+        for num in missing:
+            self.queue.put(num)  # 큐가 차 있으면 자리가 날 때까지 기다림
+
+    def _work(self):
+        while True:
+            num = self.queue.get()
+            if num is _DONE:
+                return
+            try:
+                response = inven_http.get(f"{self.job_board_url}/{num}")
+                response.raise_for_status()
+                parsed = parse_post(response.content.decode(response.encoding or "utf-8", errors="replace"))
+            except Exception:
+                # 요청 오류뿐 아니라 알 수 없는 인코딩, 파싱 오류도 그 글만 실패로 셈 (작업 스레드가 죽으면 큐가 차서 목록 단계가 멈춤)
+                parsed = None
+            if parsed is None:
+                with self.lock:
+                    self.stats["failed"] += 1
+                continue
+
+            body, comment_count = parsed
+            counts = self.classifier.title_counts([body])
+            categories = [name for name in self.classifier.names if counts[name]]
+            self.results.put((num, body, comment_count, categories))
+
+    def _write(self):
+        # SQLite 연결은 만든 스레드에서만 쓰므로 저장은 이 스레드가 전부 맡음
+        with PostStore() as store:
+            batch = []
+            while True:
+                item = self.results.get()
+                if item is not _DONE:
+                    batch.append(item)
+                if batch and (item is _DONE or len(batch) >= WRITE_BATCH or self.results.empty()):
+                    store.add_details(self.board, batch)
+                    with self.lock:
+                        for _, body, comment_count, categories in batch:
+                            self.stats["fetched"] += 1
+                            self.stats["comments"] += comment_count
+                            if emoji_marks(body):
+                                self.stats["emoji"] += 1
+                            self.totals.update(categories)
+                    batch = []
+                if item is _DONE:
+                    return
+
+    def close(self, cancel=False):
+        # 큐에 남은 글을 모두 받고 저장할 때까지 기다림 (cancel이면 남은 글은 버림)
+        if cancel:
+            while True:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    break
+        for _ in self.workers:
+            self.queue.put(_DONE)
+        for thread in self.workers:
+            thread.join()
+        self.results.put(_DONE)
+        self.writer.join()
+
+    def summary(self):
+        # 예: "본문 120개 (이모티콘 15, 댓글 830) | 이모티콘 15, 불만 4, 긍정 2, 질문 30"
+        stats = self.stats
+        categories = ", ".join(f"{name} {self.totals[name]}" for name in self.classifier.names)
+        text = f"본문 {stats['fetched']}개 (이모티콘 {stats['emoji']}, 댓글 {stats['comments']}) | {categories}"
+        if stats["skipped"]:
+            text += f" | 이미 받은 글 {stats['skipped']}개 건너뜀"
+        if stats["failed"]:
+            text += f" | 받지 못한 글 {stats['failed']}개"
+        return text
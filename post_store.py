@@ -0,0 +1,161 @@
+# 크롤링한 게시글을 SQLite에 저장하고 통계를 쿼리로 계산하는 모듈
+import os
+import re
+import sqlite3
+from urllib.parse import urlparse
+import crawler_settings as settings
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    board TEXT NOT NULL,
+    num INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    author TEXT,
+    date TEXT NOT NULL,               -- yyyy-MM-dd
+    emoji_marks TEXT NOT NULL DEFAULT '',  -- 제목에 들어 있는 이모티콘 문자
+    PRIMARY KEY (board, num)
+);
+CREATE INDEX IF NOT EXISTS idx_posts_board_date ON posts (board, date);
+
+-- 게시글 본문 (post_detail.py에서 채움)
+CREATE TABLE IF NOT EXISTS post_details (
+    board TEXT NOT NULL,
+    num INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    comment_count INTEGER NOT NULL DEFAULT 0,
+    emoji_marks TEXT NOT NULL DEFAULT '',  -- 본문에 들어 있는 이모티콘 문자
+    categories TEXT NOT NULL DEFAULT '',   -- 본문이 해당하는 TITLE_CATEGORIES 분류 (쉼표로 구분)
+    PRIMARY KEY (board, num)
+);
+
+-- 게시판별 증분 크롤링 지점: 가장 큰 글 번호, 저장된 글이 포함하는 가장 이른 날짜
+CREATE TABLE IF NOT EXISTS crawl_marks (
+    board TEXT PRIMARY KEY,
+    high_water INTEGER NOT NULL,
+    since TEXT NOT NULL
+);
+"""
+
+UPSERT_POST = """
+INSERT INTO posts (board, num, title, author, date, emoji_marks)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (board, num) DO UPDATE SET
+    title = excluded.title,
+    author = excluded.author,
+    date = excluded.date,
+    emoji_marks = excluded.emoji_marks
+"""
+
+
+def board_key(job_board_url):
+    # 예: https://www.inven.co.kr/board/lostark/5340 → board_lostark_5340
+    return re.sub(r"\W+", "_", urlparse(job_board_url).path).strip("_")
+
+
+def emoji_marks(title):
+    return "".join(sorted(set(title) & set(settings.EMOJI_MARKS)))
+
+
+def _marks_condition(marks):
+    # marks 중 하나라도 들어 있는 글인지 확인하는 SQL 조건
+    return "(" + " OR ".join(["instr(emoji_marks, ?) > 0"] * len(marks)) + ")", list(marks)
+
+
+class PostStore:
+    def __init__(self, path=None):
+        self.path = path or os.path.join(settings.DATA_DIR, "posts.db")
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def add_rows(self, board, rows):
+        # rows: (글 번호, 제목, 작성자, 날짜) 목록, 한 페이지씩 묶어서 저장
+        with self.conn:
+            self.conn.executemany(UPSERT_POST, [
+                (board, int(num), title, author, date, emoji_marks(title))
+                for num, title, author, date in rows
+            ])
+
+    def add_details(self, board, details):
+        # details: (글 번호, 본문, 댓글 수, 분류 목록) 목록
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO post_details (board, num, body, comment_count, emoji_marks, categories)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [(board, num, body, comment_count, emoji_marks(body), ",".join(categories))
+                 for num, body, comment_count, categories in details],
+            )
+
+    def missing_details(self, board, numbers):
+        # numbers 중 아직 본문을 저장하지 않은 글 번호
+        if not numbers:
+            return []
+        placeholders = ",".join("?" * len(numbers))
+        stored = {num for num, in self.conn.execute(
+            f"SELECT num FROM post_details WHERE board = ? AND num IN ({placeholders})", [board] + list(numbers)
+        )}
+        return [num for num in numbers if num not in stored]
+
+    def get_mark(self, board):
+        row = self.conn.execute(
+            "SELECT high_water, since FROM crawl_marks WHERE board = ?", (board,)
+        ).fetchone()
+        return row if row else (0, None)
+
+    def set_mark(self, board, high_water, since):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO crawl_marks (board, high_water, since) VALUES (?, ?, ?)",
+                (board, high_water, since),
+            )
+
+    def date_stats(self, board, since, marks):
+        # 날짜 → (이모티콘 포함 글 수, 전체 글 수), 최신 날짜부터
+        condition, params = _marks_condition(marks)
+        rows = self.conn.execute(
+            f"SELECT date, SUM({condition}), COUNT(*) FROM posts"
+            " WHERE board = ? AND date >= ? GROUP BY date ORDER BY date DESC",
+            params + [board, since],
+        )
+        return {date: (emoji_count, total_count) for date, emoji_count, total_count in rows}
+
+    def iter_titles(self, board, since, batch_size=1000):
+        # since 이후 글의 제목을 batch_size개씩 목록으로 돌려줌 (한꺼번에 메모리에 올리지 않음)
+        cursor = self.conn.execute("SELECT title FROM posts WHERE board = ? AND date >= ?", (board, since))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield [title for title, in rows]
+
+    def iter_posts(self, board, since, max_num, batch_size=1000):
+        # since 이후, max_num번 이하 글의 (번호, 제목, 작성자, 날짜, 이모티콘 문자)를 최신 글부터 batch_size개씩 돌려줌
+        cursor = self.conn.execute(
+            "SELECT num, title, author, date, emoji_marks FROM posts"
+            " WHERE board = ? AND date >= ? AND num <= ? ORDER BY num DESC",
+            (board, since, max_num),
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield rows
+
+    def count_posts(self, board, since, marks):
+        condition, params = _marks_condition(marks)
+        emoji_count, total_count = self.conn.execute(
+            f"SELECT COALESCE(SUM({condition}), 0), COUNT(*) FROM posts WHERE board = ? AND date >= ?",
+            params + [board, since],
+        ).fetchone()
+        return emoji_count, total_count
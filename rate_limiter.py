@@ -0,0 +1,131 @@
+# 호스트별 요청 속도와 동시 요청 수를 조절하는 모듈
+# - 토큰 버킷: 초당 rate개, 최대 burst개까지 몰아서 요청
+# - 동시 요청 수(AIMD): 정상 응답이 오면 조금씩 늘리고, 429/5xx/연결 오류/느린 응답이면 절반으로 줄임
+# - Retry-After 헤더가 오면 그 시간 동안 해당 호스트 요청을 멈춤
+# - pause_all()/resume_all(): 새 요청만 멈추고 진행 중인 크롤링 상태는 그대로 둠
+import threading
+import time
+from urllib.parse import urlparse
+import crawler_settings as settings
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+_running = threading.Event()  # 꺼져 있으면 일시정지 상태
+_running.set()
+_DEFAULT = object()  # rate를 주지 않았을 때 (None은 속도 제한 없음이라 따로 구분)
+
+
+class HostLimiter:
+    def __init__(self, rate=_DEFAULT, burst=None, max_concurrency=None, min_concurrency=None):
+        limits = settings.DEFAULT_HOST_LIMIT
+        self.rate = limits["rate"] if rate is _DEFAULT else rate  # None이면 속도 제한 없음
+        self.burst = burst or limits["burst"]
+        self.max_concurrency = max_concurrency or limits["max_concurrency"] or settings.MAX_CONNECTIONS_PER_HOST
+        self.min_concurrency = min_concurrency or limits["min_concurrency"]
+
+        self.concurrency = float(self.max_concurrency)  # 지금 허용하는 동시 요청 수
+        self.in_flight = 0
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0       # Retry-After로 멈춘 시각까지
+        self.decreased_at = 0
+        self.latency = None          # 응답 시간 지수 평균 (초)
+        self.stats = {"requests": 0, "throttled": 0, "errors": 0, "slow": 0}
+        self._cond = threading.Condition()
+
+    def _refill(self, now):
+        if self.rate:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def acquire(self):
+        # 요청을 보내도 될 때까지 기다리고, 요청 시작 시각을 돌려줌
+        while True:
+            _running.wait()
+            with self._cond:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.blocked_until:
+                    delay = self.blocked_until - now
+                elif self.in_flight >= int(self.concurrency):
+                    # 다른 요청이 끝나면 release()에서 깨움
+                    self._cond.wait(1.0)
+                    continue
+                elif self.rate and self.tokens < 1:
+                    delay = (1 - self.tokens) / self.rate
+                else:
+                    if self.rate:
+                        self.tokens -= 1
+                    self.in_flight += 1
+                    self.stats["requests"] += 1
+                    return now
+            time.sleep(min(delay, 1.0))
+
+    def release(self, started_at, status=None, retry_after=None):
+        # status가 None이면 연결 오류나 시간 초과
+        with self._cond:
+            now = time.monotonic()
+            elapsed = now - started_at
+            self.in_flight -= 1
+            self.latency = elapsed if self.latency is None else self.latency * 0.8 + elapsed * 0.2
+
+            if status == 429 or retry_after:
+                self.stats["throttled"] += 1
+                if retry_after:
+                    self.blocked_until = max(self.blocked_until, now + retry_after)
+                self._decrease(now)
+            elif status is None or status >= 500:
+                self.stats["errors"] += 1
+                self._decrease(now)
+            elif elapsed > settings.SLOW_RESPONSE:
+                self.stats["slow"] += 1
+                self._decrease(now)
+            else:
+                # 동시 요청 수만큼 응답이 오면 1 늘어나는 속도
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1 / self.concurrency)
+            self._cond.notify_all()
+
+    def _decrease(self, now):
+        # 동시에 실패한 요청들 때문에 한꺼번에 여러 번 줄지 않도록 응답 시간 한 번에 한 번만 줄임
+        if now - self.decreased_at < (self.latency or 0):
+            return
+        self.decreased_at = now
+        self.concurrency = max(self.min_concurrency, self.concurrency / 2)
+
+    def snapshot(self):
+        with self._cond:
+            return dict(self.stats, concurrency=int(self.concurrency), in_flight=self.in_flight, latency=self.latency)
+
+
+def limiter_for(url):
+    # 호스트마다 하나씩, 설정은 HOST_LIMITS에 호스트 이름으로 지정 (없으면 DEFAULT_HOST_LIMIT)
+    host = urlparse(url).hostname or ""
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = HostLimiter(**settings.HOST_LIMITS.get(host, {}))
+        return _limiters[host]
+
+
+def reset():
+    # 설정을 바꾼 뒤 새 값으로 다시 만들도록 비움
+    with _limiters_lock:
+        _limiters.clear()
+
+
+def pause_all():
+    _running.clear()
+
+
+def resume_all():
+    _running.set()
+
+
+def is_paused():
+    return not _running.is_set()
+
+
+def snapshots():
+    # 호스트 → 요청 수, 오류 수, 지금 허용하는 동시 요청 수 등
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {host: limiter.snapshot() for host, limiter in limiters.items()}
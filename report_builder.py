@@ -0,0 +1,168 @@
+# 여러 직업의 날짜 모드 결과를 파일 하나로 저장하는 모듈
+#   xlsx: 요약 시트, 날짜 × 직업 표 시트, 직업마다 시트와 차트
+#   csv, parquet: (직업, 날짜, 이모지 포함 글 개수, 전체 글 개수, 비율) 긴 표 (분석 도구용)
+# 직업별 시트에 넣을 값(저장소의 날짜별 전체 글 수 등)은 여러 스레드에서 동시에 준비함
+import csv
+import re
+from concurrent.futures import ThreadPoolExecutor
+import crawler_settings as settings
+from post_store import PostStore, board_key
+
+FORMATS = ("xlsx", "csv", "parquet")
+SUMMARY_SHEET = "요약"
+PIVOT_SHEET = "날짜별"
+COLUMNS = ("날짜", "이모지 포함 글 개수", "전체 글 개수", "이모지 비율")
+
+
+class ClassSheet:
+    # 한 직업의 시트 내용, rows: (날짜, 이모지 포함 글 수, 전체 글 수 또는 None) 오래된 날짜부터
+    __slots__ = ("job_name", "emoji_count", "total_count", "rows")
+
+    def __init__(self, job_name, emoji_count, total_count, rows):
+        self.job_name = job_name
+        self.emoji_count = emoji_count
+        self.total_count = total_count
+        self.rows = rows
+
+    def has_totals(self):
+        return any(total is not None for _, _, total in self.rows)
+
+
+def _ratio(emoji, total):
+    return round(emoji / total, 4) if total else None
+
+
+def prepare_sheet(job_name, result, job_board_url=None, since=None, marks=None):
+    # result: crawl_by_date와 같은 (이모티콘 포함 글 수, 전체 글 수, 날짜별 이모티콘 포함 글 수)
+    # since와 게시판 URL이 있으면 저장소에서 날짜별 전체 글 수도 가져옴 (이전 크롤링 결과 포함)
+    emoji_count, total_count, emoji_date_stats = result
+    if job_board_url and since and marks:
+        # 스레드마다 따로 연결 (SQLite 연결은 만든 스레드에서만 씀)
+        with PostStore() as store:
+            date_stats = store.date_stats(board_key(job_board_url), since, marks)
+        rows = [(date, emoji, total) for date, (emoji, total) in date_stats.items()]
+    else:
+        rows = [(date, count, None) for date, count in emoji_date_stats.items()]
+    rows.sort()
+    return ClassSheet(job_name, emoji_count, total_count, rows)
+
+
+def prepare_sheets(results, boards=None, since=None, marks=None, workers=None):
+    # 직업 순서를 유지한 ClassSheet 목록, boards: 직업 이름 → 게시판 URL
+    boards = boards or {}
+    with ThreadPoolExecutor(max_workers=workers or settings.REPORT_WORKERS) as executor:
+        futures = [
+            executor.submit(prepare_sheet, job_name, result, boards.get(job_name), since, marks)
+            for job_name, result in results.items()
+        ]
+        return [future.result() for future in futures]
+
+
+def _sheet_name(name, used):
+    # 엑셀 시트 이름: 31자 이하, []:*?/\ 불가, 겹치지 않게
+    base = re.sub(r"[\[\]:*?/\\]", "_", name)[:31] or "시트"
+    candidate, number = base, 2
+    while candidate in used:
+        suffix = f"_{number}"
+        candidate, number = base[:31 - len(suffix)] + suffix, number + 1
+    used.add(candidate)
+    return candidate
+
+
+def write_workbook(sheets, file_name, constant_memory=None):
+    # constant_memory: 행을 쓰는 즉시 임시 파일로 내보내서 메모리를 적게 씀 (행 순서대로만 쓸 수 있음)
+    import xlsxwriter  # 저장할 때만 필요
+
+    if constant_memory is None:
+        constant_memory = sum(len(sheet.rows) for sheet in sheets) >= settings.REPORT_CONSTANT_MEMORY_ROWS
+    workbook = xlsxwriter.Workbook(file_name, {"constant_memory": constant_memory})
+    header = workbook.add_format({"bold": True})
+    percent = workbook.add_format({"num_format": "0.00%"})
+    used = {SUMMARY_SHEET, PIVOT_SHEET}
+    try:
+        # 요약: 직업마다 한 줄
+        summary = workbook.add_worksheet(SUMMARY_SHEET)
+        summary.write_row(0, 0, ("직업", "이모지 포함 글 개수", "전체 글 개수", "이모지 비율"), header)
+        for row, sheet in enumerate(sheets, start=1):
+            summary.write_row(row, 0, (sheet.job_name, sheet.emoji_count, sheet.total_count))
+            ratio = _ratio(sheet.emoji_count, sheet.total_count)
+            if ratio is not None:
+                summary.write_number(row, 3, ratio, percent)
+
+        # 날짜 × 직업 이모지 포함 글 수 (최신 날짜부터)
+        pivot = workbook.add_worksheet(PIVOT_SHEET)
+        counts = [{date: emoji for date, emoji, _ in sheet.rows} for sheet in sheets]
+        dates = sorted({date for sheet_counts in counts for date in sheet_counts}, reverse=True)
+        pivot.write_row(0, 0, ["날짜"] + [sheet.job_name for sheet in sheets], header)
+        for row, date in enumerate(dates, start=1):
+            pivot.write_row(row, 0, [date] + [sheet_counts.get(date, 0) for sheet_counts in counts])
+
+        # 직업마다 시트와 막대 차트
+        for sheet in sheets:
+            name = _sheet_name(sheet.job_name, used)
+            worksheet = workbook.add_worksheet(name)
+            with_totals = sheet.has_totals()
+            worksheet.write_row(0, 0, COLUMNS if with_totals else COLUMNS[:2], header)
+            for row, (date, emoji, total) in enumerate(sheet.rows, start=1):
+                worksheet.write_row(row, 0, (date, emoji))
+                if with_totals and total is not None:
+                    worksheet.write_number(row, 2, total)
+                    worksheet.write_number(row, 3, _ratio(emoji, total), percent)
+            if not sheet.rows:
+                continue
+            chart = workbook.add_chart({"type": "column"})
+            chart.add_series({
+                "name": "이모지 포함 글 개수",
+                "categories": [name, 1, 0, len(sheet.rows), 0],
+                "values": [name, 1, 1, len(sheet.rows), 1],
+            })
+            chart.set_title({"name": f"{sheet.job_name} 날짜별 이모지 포함 글 개수"})
+            chart.set_x_axis({"name": "날짜"})
+            chart.set_y_axis({"name": "이모지 포함 글 개수"})
+            chart.set_legend({"none": True})
+            worksheet.insert_chart("F2", chart)
+    finally:
+        workbook.close()
+    return file_name
+
+
+def _table_rows(sheets):
+    for sheet in sheets:
+        for date, emoji, total in sheet.rows:
+            yield sheet.job_name, date, emoji, total, _ratio(emoji, total)
+
+
+def write_table(sheets, file_name, file_format):
+    # 직업, 날짜마다 한 줄인 긴 표 (pandas, R, 스프레드시트에서 바로 불러올 수 있게)
+    header = ("직업",) + COLUMNS
+    if file_format == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet로 저장하려면 pyarrow를 설치하세요: pip install pyarrow")
+        types = (pa.string(), pa.string(), pa.int64(), pa.int64(), pa.float64())
+        columns = list(zip(*_table_rows(sheets))) or [()] * len(header)
+        table = pa.Table.from_arrays([pa.array(column, type=kind) for column, kind in zip(columns, types)],
+                                     names=list(header))
+        pq.write_table(table, file_name)
+    else:
+        # 엑셀에서 한글이 깨지지 않도록 BOM을 붙여서 저장
+        with open(file_name, "w", encoding="utf-8-sig", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            writer.writerows(_table_rows(sheets))
+    return file_name
+
+
+def build_report(results, output_path, formats=("xlsx",), boards=None, since=None, marks=None):
+    # output_path: 확장자를 뺀 경로, 형식마다 output_path.형식으로 저장하고 저장한 파일 목록을 돌려줌
+    sheets = prepare_sheets(results, boards, since, marks)
+    files = []
+    for file_format in formats:
+        file_name = f"{output_path}.{file_format}"
+        if file_format == "xlsx":
+            files.append(write_workbook(sheets, file_name))
+        else:
+            files.append(write_table(sheets, file_name, file_format))
+    return files
@@ -0,0 +1,128 @@
+# 크롤링한 게시글을 받는 즉시 파일(CSV, JSONL, Parquet)로 내보내는 모듈
+# 게시글 목록은 메모리에 쌓지 않고, 개수와 날짜별 집계, 최근 이모티콘 글 몇 개만 유지함
+import csv
+import json
+import os
+from collections import Counter, deque
+
+FIELDS = ("board", "page", "num", "title", "author", "date", "emoji")
+FORMATS = ("csv", "jsonl", "parquet")
+PARQUET_BATCH_ROWS = 5000  # Parquet는 이만큼 모아서 한 row group으로 씀
+RECENT_SIZE = 100          # 최근 이모티콘 포함 글을 몇 개까지 기억할지
+
+
+class _CsvWriter:
+    def __init__(self, path):
+        # 엑셀에서 한글이 깨지지 않도록 BOM을 붙여서 저장
+        self.file = open(path, "w", encoding="utf-8-sig", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(FIELDS)
+
+    def write_rows(self, rows):
+        self.writer.writerows(rows)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class _JsonlWriter:
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.file.write(json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False))
+            self.file.write("\n")
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet로 저장하려면 pyarrow를 설치하세요: pip install pyarrow")
+        self.pa = pa
+        self.schema = pa.schema([
+            ("board", pa.string()), ("page", pa.int32()), ("num", pa.int64()), ("title", pa.string()),
+            ("author", pa.string()), ("date", pa.string()), ("emoji", pa.bool_()),
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.batch = []
+
+    def write_rows(self, rows):
+        self.batch.extend(rows)
+        if len(self.batch) >= PARQUET_BATCH_ROWS:
+            self.flush()
+
+    def flush(self):
+        if not self.batch:
+            return
+        columns = list(zip(*self.batch))
+        self.writer.write_table(self.pa.Table.from_arrays(
+            [self.pa.array(column, type=field.type) for column, field in zip(columns, self.schema)],
+            schema=self.schema,
+        ))
+        self.batch = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+_WRITERS = {"csv": _CsvWriter, "jsonl": _JsonlWriter, "parquet": _ParquetWriter}
+
+
+def sink_format(path):
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    if extension not in _WRITERS:
+        raise ValueError(f"지원하지 않는 형식입니다: {path} (csv, jsonl, parquet)")
+    return extension
+
+
+class ResultSink:
+    # with ResultSink("인파이터.csv") as sink: sink.write_rows(board, page, rows)
+    def __init__(self, path, recent_size=RECENT_SIZE):
+        self.path = path
+        self.format = sink_format(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._writer = _WRITERS[self.format](path)
+
+        # 메모리에 남기는 집계 (글 수와 상관없이 크기가 정해져 있음)
+        self.total_count = 0
+        self.emoji_count = 0
+        self.date_counts = Counter()  # 날짜 → 이모티콘 포함 글 수
+        self.recent = deque(maxlen=recent_size)  # 최근 이모티콘 포함 글 (번호, 제목)
+
+    def write_rows(self, board, page, rows):
+        # rows: (번호, 제목, 작성자, 날짜, 이모티콘 여부) 목록
+        records = []
+        for num, title, author, date, emoji in rows:
+            records.append((board, page, int(num), title, author, date, bool(emoji)))
+            self.total_count += 1
+            if emoji:
+                self.emoji_count += 1
+                self.date_counts[date] += 1
+                self.recent.append((num, title))
+        self._writer.write_rows(records)
+
+    def flush(self):
+        self._writer.flush()
+
+    def close(self):
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
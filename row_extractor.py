@@ -0,0 +1,183 @@
+# 게시판 목록 페이지에서 게시글 행만 뽑아내는 모듈
+# selectolax, lxml 중 설치된 빠른 파서를 쓰고, 없으면 BeautifulSoup("html.parser")로 처리
+from collections import namedtuple
+import crawler_settings as settings
+
+# 게시판 한 줄(게시글)의 정보, emoji는 이모티콘 패턴을 검사한 경우에만 채워짐
+BoardRow = namedtuple("BoardRow", ["num", "title", "author", "date", "emoji"], defaults=[False])
+
+BACKENDS = ("selectolax", "lxml", "html.parser")
+
+
+def _has_class(element, name):
+    return name in (element.get("class") or "").split()
+
+
+def _extract_selectolax(html):
+    from selectolax.lexbor import LexborHTMLParser
+
+    table = LexborHTMLParser(html).css_first(".board-list > table")
+    if table is None:
+        return None
+
+    rows = []
+    for row in table.css("tr"):
+        # 번호가 없거나 공지사항인 경우 건너뛰기
+        number_tag = row.css_first("td.num")
+        if number_tag is None:
+            continue
+        post_number = number_tag.text().strip()
+        if "공지" in post_number:
+            continue
+
+        # 제목 추출 (카테고리, 댓글 수 span 제거)
+        title_tag = row.css_first("a.subject-link")
+        if title_tag is None:
+            continue
+        for span in title_tag.css("span"):
+            span.decompose()
+        title_text = title_tag.text(separator="", strip=True)
+
+        author_tag = row.css_first("td.user span.layerNickName")
+        author_name = author_tag.text().strip() if author_tag is not None else "Unknown"
+
+        date_tag = row.css_first("td.date")
+        date_str = date_tag.text().strip() if date_tag is not None else ""
+
+        rows.append(BoardRow(post_number, title_text, author_name, date_str))
+    return rows
+
+
+def _lxml_title(link):
+    # span을 뺀 텍스트 조각을 각각 strip 해서 이어 붙임 (get_text(strip=True)와 같은 결과)
+    parts = []
+
+    def walk(element):
+        if element.text:
+            parts.append(element.text)
+        for child in element:
+            if isinstance(child.tag, str) and child.tag != "span":
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    walk(link)
+    return "".join(part.strip() for part in parts)
+
+
+def _extract_lxml(html):
+    from lxml import html as lxml_html
+
+    document = lxml_html.fromstring(html)
+    tables = document.xpath('//div[contains(concat(" ", normalize-space(@class), " "), " board-list ")]/table')
+    if not tables:
+        return None
+
+    rows = []
+    for row in tables[0].iter("tr"):
+        cells = {}
+        for cell in row.iter("td"):
+            for name in (cell.get("class") or "").split():
+                cells.setdefault(name, cell)
+
+        number_tag = cells.get("num")
+        if number_tag is None:
+            continue
+        post_number = number_tag.text_content().strip()
+        if "공지" in post_number:
+            continue
+
+        title_tag = next((link for link in row.iter("a") if _has_class(link, "subject-link")), None)
+        if title_tag is None:
+            continue
+        title_text = _lxml_title(title_tag)
+
+        author_name = "Unknown"
+        user_tag = cells.get("user")
+        if user_tag is not None:
+            author_tag = next((span for span in user_tag.iter("span") if _has_class(span, "layerNickName")), None)
+            if author_tag is not None:
+                author_name = author_tag.text_content().strip()
+
+        date_tag = cells.get("date")
+        date_str = date_tag.text_content().strip() if date_tag is not None else ""
+
+        rows.append(BoardRow(post_number, title_text, author_name, date_str))
+    return rows
+
+
+def _extract_soup(html):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    # board-list 클래스를 가진 div 내부의 table에서 tr 요소 추출
+    table = soup.select_one(".board-list > table")
+    if not table:
+        return None
+
+    rows = []
+    for row in table.find_all("tr"):
+        # 번호가 없거나 공지사항인 경우 건너뛰기
+        number_tag = row.find("td", class_="num")
+        if not number_tag:
+            continue
+        post_number = number_tag.text.strip()
+        if "공지" in post_number:
+            continue
+
+        # 제목 추출 (카테고리, 댓글 수 span 제거)
+        title_tag = row.find("a", class_="subject-link")
+        if not title_tag:
+            continue
+        for span in title_tag.find_all("span"):
+            span.decompose()
+        title_text = title_tag.get_text(strip=True)
+
+        # 작성자 추출
+        author_name = "Unknown"
+        user_tag = row.find("td", class_="user")
+        if user_tag:
+            author_tag = user_tag.find("span", class_="layerNickName")
+            if author_tag:
+                author_name = author_tag.text.strip()
+
+        date_tag = row.find("td", class_="date")
+        date_str = date_tag.text.strip() if date_tag else ""
+
+        rows.append(BoardRow(post_number, title_text, author_name, date_str))
+    return rows
+
+
+_EXTRACTORS = {
+    "selectolax": (_extract_selectolax, "selectolax.lexbor"),
+    "lxml": (_extract_lxml, "lxml.html"),
+    "html.parser": (_extract_soup, "bs4"),
+}
+_available = {}
+
+
+def is_available(backend):
+    if backend not in _available:
+        try:
+            __import__(_EXTRACTORS[backend][1])
+            _available[backend] = True
+        except ImportError:
+            _available[backend] = False
+    return _available[backend]
+
+
+def available_backends():
+    return [backend for backend in BACKENDS if is_available(backend)]
+
+
+def default_backend():
+    # 설정에 지정한 파서가 없으면 설치된 것 중 가장 빠른 파서를 씀
+    if settings.PARSER_BACKEND and is_available(settings.PARSER_BACKEND):
+        return settings.PARSER_BACKEND
+    return available_backends()[0]
+
+
+def extract_rows(html, backend=None):
+    # 게시판 표가 없으면 None, 있으면 BoardRow 목록
+    extractor = _EXTRACTORS[backend or default_backend()][0]
+    return extractor(html)
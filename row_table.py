@@ -0,0 +1,134 @@
+# 크롤링한 글을 열(column)별 배열로 모아 두는 표
+# 글마다 객체를 만들지 않고 array에 숫자로 저장함
+#   날짜 → 날짜 순번(date.toordinal()), 게시판과 작성자 → 처음 나온 순서대로 붙인 번호
+# 날짜별, 게시판별 집계는 행이 많으면 numpy로 한 번에 계산함 (numpy가 없으면 Counter)
+from array import array
+from collections import Counter
+from datetime import date
+from functools import lru_cache
+from itertools import compress
+
+# 이보다 적은 행은 numpy를 불러오지 않고 Counter로 셈 (페이지 하나는 50행 정도)
+NUMPY_MIN_ROWS = 5000
+
+
+@lru_cache(maxsize=None)
+def day_key(day):
+    # 날짜 순번 → "YYYY-MM-DD" (같은 날짜는 한 번만 변환)
+    return date.fromordinal(day).isoformat()
+
+
+@lru_cache(maxsize=None)
+def day_ordinal(date_key):
+    # "YYYY-MM-DD" → 날짜 순번
+    return date.fromisoformat(date_key).toordinal()
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class RowTable:
+    __slots__ = ("numbers", "days", "boards", "authors", "emoji", "titles",
+                 "board_names", "board_ids", "author_names", "author_ids")
+
+    def __init__(self):
+        self.numbers = array("q")   # 글 번호 (없으면 0)
+        self.days = array("i")      # 날짜 순번
+        self.boards = array("i")    # board_names의 번호
+        self.authors = array("i")   # author_names의 번호
+        self.emoji = array("b")     # 이모티콘 포함 여부 (0/1)
+        self.titles = []
+        self.board_names = []
+        self.board_ids = {}
+        self.author_names = []
+        self.author_ids = {}
+
+    def __len__(self):
+        return len(self.days)
+
+    def _intern(self, names, ids, name):
+        index = ids.get(name)
+        if index is None:
+            index = ids[name] = len(names)
+            names.append(name)
+        return index
+
+    def append(self, board, number, title, author, day, emoji):
+        self.numbers.append(number)
+        self.days.append(day)
+        self.boards.append(self._intern(self.board_names, self.board_ids, board))
+        self.authors.append(self._intern(self.author_names, self.author_ids, author))
+        self.emoji.append(1 if emoji else 0)
+        self.titles.append(title)
+
+    def records(self, start=0, stop=None):
+        # (게시판, 글 번호, 제목, 작성자, "YYYY-MM-DD", 이모티콘 포함 여부) 행으로 (저장소와 내보내기용)
+        stop = len(self) if stop is None else stop
+        for index in range(start, stop):
+            yield (self.board_names[self.boards[index]], self.numbers[index], self.titles[index],
+                   self.author_names[self.authors[index]], day_key(self.days[index]), bool(self.emoji[index]))
+
+    def _mask(self, start, stop, board, emoji_only):
+        # start:stop 중 조건에 맞는 행 (True/False 목록)
+        boards = self.boards[start:stop]
+        board_id = self.board_ids.get(board, -1) if board is not None else None
+        if board_id is None and not emoji_only:
+            return None
+        emoji = self.emoji[start:stop]
+        if board_id is None:
+            return emoji
+        if not emoji_only:
+            return [value == board_id for value in boards]
+        return [value == board_id and flag for value, flag in zip(boards, emoji)]
+
+    def _day_counts(self, start, stop, board, emoji_only):
+        # 날짜 순번 → 행 수
+        stop = len(self) if stop is None else stop
+        numpy = _numpy() if stop - start >= NUMPY_MIN_ROWS else None
+        if numpy is None:
+            days = self.days[start:stop]
+            mask = self._mask(start, stop, board, emoji_only)
+            return Counter(days if mask is None else compress(days, mask))
+
+        # array를 복사하지 않고 numpy 배열로 봄 (배열은 이 함수 안에서만 써서 array가 계속 늘어날 수 있음)
+        days = numpy.frombuffer(self.days, dtype=numpy.int32)[start:stop]
+        selected = numpy.ones(len(days), dtype=bool)
+        if emoji_only:
+            selected &= numpy.frombuffer(self.emoji, dtype=numpy.int8)[start:stop] == 1
+        if board is not None:
+            selected &= numpy.frombuffer(self.boards, dtype=numpy.int32)[start:stop] == self.board_ids.get(board, -1)
+        values, counts = numpy.unique(days[selected], return_counts=True)
+        return dict(zip(values.tolist(), counts.tolist()))
+
+    def date_counts(self, start=0, stop=None, board=None, emoji_only=True):
+        # "YYYY-MM-DD" → 글 수, 최신 날짜부터 (board를 주면 그 게시판만)
+        counts = self._day_counts(start, stop, board, emoji_only)
+        return {day_key(day): counts[day] for day in sorted(counts, reverse=True)}
+
+    def board_date_counts(self, emoji_only=True):
+        # 게시판 → {"YYYY-MM-DD": 글 수}
+        result = {}
+        for board in self.board_names:
+            counts = self.date_counts(board=board, emoji_only=emoji_only)
+            if counts:
+                result[board] = counts
+        return result
+
+    def date_frame(self, board=None):
+        # 날짜별 (전체 글 수, 이모티콘 포함 글 수, 비율) 데이터프레임, 최신 날짜부터
+        import pandas as pd  # 저장할 때만 필요
+
+        totals = self.date_counts(board=board, emoji_only=False)
+        emoji = self.date_counts(board=board)
+        df = pd.DataFrame({
+            "날짜": list(totals),
+            "전체 글 개수": list(totals.values()),
+            "이모지 포함 글 개수": [emoji.get(date_key, 0) for date_key in totals],
+        })
+        df["이모지 비율"] = (df["이모지 포함 글 개수"] / df["전체 글 개수"]).round(4)
+        return df
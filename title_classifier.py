@@ -0,0 +1,102 @@
+# 게시글 제목을 여러 분류(이모티콘, 불만, 긍정 등)로 한 번에 세는 모듈
+# 분류마다 제목을 따로 검사하지 않고, 제목 묶음을 이어 붙인 문자열을 한 번만 훑어서
+# 모든 분류의 키워드를 같이 찾음 (pyahocorasick이 있으면 Aho-Corasick 오토마톤, 없으면 정규식 하나)
+# 분류가 늘어도 제목을 훑는 횟수는 그대로임
+import re
+from bisect import bisect_right
+from collections import Counter
+import crawler_settings as settings
+
+SEPARATOR = "\n"  # 제목 사이에 넣는 문자 (제목에는 줄바꿈이 없음)
+
+
+def _load_ahocorasick():
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    return ahocorasick
+
+
+class TitleClassifier:
+    # categories: 분류 이름 → 키워드 목록 또는 정규식 문자열
+    # 키워드는 겹치지 않게 가장 긴 것부터 맞추고, 여러 분류에 같은 키워드가 있으면 앞에 적은 분류로 셈
+    # 정규식 분류는 키워드로 표현할 수 없는 경우에만 쓰고, 분류마다 한 번씩 따로 훑음
+    def __init__(self, categories=None, backend=None):
+        categories = settings.TITLE_CATEGORIES if categories is None else categories
+        self.names = list(categories)
+        self.totals = Counter()  # 분류 이름 → 지금까지 add_titles로 넣은 제목 중 해당하는 제목 수
+
+        self.keyword_columns = {}  # 키워드 → 열 번호
+        self.regex_columns = []    # (열 번호, 컴파일한 정규식)
+        for column, rule in enumerate(categories.values()):
+            if isinstance(rule, str):
+                self.regex_columns.append((column, re.compile(rule)))
+                continue
+            for keyword in rule:
+                self.keyword_columns.setdefault(keyword, column)
+
+        ahocorasick = _load_ahocorasick() if backend in (None, "ahocorasick") else None
+        if backend == "ahocorasick" and ahocorasick is None:
+            raise ImportError("pyahocorasick이 설치되어 있지 않습니다: pip install pyahocorasick")
+        self.backend = "ahocorasick" if ahocorasick else "re"
+
+        if ahocorasick:
+            # 구분 문자도 키워드로 넣어서 몇 번째 제목인지 따로 계산하지 않게 함
+            self.automaton = ahocorasick.Automaton()
+            for keyword, column in self.keyword_columns.items():
+                self.automaton.add_word(keyword, column)
+            self.automaton.add_word(SEPARATOR, -1)
+            self.automaton.make_automaton()
+        elif self.keyword_columns:
+            keywords = sorted(self.keyword_columns, key=len, reverse=True)
+            self.keyword_pattern = re.compile("|".join(re.escape(keyword) for keyword in keywords))
+        else:
+            self.keyword_pattern = None
+
+    def _matches(self, titles):
+        # 제목 묶음을 한 번 훑으면서 (제목 번호, 열 번호)를 찾은 순서대로 돌려줌
+        titles = [title.replace(SEPARATOR, " ") for title in titles]
+        text = SEPARATOR.join(titles)
+
+        if self.backend == "ahocorasick":
+            row = 0
+            for _, column in self.automaton.iter_long(text):
+                if column < 0:
+                    row += 1
+                else:
+                    yield row, column
+            if not self.regex_columns:
+                return
+
+        # 각 제목이 이어 붙인 문자열의 어디서 시작하는지 (정규식으로 찾은 위치 → 제목 번호)
+        starts = []
+        position = 0
+        for title in titles:
+            starts.append(position)
+            position += len(title) + len(SEPARATOR)
+
+        if self.backend == "re" and self.keyword_pattern is not None:
+            for match in self.keyword_pattern.finditer(text):
+                yield bisect_right(starts, match.start()) - 1, self.keyword_columns[match.group()]
+        for column, pattern in self.regex_columns:
+            for match in pattern.finditer(text):
+                yield bisect_right(starts, match.start()) - 1, column
+
+    def matrix(self, titles):
+        # 제목마다 [분류별 일치 횟수] 목록 (행: 제목, 열: self.names 순서)
+        counts = [[0] * len(self.names) for _ in titles]
+        for row, column in self._matches(titles):
+            counts[row][column] += 1
+        return counts
+
+    def title_counts(self, titles):
+        # 분류 이름 → 그 분류에 해당하는 제목 수
+        columns = Counter(column for _, column in set(self._matches(titles)))
+        return {name: columns[column] for column, name in enumerate(self.names)}
+
+    def add_titles(self, titles):
+        # 크롤링하면서 페이지마다 넣으면 totals에 누적됨
+        counts = self.title_counts(titles)
+        self.totals.update(counts)
+        return counts
@@ -1,18 +1,43 @@
+import os
 import sys
-import requests
-from bs4 import BeautifulSoup
-import re
-import pandas as pd
-import xlsxwriter
-from datetime import datetime
+import time
+import multiprocessing
 from collections import defaultdict
-from PySide6.QtWidgets import QApplication, QWidget, QFileDialog
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import QApplication, QPushButton, QSplitter, QWidget, QFileDialog
 from lostark_class_data_ui import Ui_Form
+import crawl_metrics
+import crawler_core
+import crawler_settings as settings
+from crawler_core import SWEEP_KEYWORD
+from crawl_worker import CrawlController
+
+try:
+    from live_chart import DateBarChart
+except ImportError:
+    # QtCharts가 없는 PySide6 설치에서는 그래프 없이 실행
+    DateBarChart = None
+
+MAX_LOG_LINES = 1000  # 로그 창에는 최근 줄만 남김
 
 class MainWindow(QWidget, Ui_Form):
     def __init__(self):
         super().__init__()
         self.setupUi(self)
+        self.textBrowser.document().setMaximumBlockCount(MAX_LOG_LINES)
+        self.emoji_date_stats = defaultdict(int)
+        self.job_stats = {}  # 직업별 날짜 통계
+        self.sweep_results = None  # 마지막 전체 직업 크롤링 결과
+        self.sweep_since = None    # 그 크롤링의 시작 날짜 (저장할 때 날짜별 전체 글 수를 가져옴)
+
+        # 크롤링은 별도 스레드에서 실행하고 결과는 시그널로 받음
+        self.crawler = CrawlController(self.crawl_job, self)
+        self.crawler.message.connect(self.append_log)
+        self.crawler.page_done.connect(self.on_page_done)
+        self.crawler.dates_done.connect(self.on_dates_done)
+        self.crawler.job_done.connect(self.on_job_done)
+        self.crawler.error.connect(self.on_job_error)
+        self.crawler.idle.connect(self.on_crawl_idle)
 
         # 버튼 연결
         self.start_btn.clicked.connect(self.start)
@@ -20,27 +45,123 @@ class MainWindow(QWidget, Ui_Form):
         self.save_btn.clicked.connect(self.save)
         self.quit_btn.clicked.connect(self.quit)
 
+        # 일시정지 버튼 (생성된 UI 파일은 건드리지 않고 버튼 목록에 추가)
+        self.pause_btn = QPushButton("일시정지", self)
+        self.pause_btn.setCheckable(True)
+        self.pause_btn.setSizePolicy(self.reset_btn.sizePolicy())
+        self.verticalLayout.insertWidget(2, self.pause_btn)
+        self.pause_btn.toggled.connect(self.toggle_pause)
+
+        # 날짜별 이모티콘 포함 글 수 그래프 (로그 창 아래, 경계를 끌어서 크기 조절)
+        self.chart = None
+        if DateBarChart is not None:
+            self.chart = DateBarChart(self)
+            splitter = QSplitter(Qt.Orientation.Vertical, self)
+            self.horizontalLayout.replaceWidget(self.textBrowser, splitter)
+            splitter.addWidget(self.textBrowser)
+            splitter.addWidget(self.chart)
+            splitter.setSizes([1, 1])  # 처음에는 반씩
+
     def start(self):
-        job_name = self.keyword.text()
-        input_date = self.date.text()  # yyyy-MM-dd 형식
-        job_board_url = self.get_job_board_url(job_name)
+        # 쉼표로 여러 직업을 입력하면 차례대로 대기열에 추가
+        job_names = [name.strip() for name in self.keyword.text().split(",") if name.strip()]
+        input_date = self.date.date().toString("yyyy-MM-dd")
+        if not job_names:
+            return
 
-        if job_board_url:
-            self.textBrowser.append(f"현재 검색한 직업: {job_name}")
-            emoji_count, total_count, self.emoji_date_stats = self.count_emoji_titles(job_board_url, input_date)
-            self.textBrowser.append(f"전체 글 수: {total_count}")
-            self.textBrowser.append(f"이모티콘 포함 글 수: {emoji_count}")
+        self.crawler.submit([(job_name, input_date) for job_name in job_names])
+        self.textBrowser.append(f"대기열에 추가: {', '.join(job_names)}")
+
+    def crawl_job(self, job_name, input_date, worker):
+        # 워커 스레드에서 실행되므로 위젯에 직접 접근하지 않고 worker를 통해 전달
+        if job_name == SWEEP_KEYWORD:
+            return self.sweep_all_classes(input_date, worker)
+
+        job_board_url = self.get_job_board_url(job_name)
+        if not job_board_url:
+            worker.log(f"해당 직업의 게시판을 찾을 수 없습니다: {job_name}")
+            return None
+
+        worker.log(f"현재 검색한 직업: {job_name}")
+        return self.count_emoji_titles(job_board_url, input_date, worker)
+
+    def sweep_all_classes(self, input_date, worker):
+        self.sweep_since = input_date
+        return crawler_core.sweep_by_date(input_date, worker)
+
+    def on_page_done(self, job_name, page, emoji_count, total_count):
+        self.setWindowTitle(f"{job_name} {page} 페이지 | 이모티콘 포함 글 {emoji_count} / 전체 글 {total_count}")
+
+    def on_dates_done(self, job_name, date_counts):
+        # 페이지마다 막대를 더하거나 늘리기만 함 (다른 직업이 시작되면 새로 그림)
+        if self.chart is None:
+            return
+        if self.chart.job_name != job_name:
+            self.chart.clear(job_name)
+        self.chart.add_counts(date_counts)
+
+    def on_job_done(self, job_name, result):
+        if result is None:
+            return
+        if job_name == SWEEP_KEYWORD:
+            # 직업별 결과를 하나씩 처리하고 전체 표는 따로 보관
+            self.sweep_results = result
+            for class_name, class_result in result.items():
+                self.on_job_done(class_name, class_result)
+            return
+        emoji_count, total_count, self.emoji_date_stats = result
+        self.job_stats[job_name] = self.emoji_date_stats
+        if self.chart is not None and self.chart.job_name == job_name:
+            # 이전 크롤링에서 저장한 글까지 포함한 최종 통계로 맞춤
+            self.chart.set_counts(self.emoji_date_stats)
+        self.textBrowser.append(f"[{job_name}] 전체 글 수: {total_count}")
+        self.textBrowser.append(f"[{job_name}] 이모티콘 포함 글 수: {emoji_count}")
+
+    def on_job_error(self, job_name, message):
+        self.textBrowser.append(f"[{job_name}] 크롤링 중 오류가 발생했습니다: {message}")
+
+    def on_crawl_idle(self):
+        self.textBrowser.append("크롤링이 끝났습니다.")
+        if settings.METRICS_ENABLED:
+            # 단계별 시간을 저장하고 다음 크롤링은 새로 셈
+            self.textBrowser.append(f"측정 결과 저장: {crawl_metrics.save_summary()}")
+            crawl_metrics.reset()
+
+    def append_log(self, text):
+        # 로그 창 출력도 크롤링 단계처럼 시간을 잼 (줄이 많으면 UI 스레드가 밀림)
+        with crawl_metrics.timed("ui_log"):
+            self.textBrowser.append(text)
+
+    def toggle_pause(self, paused):
+        if paused:
+            self.crawler.pause()
+            self.textBrowser.append("크롤링을 일시정지했습니다. (진행 중인 요청은 마저 받음)")
         else:
-            self.textBrowser.append("해당 직업의 게시판을 찾을 수 없습니다.")
+            self.crawler.resume()
+            self.textBrowser.append("크롤링을 다시 시작합니다.")
 
     def reset(self):
+        # 진행 중인 크롤링과 대기열을 취소
+        self.crawler.cancel()
+        self.pause_btn.setChecked(False)
         self.keyword.clear()
         self.date.clear()
         self.textBrowser.clear()
+        # 초기화한 뒤 저장하면 이전 크롤링 결과가 저장되지 않도록 결과도 지움
+        self.emoji_date_stats = defaultdict(int)
+        self.job_stats = {}
+        self.sweep_results = None
+        self.sweep_since = None
+        if self.chart is not None:
+            self.chart.clear()
 
     def save(self):
-        job_name = self.keyword.text().strip()  
-        self.save_statistics_as_excel(job_name)
+        # 전체 직업 결과는 직업별 시트가 있는 파일 하나로 저장하고, 직업마다 따로 저장하지 않음
+        if self.sweep_results:
+            self.save_sweep_as_excel(self.sweep_results)
+        for job_name, emoji_date_stats in self.job_stats.items():
+            if not self.sweep_results or job_name not in self.sweep_results:
+                self.save_statistics_as_excel(job_name, emoji_date_stats)
         
         # 기본 파일명 생성
         # default_filename = f"{job_name}_{input_date}_emoji_stats.txt"
@@ -53,113 +174,46 @@ class MainWindow(QWidget, Ui_Form):
         #     self.textBrowser.append(f"파일이 {save_path}에 저장되었습니다.")
 
     def quit(self):
+        self.crawler.shutdown()
         QApplication.quit()
 
+    def closeEvent(self, event):
+        self.crawler.shutdown()
+        super().closeEvent(event)
+
     def get_job_board_url(self, job_name):
-        main_url = "https://lostark.inven.co.kr/"
-        target_base_url = "https://www.inven.co.kr"
-
-        response = requests.get(main_url)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        job_link = None
-        links = soup.find_all("a", href=True)
-        for link in links:
-            if job_name in link.text:
-                job_link = link.get("href")
-                break
-
-        if job_link:
-            if not job_link.startswith("http"):
-                return target_base_url + job_link
-            return job_link
-        return None
-
-    def count_emoji_titles(self, job_board_url, input_date):
-        emoji_pattern = re.compile(r'[●▅]')  
-        emoji_count = 0
-        total_count = 0
-        self.emoji_date_stats = defaultdict(int)  
-
-        input_date_obj = datetime.strptime(input_date, "%Y-%m-%d")
-        page = 1
-        while True:
-            self.textBrowser.append(f"{page} 페이지 크롤링 중")
-            page_url = f"{job_board_url}?p={page}"
-            response = requests.get(page_url)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            # board-list 클래스를 가진 div 내부의 table에서 tr 요소 추출
-            table = soup.select_one(".board-list > table")
-            if not table:
-                self.textBrowser.append("게시판 데이터를 찾을 수 없습니다.")
-                break
-            rows = table.find_all("tr")
-
-            for row in rows:
-                # 공지사항인 경우 건너뛰기
-                notice_tag = row.find("td", class_="num")
-                if notice_tag and "공지" in notice_tag.text:
-                    continue
-
-                date_tag = row.find("td", class_="date")
-                if date_tag:
-                    date_str = date_tag.text.strip()
-                    try:
-                        if ":" in date_str:
-                            date_obj = datetime.today()
-                        else:
-                            date_obj = datetime.strptime(date_str, "%m-%d")
-                            date_obj = date_obj.replace(year=datetime.today().year)
-
-                        if date_obj < input_date_obj:
-                            return emoji_count, total_count, self.emoji_date_stats
-
-                        title_tag = row.find("a", class_="subject-link")
-                        if title_tag:
-                            total_count += 1
-                            if emoji_pattern.search(title_tag.text):
-                                self.emoji_date_stats[date_obj.strftime("%Y-%m-%d")] += 1
-                                emoji_count += 1
-                    except ValueError:
-                        continue
-
-            page += 1
-    
-    def save_statistics_as_excel(self, job_name):
-        # 날짜별 이모지 포함 글 개수를 데이터프레임으로 생성
-        data = {
-            "날짜": list(self.emoji_date_stats.keys()),
-            "이모지 포함 글 개수": list(self.emoji_date_stats.values())
-        }
-        df = pd.DataFrame(data)
-        
-        # 현재 날짜와 직업 이름을 포함한 파일명 생성
-        today_date = datetime.today().strftime("%Y%m%d")
-        file_name = f"{job_name}_이모지_통계_{today_date}.xlsx"
-        
-        # 엑셀 파일로 저장
-        with pd.ExcelWriter(file_name, engine="xlsxwriter") as writer:
-            df.to_excel(writer, index=False, sheet_name="통계")
-            worksheet = writer.sheets["통계"]
-            
-            # 차트 추가
-            chart = writer.book.add_chart({"type": "column"})
-            chart.add_series({
-                "name": "이모지 포함 글 개수",
-                "categories": "=통계!A2:A{}".format(len(self.emoji_date_stats) + 1),
-                "values": "=통계!B2:B{}".format(len(self.emoji_date_stats) + 1),
-            })
-            chart.set_title({"name": "날짜별 이모지 포함 글 개수 통계"})
-            chart.set_x_axis({"name": "날짜"})
-            chart.set_y_axis({"name": "이모지 포함 글 개수"})
-            
-            worksheet.insert_chart("D2", chart)
-        
+        return crawler_core.get_job_board_url(job_name)
+
+    def count_emoji_titles(self, job_board_url, input_date, worker):
+        # 크롤링과 통계는 crawler_core에서 처리 (명령줄 도구와 같은 코드)
+        try:
+            return crawler_core.crawl_by_date(job_board_url, input_date, worker)
+        except crawler_core.IncompleteCrawlError as e:
+            # 받지 못한 페이지가 있으면 로그에 알리고 받은 페이지까지의 결과를 보여줌
+            worker.log(str(e))
+            return e.result
+
+    def save_statistics_as_excel(self, job_name, emoji_date_stats):
+        file_name = crawler_core.save_statistics_as_excel(job_name, emoji_date_stats)
         self.textBrowser.append(f"엑셀 파일로 저장되었습니다: {file_name}")
-app = QApplication(sys.argv)
-window = MainWindow()
-window.show()
-sys.exit(app.exec())
+
+    def save_sweep_as_excel(self, results):
+        file_name = crawler_core.save_sweep_as_excel(results, since=self.sweep_since)
+        self.textBrowser.append(f"엑셀 파일로 저장되었습니다: {file_name}")
+
+def report_startup(app, path):
+    # bench_startup.py가 창이 뜨는 데 걸린 시간을 잴 때: 창을 그린 시각을 기록하고 바로 종료
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(repr(time.time()))
+    app.quit()
+
+if __name__ == "__main__":
+    # 파싱 프로세스 풀이 실행 파일(PyInstaller)에서도 동작하도록 설정
+    multiprocessing.freeze_support()
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    startup_file = os.environ.get("CRAWLER_STARTUP_FILE")
+    if startup_file:
+        QTimer.singleShot(0, lambda: report_startup(app, startup_file))
+    sys.exit(app.exec())
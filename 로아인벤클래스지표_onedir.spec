@@ -0,0 +1,77 @@
+# -*- mode: python ; coding: utf-8 -*-
+# 빨리 뜨는 폴더형(onedir) 빌드: pyinstaller 로아인벤클래스지표_onedir.spec
+# 한 파일 빌드(로아인벤클래스지표.spec)는 실행할 때마다 전체를 임시 폴더에 풀지만, 이 빌드는 dist 폴더에서 바로 실행
+# UPX 압축도 실행할 때마다 풀어야 하므로 쓰지 않음
+
+
+# 앱에서 쓰지 않는 Qt 모듈과 라이브러리 (QtCore, QtGui, QtWidgets, QtCharts만 씀)
+excludes = [
+    'PySide6.QtNetwork',
+    'PySide6.QtQml',
+    'PySide6.QtQuick',
+    'PySide6.QtQuickWidgets',
+    'PySide6.QtWebEngineCore',
+    'PySide6.QtWebEngineWidgets',
+    'PySide6.QtWebChannel',
+    'PySide6.QtMultimedia',
+    'PySide6.QtMultimediaWidgets',
+    'PySide6.QtPdf',
+    'PySide6.QtSql',
+    'PySide6.QtSvg',
+    'PySide6.QtDataVisualization',
+    'PySide6.Qt3DCore',
+    'PySide6.QtBluetooth',
+    'PySide6.QtPositioning',
+    'tkinter',
+    'matplotlib',
+    'IPython',
+    'jupyter_client',
+    'notebook',
+    'scipy',
+    'PIL',
+    'pytest',
+    'pyinstrument',
+]
+
+a = Analysis(
+    ['로아인벤클래스지표.py'],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    # pandas가 engine="xlsxwriter" 문자열로 불러오므로 자동으로 찾지 못함
+    hiddenimports=['xlsxwriter'],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=excludes,
+    noarchive=False,
+    optimize=0,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='로아인벤클래스지표',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='로아인벤클래스지표',
+)
@@ -1,139 +1,141 @@
 import sys
-import requests
-from bs4 import BeautifulSoup
-import re
-from PySide6.QtWidgets import QApplication, QWidget
+import multiprocessing
+from PySide6.QtWidgets import QApplication, QPushButton, QWidget
 from lostark_class_ui import Ui_Form
+import crawl_metrics
+import crawler_core
+import crawler_settings as settings
+from crawl_worker import CrawlController
+from title_classifier import TitleClassifier
+
+MAX_LOG_LINES = 1000  # 로그 창에는 최근 줄만 남김 (전체 게시글은 파일로 내보냄)
 
 class MainWindow(QWidget, Ui_Form):
     def __init__(self):
         super().__init__() 
         self.setupUi(self) 
+        self.textBrowser.document().setMaximumBlockCount(MAX_LOG_LINES)
+        self.job_results = []  # 직업별 결과 요약 (저장 버튼으로 파일에 씀)
+
+        # 크롤링은 별도 스레드에서 실행하고 결과는 시그널로 받음
+        self.crawler = CrawlController(self.crawl_job, self)
+        self.crawler.message.connect(self.append_log)
+        self.crawler.job_done.connect(self.on_job_done)
+        self.crawler.error.connect(self.on_job_error)
+        self.crawler.idle.connect(self.on_crawl_idle)
 
         # 버튼 연결
         self.start_btn.clicked.connect(self.start)
         self.reset_btn.clicked.connect(self.reset)
         self.save_btn.clicked.connect(self.save)
         self.quit_btn.clicked.connect(self.quit)
+
+        # 일시정지 버튼 (생성된 UI 파일은 건드리지 않고 버튼 목록에 추가)
+        self.pause_btn = QPushButton("일시정지", self)
+        self.pause_btn.setCheckable(True)
+        self.pause_btn.setSizePolicy(self.reset_btn.sizePolicy())
+        self.verticalLayout.insertWidget(2, self.pause_btn)
+        self.pause_btn.toggled.connect(self.toggle_pause)
         
     def get_job_board_url(self, job_name):
-        main_url = "https://lostark.inven.co.kr/"
-        target_base_url = "https://www.inven.co.kr"  # 링크의 베이스 URL
-        
-        # 메인 페이지에서 게시판 목록 페이지로 이동
-        response = requests.get(main_url)
-        response.raise_for_status()  # 요청 에러 확인
-        
-        # HTML 파싱
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        # 입력받은 직업 이름으로 링크 검색
-        job_link = None
-        links = soup.find_all("a", href=True)
-        for link in links:
-            if job_name in link.text:
-                job_link = link.get("href")
-                break
-        
-        if job_link:
-            # 링크가 절대 경로인지 확인하고, 상대 경로인 경우에만 base URL 추가
-            if not job_link.startswith("http"):
-                full_url = target_base_url + job_link
-            else:
-                full_url = job_link
-            return full_url
-        else:
-            return None
+        return crawler_core.get_job_board_url(job_name)
 
-    def count_emoji_titles(self, job_board_url, num_pages):
-        emoji_pattern = re.compile(r'[▅▇█]')  # 이모티콘 패턴 정의
-        emoji_count = 0
-        total_count = 0  # 전체 글 개수 초기화
-        
-        for page in range(1, num_pages + 1):
-            # 각 페이지의 URL 구성
-            self.textBrowser.append(f"-----{page} 페이지 크롤링 중 -----")
-            page_url = f"{job_board_url}?p={page}"
-            response = requests.get(page_url)
-            response.raise_for_status()  # 요청 에러 확인
-            
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # 게시판 글 목록의 각 행을 추출
-            rows = soup.find_all("tr", class_="")  # 게시글 행 선택
-            
-            # 각 행에서 번호, 제목, 작성자, 이모티콘 포함 여부 확인
-            for row in rows:
-                # 번호 추출
-                number_tag = row.find("td", class_="num")
-                if number_tag and number_tag.span:
-                    post_number = number_tag.span.text.strip()
-                else:
-                    continue  # 번호가 없으면 다음 글로 이동
-
-                # 제목 추출
-                title_tag = row.find("a", class_="subject-link")
-                if title_tag:
-                    for span in title_tag.find_all("span"):
-                        span.decompose()  # span 태그 제거
-                    title_text = title_tag.get_text(strip=True)  # 텍스트만 추출
-                else:
-                    continue  # 제목이 없으면 다음 글로 이동
-
-                # 작성자 추출
-                author_tag = row.find("td", class_="user").find("span", class_="layerNickName")
-                author_name = author_tag.text.strip() if author_tag else "Unknown"
-
-                # 전체 글 개수 증가
-                total_count += 1
-
-                # 이모티콘이 포함된 제목인지 확인
-                if emoji_pattern.search(title_text):
-                    self.textBrowser.append(f"글 번호: {post_number} | 작성자: {author_name}\n제목: {title_text}")
-                    emoji_count += 1
-            self.textBrowser.append("\n")
-        
-        # 최종 크롤링 결과 출력
-        self.textBrowser.append("========== 크롤링 완료 ==========")
-        self.textBrowser.append(f"이모티콘 포함 글 개수: {emoji_count}, 전체 글 개수: {total_count}")
-        return emoji_count, total_count
+    def count_emoji_titles(self, job_board_url, num_pages, worker, sink=None):
+        # 크롤링과 저장은 crawler_core에서 처리 (명령줄 도구와 같은 코드)
+        try:
+            return crawler_core.crawl_by_pages(job_board_url, num_pages, worker, sink=sink, classifier=TitleClassifier())
+        except crawler_core.IncompleteCrawlError as e:
+            # 받지 못한 페이지가 있으면 로그에 알리고 받은 페이지까지의 결과를 보여줌
+            worker.log(str(e))
+            return e.result
 
 
     def start(self):
-        # 사용자 입력값 가져오기
-        input_keyword = self.keyword.text()
+        # 사용자 입력값 가져오기 (쉼표로 여러 직업을 입력하면 차례대로 크롤링)
+        input_keywords = [name.strip() for name in self.keyword.text().split(",") if name.strip()]
         input_page = int(self.page.text())
         
+        # 크롤링 대기열에 추가
+        self.crawler.submit([(input_keyword, input_page) for input_keyword in input_keywords])
+
+    def crawl_job(self, input_keyword, input_page, worker):
+        # 워커 스레드에서 실행되므로 위젯에 직접 접근하지 않고 worker를 통해 전달
         # 직업 게시판 URL 가져오기
         job_board_url = self.get_job_board_url(input_keyword)
         
         if job_board_url:
-            # 이모티콘이 포함된 글 제목의 개수와 전체 글 개수 확인
-            emoji_title_count, total_title_count = self.count_emoji_titles(job_board_url, input_page)
-            # 결과를 textBrowser에 출력
-            self.textBrowser.append(f"{input_page} 페이지에서 전체 글 제목의 개수: {total_title_count}")
-            self.textBrowser.append(f"{input_page} 페이지에서 이모티콘이 포함된 글 제목의 개수: {emoji_title_count}")
+            # 이모티콘이 포함된 글 제목의 개수와 전체 글 개수 확인 (게시글은 받는 즉시 CSV 파일로 내보냄)
+            with crawler_core.open_result_sink(input_keyword) as sink:
+                counts = self.count_emoji_titles(job_board_url, input_page, worker, sink)
+            return input_page, counts, sink.path
+        worker.log(f"해당 직업의 게시판을 찾을 수 없습니다: {input_keyword}")
+        return None
+
+    def on_job_done(self, input_keyword, result):
+        if result is None:
+            return
+        input_page, (emoji_title_count, total_title_count), export_path = result
+        summary = [
+            f"[{input_keyword}] {input_page} 페이지에서 전체 글 제목의 개수: {total_title_count}",
+            f"[{input_keyword}] {input_page} 페이지에서 이모티콘이 포함된 글 제목의 개수: {emoji_title_count}",
+            f"[{input_keyword}] 게시글 목록: {export_path}",
+        ]
+        self.job_results.extend(summary)
+        # 결과를 textBrowser에 출력
+        for line in summary:
+            self.textBrowser.append(line)
+
+    def on_job_error(self, input_keyword, message):
+        self.textBrowser.append(f"[{input_keyword}] 크롤링 중 오류가 발생했습니다: {message}")
+
+    def on_crawl_idle(self):
+        if settings.METRICS_ENABLED:
+            # 단계별 시간을 저장하고 다음 크롤링은 새로 셈
+            self.textBrowser.append(f"측정 결과 저장: {crawl_metrics.save_summary()}")
+            crawl_metrics.reset()
+
+    def append_log(self, text):
+        # 로그 창 출력도 크롤링 단계처럼 시간을 잼 (줄이 많으면 UI 스레드가 밀림)
+        with crawl_metrics.timed("ui_log"):
+            self.textBrowser.append(text)
+
+    def toggle_pause(self, paused):
+        if paused:
+            self.crawler.pause()
+            self.textBrowser.append("크롤링을 일시정지했습니다. (진행 중인 요청은 마저 받음)")
         else:
-            self.textBrowser.append("해당 직업의 게시판을 찾을 수 없습니다.")
+            self.crawler.resume()
+            self.textBrowser.append("크롤링을 다시 시작합니다.")
 
     def reset(self):
+        # 진행 중인 크롤링과 대기열 취소
+        self.crawler.cancel()
+        self.pause_btn.setChecked(False)
         # 입력 필드 및 텍스트 브라우저 초기화
         self.keyword.clear()
         self.page.clear()
         self.textBrowser.clear()
+        self.job_results.clear()
         
     def save(self):
-        # 현재 textBrowser의 내용을 텍스트 파일로 저장
+        # 직업별 결과 요약을 텍스트 파일로 저장 (게시글 목록은 크롤링하면서 CSV 파일로 저장됨)
         with open("crawl_results.txt", "w", encoding="utf-8") as file:
-            file.write(self.textBrowser.toPlainText())
+            file.write("\n".join(self.job_results))
         self.textBrowser.append("결과가 crawl_results.txt 파일에 저장되었습니다.")
         
     def quit(self):
+        self.crawler.shutdown()
         QApplication.quit()
 
+    def closeEvent(self, event):
+        self.crawler.shutdown()
+        super().closeEvent(event)
+
 # PySide6 애플리케이션 실행
-app = QApplication(sys.argv)
-window = MainWindow()
-window.show()
-sys.exit(app.exec())
+if __name__ == "__main__":
+    # 파싱 프로세스 풀이 실행 파일(PyInstaller)에서도 동작하도록 설정
+    multiprocessing.freeze_support()
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec())